@@ -0,0 +1 @@
+"""Throughput and memory benchmarks of pandantic, see `python -m benchmarks.run --help`."""
@@ -0,0 +1,71 @@
+"""Measure the import time of pandantic, using `python -X importtime`.
+
+Every measurement imports pandantic in a fresh interpreter, and reports the cumulative import time
+of each module imported along the way. Command line jobs and serverless handlers pay this price on
+every start, so `import pandantic` should not import pandas, NumPy or any other backend; these are
+only imported once they are used.
+
+Examples:
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime "from pandantic import Pandantic"
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import Optional
+
+
+# the statements measured by default
+STATEMENTS = ["import pandantic", "from pandantic import Pandantic, Optional"]
+# modules that are only imported on first use
+LAZY_MODULES = ["pandas", "numpy", "multiprocess", "asyncio", "polars", "pyarrow", "dask"]
+
+
+def import_times(statement: str) -> dict[str, float]:
+    """Run the statement in a fresh interpreter and return the cumulative import time (in
+    seconds) of every module it imported.
+
+    Args:
+        statement (str): The python statement to run, e.g. "import pandantic".
+
+    Returns:
+        dict[str, float]: The cumulative import time of each imported module, by name.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            # the header line
+            continue
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("statements", nargs="*", default=STATEMENTS)
+    args = parser.parse_args(argv)
+
+    for statement in args.statements:
+        times = import_times(statement)
+        eager = [module for module in LAZY_MODULES if module in times]
+        print(
+            f"{statement:<45} {times.get('pandantic', 0.0) * 1e3:>8.1f} ms "
+            f"({len(times)} modules{', imports ' + ', '.join(eager) if eager else ''})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
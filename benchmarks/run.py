@@ -0,0 +1,330 @@
+"""Run the benchmarks and compare them with a baseline measured on the same machine.
+
+Every benchmark validates a synthetic DataFrame (see `benchmarks.schemas`) and reports the
+throughput in rows per second (the best of `--repeat` runs) and the peak memory allocated by the
+main process during a separate, traced run (allocations of worker processes are not included).
+
+Examples:
+    python -m benchmarks.run --sizes 1 10000000 --filter titanic
+    python -m benchmarks.run --save baseline.json      # on the base commit
+    python -m benchmarks.run --baseline baseline.json  # on the change, on the same machine
+
+Throughputs are only comparable on the same machine, so no baseline is stored in the repository:
+the CI measures the base commit and the pull request on the same runner, one after the other.
+With `--baseline`, the command exits with status 1 if any benchmark is more than `--threshold`
+slower than its baseline (or allocates that much more memory), so it can gate pull requests.
+
+The benchmarks of a change also run against the sources of its base commit: benchmarks of options
+the installed pandantic does not have are skipped, and every benchmark is stopped after
+`--timeout` seconds (on platforms with SIGALRM), so a broken base commit does not hang the job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import inspect
+import json
+import logging
+import math
+import platform
+import signal
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+import pandantic.plugins.pandas  # noqa: F401 # pylint: disable=unused-import
+from benchmarks.schemas import SCHEMAS, make_frame
+from pandantic import Pandantic
+from pandantic.validators.pandas import PandasValidator
+
+
+DEFAULT_SIZES = [1, 1_000, 100_000]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_TIMEOUT = 300.0
+# benchmarks faster than this are too noisy to compare with their baseline
+MIN_SECONDS = 0.01
+# peak memory below this is too noisy to compare with the baseline
+MIN_MIB = 1.0
+
+
+@dataclass
+class Result:
+    """The measurements of a single benchmark."""
+
+    name: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    peak_mib: float
+
+
+class BenchmarkTimeout(BaseException):
+    """Raised in a benchmark that runs longer than its timeout.
+
+    NOTE: not an Exception, so it is not swallowed by the `except Exception` of the code measured.
+    """
+
+
+@contextlib.contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise a BenchmarkTimeout after `seconds`, if not None and the platform has SIGALRM."""
+    if seconds is None or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def _raise(signum: int, frame: Any) -> None:
+        raise BenchmarkTimeout(f"timed out after {seconds} seconds")
+
+    previous = signal.signal(signal.SIGALRM, _raise)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def supports(**kwargs: Any) -> bool:
+    """Whether the installed pandantic accepts these arguments of `validate`, e.g. when the
+    benchmarks run against the sources of an older commit."""
+    return set(kwargs) <= set(inspect.signature(PandasValidator.validate).parameters)
+
+
+def _consume(iterable: Any) -> None:
+    for _ in iterable:
+        pass
+
+
+def _validate_or_raise(validator: Pandantic, frame: pd.DataFrame, **kwargs: Any) -> None:
+    # raising stops at the first invalid row, so only valid rows are measured in raise mode
+    with contextlib.suppress(Exception):
+        validator.validate(frame, errors="raise", **kwargs)
+
+
+def benchmarks(
+    schema_name: str,
+) -> Iterator[tuple[str, Callable[[pd.DataFrame], Any]]]:
+    """Yield the names and functions of the benchmarks of a schema."""
+    schema, _, context = SCHEMAS[schema_name]
+    validator = Pandantic(schema=schema)
+    kwargs = {"context": context} if context is not None else {}
+    accessor_kwargs = context or {}
+
+    for errors in ("skip", "log"):
+        yield f"validate[errors={errors}]", lambda df, e=errors: validator.validate(
+            df, errors=e, **kwargs
+        )
+    yield "validate[errors=raise]", lambda df: _validate_or_raise(validator, df, **kwargs)
+    for n_jobs in (2, -1):
+        yield f"validate[n_jobs={n_jobs}]", lambda df, n=n_jobs: validator.validate(
+            df, errors="skip", n_jobs=n, **kwargs
+        )
+    if supports(dedupe=True):
+        yield "validate[dedupe]", lambda df: validator.validate(
+            df, errors="skip", dedupe=True, **kwargs
+        )
+    yield "iterate", lambda df: _consume(validator.iterate(df, verbose=False, **kwargs))
+
+    yield "accessor.validate", lambda df: df.pandantic.validate(schema, **accessor_kwargs)
+    yield "accessor.filter", lambda df: df.pandantic.filter(
+        schema, verbose=False, **accessor_kwargs
+    )
+    yield "accessor.itertuples", lambda df: _consume(
+        df.pandantic.itertuples(schema, verbose=False, **accessor_kwargs)
+    )
+    yield "accessor.iterrows", lambda df: _consume(
+        df.pandantic.iterrows(schema, verbose=False, **accessor_kwargs)
+    )
+    yield "accessor.iterschemas", lambda df: _consume(
+        df.pandantic.iterschemas(schema, verbose=False, **accessor_kwargs)
+    )
+
+
+def measure(
+    function: Callable[[pd.DataFrame], Any],
+    frame: pd.DataFrame,
+    repeat: int,
+    timeout: Optional[float] = None,
+) -> tuple[float, float]:
+    """Return the best time (in seconds) of `repeat` runs, and the peak memory (in MiB) of one.
+
+    Raises:
+        BenchmarkTimeout: If the runs take more than `timeout` seconds in total.
+    """
+    seconds = float("inf")
+    with time_limit(timeout):
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            function(frame)
+            seconds = min(seconds, time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function(frame)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return seconds, peak / 2**20
+
+
+def run(
+    sizes: list[int],
+    schema_names: Optional[list[str]] = None,
+    name_filter: Optional[str] = None,
+    repeat: int = 3,
+    invalid_ratio: float = 0.01,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+) -> list[Result]:
+    """Run the benchmarks of the schemas for every size.
+
+    Args:
+        sizes (list[int]): The number of rows of the DataFrames.
+        schema_names (Optional[list[str]], optional): The schemas to run. Defaults to None (all).
+        name_filter (Optional[str], optional): Only run benchmarks whose name contains this string.
+        repeat (int, optional): The number of timed runs per benchmark. Defaults to 3.
+        invalid_ratio (float, optional): The expected share of invalid rows. Defaults to 0.01.
+        timeout (Optional[float], optional): The seconds after which a benchmark is stopped, its
+            result then has an infinite `seconds`. Defaults to `DEFAULT_TIMEOUT`, None for none.
+
+    Returns:
+        list[Result]: The results, in order.
+    """
+    results = []
+    for schema_name in schema_names or list(SCHEMAS):
+        for n_rows in sizes:
+            frame = make_frame(schema_name, n_rows, invalid_ratio=invalid_ratio)
+            for name, function in benchmarks(schema_name):
+                name = f"{schema_name}.{name}"
+                if name_filter and name_filter not in name:
+                    continue
+                try:
+                    seconds, peak_mib = measure(function, frame, repeat=repeat, timeout=timeout)
+                except BenchmarkTimeout as exc:
+                    print(f"{name:<45} {n_rows:>10,} rows {exc}", flush=True)
+                    # kept, so a timeout of the change is reported as a regression
+                    results.append(Result(name, n_rows, float("inf"), 0.0, 0.0))
+                    continue
+                result = Result(
+                    name=name,
+                    rows=n_rows,
+                    seconds=seconds,
+                    rows_per_sec=n_rows / seconds if seconds > 0 else float("inf"),
+                    peak_mib=peak_mib,
+                )
+                print(
+                    f"{result.name:<45} {result.rows:>10,} rows "
+                    f"{result.rows_per_sec:>14,.0f} rows/s {result.peak_mib:>10.1f} MiB",
+                    flush=True,
+                )
+                results.append(result)
+    return results
+
+
+def compare(
+    results: list[Result], baseline: list[dict[str, Any]], threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """Return the descriptions of the benchmarks that are slower than their baseline, or allocate
+    more memory.
+
+    Args:
+        results (list[Result]): The results to check.
+        baseline (list[dict[str, Any]]): The stored results of the baseline.
+        threshold (float, optional): The relative slowdown (or growth of the peak memory) that
+            counts as a regression. Benchmarks that took less than `MIN_SECONDS` (or `MIN_MIB`)
+            in the baseline are not compared.
+
+    Returns:
+        list[str]: A description of every regression, with both throughputs and peak memories.
+    """
+    expected = {(entry["name"], entry["rows"]): entry for entry in baseline}
+    regressions = []
+    for result in results:
+        entry = expected.get((result.name, result.rows))
+        # benchmarks that timed out in the baseline have nothing to compare with
+        if entry is None or math.isinf(entry["seconds"]):
+            continue
+        if math.isinf(result.seconds):
+            regressions.append(
+                f"{result.name} ({result.rows:,} rows): timed out, the baseline "
+                f"{entry['rows_per_sec']:,.0f} rows/s and {entry['peak_mib']:,.1f} MiB"
+            )
+            continue
+        slower = (
+            entry["seconds"] >= MIN_SECONDS
+            and result.rows_per_sec / entry["rows_per_sec"] < 1 - threshold
+        )
+        larger = entry["peak_mib"] >= MIN_MIB and result.peak_mib > entry["peak_mib"] * (
+            1 + threshold
+        )
+        if slower or larger:
+            regressions.append(
+                f"{result.name} ({result.rows:,} rows): {result.rows_per_sec:,.0f} rows/s and "
+                f"{result.peak_mib:,.1f} MiB, the baseline {entry['rows_per_sec']:,.0f} rows/s "
+                f"and {entry['peak_mib']:,.1f} MiB"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--schemas", nargs="+", choices=list(SCHEMAS), default=None)
+    parser.add_argument("--filter", dest="name_filter", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--invalid-ratio", type=float, default=0.01)
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="compare with the results stored by --save"
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds per benchmark"
+    )
+    parser.add_argument("--save", type=Path, default=None, help="store the results as JSON")
+    args = parser.parse_args(argv)
+
+    # the log mode is measured without writing the logs
+    logging.disable(logging.CRITICAL)
+
+    results = run(
+        sizes=args.sizes,
+        schema_names=args.schemas,
+        name_filter=args.name_filter,
+        repeat=args.repeat,
+        invalid_ratio=args.invalid_ratio,
+        timeout=args.timeout,
+    )
+
+    if args.save is not None:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "machine": {"python": sys.version.split()[0], "platform": platform.platform()},
+                    "versions": {"pandas": pd.__version__},
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
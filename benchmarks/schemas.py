@@ -0,0 +1,169 @@
+"""The schemas of the benchmarks, and synthetic DataFrames to validate against them.
+
+The schemas mirror the ones of the tests and examples. Every generated DataFrame is
+deterministic (given the seed) and has `invalid_ratio` of its rows invalid.
+"""
+
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+from pandantic import Optional
+
+
+COUNTRY_LIST = ["USA", "UK", "CANADA"]
+TITANIC_CSV = Path(__file__).parent.parent / "examples" / "titanic.csv"
+
+
+class OptionalSchema(BaseModel):
+    """Plain scalar fields, some of them optional."""
+
+    example_str: str
+    example_int: int
+    example_float: Optional[float] = None
+    example_optional_int: Optional[int] = None
+
+
+class EvenIntSchema(BaseModel):
+    """A custom validator on an int field."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Validate that the int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+class ContextListSchema(BaseModel):
+    """A custom validator checking a str field against a list passed in the context."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_str")
+    def validate_country_in_list(  # pylint: disable=invalid-name, no-self-argument
+        cls, x: str, info: ValidationInfo
+    ) -> str:
+        """Validate that the str is part of the country list of the context."""
+        countries = (info.context or {}).get("countries", COUNTRY_LIST)
+        if x not in countries:
+            raise ValueError(f"example_str must be part of country list, is {x}.")
+        return x
+
+
+class PClass(int, Enum):
+    FIRST = 1
+    SECOND = 2
+    THIRD = 3
+
+
+class Sex(str, Enum):
+    MALE = "male"
+    FEMALE = "female"
+
+
+class Embarked(str, Enum):
+    CHERBOURG = "C"
+    QUEENSTOWN = "Q"
+    SOUTHAMPTON = "S"
+
+
+class TitanicPassenger(BaseModel):
+    """The schema of the titanic example."""
+
+    survival: Optional[bool]
+    pclass: PClass
+    sex: Sex
+    age: int = Field(ge=0, lt=100)
+    sibsp: int = Field(ge=0, lt=10)
+    parch: int = Field(ge=0, lt=10)
+    ticket: str
+    fare: float = Field(ge=0)
+    cabin: Optional[str] = None
+    embarked: Embarked
+
+
+def _invalid_rows(
+    n_rows: int, invalid_ratio: float, rng: np.random.Generator
+) -> np.ndarray:  # type: ignore[type-arg]
+    return rng.random(n_rows) < invalid_ratio
+
+
+def make_optional_frame(
+    n_rows: int, invalid_ratio: float, rng: np.random.Generator
+) -> pd.DataFrame:
+    floats = rng.random(n_rows)
+    floats[rng.random(n_rows) < 0.1] = np.nan
+    optional_ints = pd.Series(rng.integers(0, 1_000, n_rows), dtype=object)
+    optional_ints[rng.random(n_rows) < 0.1] = None
+    strings = rng.choice(["foo", "bar", "baz"], n_rows).astype(object)
+    strings[_invalid_rows(n_rows, invalid_ratio, rng)] = None
+    return pd.DataFrame(
+        {
+            "example_str": strings,
+            "example_int": rng.integers(0, 1_000_000, n_rows),
+            "example_float": floats,
+            "example_optional_int": optional_ints,
+        }
+    )
+
+
+def make_even_int_frame(
+    n_rows: int, invalid_ratio: float, rng: np.random.Generator
+) -> pd.DataFrame:
+    ints = rng.integers(0, 500_000, n_rows) * 2
+    ints[_invalid_rows(n_rows, invalid_ratio, rng)] += 1
+    return pd.DataFrame(
+        {"example_str": rng.choice(["foo", "bar", "baz"], n_rows), "example_int": ints}
+    )
+
+
+def make_context_list_frame(
+    n_rows: int, invalid_ratio: float, rng: np.random.Generator
+) -> pd.DataFrame:
+    strings = rng.choice(COUNTRY_LIST, n_rows).astype(object)
+    strings[_invalid_rows(n_rows, invalid_ratio, rng)] = "NL"
+    return pd.DataFrame({"example_str": strings, "example_int": rng.integers(0, 1_000, n_rows)})
+
+
+def make_titanic_frame(n_rows: int, invalid_ratio: float, rng: np.random.Generator) -> pd.DataFrame:
+    """Resample the (valid) passengers of the titanic example."""
+    passengers = pd.read_csv(TITANIC_CSV).dropna(subset=["age", "embarked"])
+    passengers = passengers.astype({"age": int})
+    frame = passengers.sample(n_rows, replace=True, random_state=rng).reset_index(drop=True)
+    frame.loc[_invalid_rows(n_rows, invalid_ratio, rng), "age"] = -1
+    return frame
+
+
+# name: (schema, frame factory, context)
+SCHEMAS: dict[str, tuple[type[BaseModel], Callable[..., pd.DataFrame], Any]] = {
+    "optional": (OptionalSchema, make_optional_frame, None),
+    "even_int": (EvenIntSchema, make_even_int_frame, None),
+    "context_list": (ContextListSchema, make_context_list_frame, {"countries": COUNTRY_LIST}),
+    "titanic": (TitanicPassenger, make_titanic_frame, None),
+}
+
+
+def make_frame(name: str, n_rows: int, invalid_ratio: float = 0.01, seed: int = 0) -> pd.DataFrame:
+    """Generate the DataFrame of a benchmark schema.
+
+    Args:
+        name (str): The name of the schema, see `SCHEMAS`.
+        n_rows (int): The number of rows.
+        invalid_ratio (float, optional): The expected share of invalid rows. Defaults to 0.01.
+        seed (int, optional): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The generated DataFrame.
+    """
+    _, factory, _ = SCHEMAS[name]
+    return factory(n_rows, invalid_ratio, np.random.default_rng(seed))
@@ -1,4 +1,41 @@
 """Pandantic is a library for validating and serializing data using Pydantic and Pandas."""
 
-from pandantic.basemodel import CoreValidator as Pandantic
-from pandantic.types_pandantic import Optional  # type: ignore
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from pandantic.basemodel import CoreValidator as Pandantic
+    from pandantic.cache import plan_cache
+    from pandantic.sampling import Sample, SampleReport
+    from pandantic.stats import ValidationStats
+    from pandantic.types_pandantic import Optional  # type: ignore
+    from pandantic.validators.incremental import IncrementalValidator
+
+
+# the public names and the modules defining them, imported on first access so that
+# `import pandantic` does not import pandas (or any other backend)
+_EXPORTS = {
+    "Pandantic": ("pandantic.basemodel", "CoreValidator"),
+    "plan_cache": ("pandantic.cache", "plan_cache"),
+    "Sample": ("pandantic.sampling", "Sample"),
+    "SampleReport": ("pandantic.sampling", "SampleReport"),
+    "ValidationStats": ("pandantic.stats", "ValidationStats"),
+    "Optional": ("pandantic.types_pandantic", "Optional"),
+    "IncrementalValidator": ("pandantic.validators.incremental", "IncrementalValidator"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -2,14 +2,88 @@
 
 from __future__ import annotations
 
-from collections.abc import Hashable, Iterable
-from typing import Any
-
-import pandas as pd
+import functools
+import os
+import sys
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeGuard, Union
 
 from pandantic.types import SchemaTypes, TableTypes
 from pandantic.validators.base import BaseValidator
-from pandantic.validators.pandas import PandasValidator
+
+
+# the backends (pandas included) and the machinery of the asyncio and file APIs are imported on
+# first use, so `import pandantic` stays cheap
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import pandas as pd
+
+    from pandantic.readers import FileFormat
+
+
+def _iter_chunks(dataframe: TableTypes, chunksize: int) -> Iterator[TableTypes]:
+    """Split a pandas DataFrame into chunks of rows, other tables are a single chunk."""
+    if _is_pandas(dataframe) and len(dataframe) > chunksize:
+        for start in range(0, len(dataframe), chunksize):
+            yield dataframe.iloc[start : start + chunksize]
+    else:
+        yield dataframe
+
+
+def _is_instance(dataframe: Any, module: str, *names: str) -> bool:
+    """Whether the table is an instance of one of the named classes of a module.
+
+    A module that was not imported yet cannot have created the table, so it is never imported.
+    """
+    loaded = sys.modules.get(module)
+    return loaded is not None and isinstance(
+        dataframe, tuple(getattr(loaded, name) for name in names)
+    )
+
+
+def _is_pandas(dataframe: Any) -> TypeGuard[pd.DataFrame]:
+    return _is_instance(dataframe, "pandas", "DataFrame")
+
+
+def _iterate_chunk(
+    iterate: Callable[..., Iterable[Any]], chunk: TableTypes, **kwargs: Any
+) -> list[Any]:
+    return list(iterate(chunk, **kwargs))
+
+
+async def _amap_chunks(
+    function: Callable[[TableTypes], Any],
+    dataframe: TableTypes,
+    chunksize: int,
+    executor: Optional[Executor],
+    concurrency: int,
+) -> AsyncIterator[Any]:
+    """Apply the function to each chunk of the DataFrame on the executor and yield the results.
+
+    Up to `concurrency` chunks are submitted ahead, the results are yielded in order. When the
+    generator is closed (or raises), the chunks that have not started yet are cancelled.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future[Any]] = deque()
+    try:
+        for chunk in _iter_chunks(dataframe, chunksize):
+            pending.append(loop.run_in_executor(executor, function, chunk))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 class CoreValidator:
@@ -17,15 +91,233 @@ class CoreValidator:
 
     def __init__(self, schema: SchemaTypes):
         self.schema = schema
+        self._implementations: dict[type, BaseValidator] = {}
 
     def _get_implementation(self, dataframe: TableTypes) -> BaseValidator:
-        if issubclass(pd.DataFrame, type(dataframe)):
-            return PandasValidator(schema=self.schema)
+        implementation = self._implementations.get(type(dataframe))
+        if implementation is not None:
+            return implementation
+
+        if _is_pandas(dataframe):
+            from pandantic.validators.pandas import (  # pylint: disable=import-outside-toplevel
+                PandasValidator,
+            )
 
-        raise TypeError(f"Could not find any implementation for dataframe type: {type(dataframe)}")
+            implementation = PandasValidator(schema=self.schema)
+        elif _is_instance(dataframe, "polars", "DataFrame", "LazyFrame"):
+            # polars is an optional dependency, only imported when given a polars frame
+            from pandantic.validators.polars import (  # pylint: disable=import-outside-toplevel
+                PolarsValidator,
+            )
+
+            implementation = PolarsValidator(schema=self.schema)
+        elif _is_instance(dataframe, "pyarrow", "Table", "RecordBatch", "RecordBatchReader"):
+            # pyarrow is an optional dependency, only imported when given an arrow table
+            from pandantic.validators.arrow import (  # pylint: disable=import-outside-toplevel
+                ArrowValidator,
+            )
+
+            implementation = ArrowValidator(schema=self.schema)
+        elif _is_instance(dataframe, "dask.dataframe", "DataFrame") or _is_instance(
+            dataframe, "dask_expr", "DataFrame"
+        ):
+            # dask is an optional dependency, only imported when given a dask frame
+            from pandantic.validators.dask import (  # pylint: disable=import-outside-toplevel
+                DaskValidator,
+            )
+
+            implementation = DaskValidator(schema=self.schema)
+        else:
+            raise TypeError(
+                f"Could not find any implementation for dataframe type: {type(dataframe)}"
+            )
+
+        self._implementations[type(dataframe)] = implementation
+        return implementation
 
     def validate(self, dataframe: TableTypes, **kwargs) -> Any:  # type: ignore
         return self._get_implementation(dataframe).validate(dataframe=dataframe, **kwargs)
 
+    def validate_report(self, dataframe: TableTypes, **kwargs) -> tuple[Any, Any]:  # type: ignore
+        return self._get_implementation(dataframe).validate_report(dataframe=dataframe, **kwargs)
+
+    def validity_mask(self, dataframe: TableTypes, **kwargs) -> Any:  # type: ignore
+        return self._get_implementation(dataframe).validity_mask(dataframe=dataframe, **kwargs)
+
+    def split(self, dataframe: TableTypes, **kwargs) -> tuple[Any, Any]:  # type: ignore
+        return self._get_implementation(dataframe).split(dataframe=dataframe, **kwargs)
+
     def iterate(self, dataframe: TableTypes, **kwargs) -> Iterable[tuple[Hashable, Any]]:  # type: ignore
         return self._get_implementation(dataframe).iterate(dataframe=dataframe, **kwargs)
+
+    async def aiter_valid_chunks(  # type: ignore
+        self,
+        dataframe: TableTypes,
+        chunksize: int = 100_000,
+        executor: Optional[Executor] = None,
+        concurrency: int = 1,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Validate a DataFrame chunk by chunk on an executor and yield the validated chunks.
+
+        The event loop is never blocked by the validation, and gets control back between chunks.
+        Only pandas DataFrames are split into chunks, other tables are validated in a single call.
+
+        Args:
+            dataframe (TableTypes): The DataFrame to validate.
+            chunksize (int, optional): The number of rows validated per call. Defaults to 100_000.
+            executor (Optional[Executor], optional): The thread or process pool to validate on.
+                Defaults to None, the default executor of the event loop.
+            concurrency (int, optional): The number of chunks submitted to the executor at once.
+                Defaults to 1.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            **kwargs: Passed on to `validate` (e.g. strict, context, n_jobs).
+
+        Yields:
+            Any: The validated (if errors="skip" or "log", filtered) chunks, in order.
+        """
+        validate = functools.partial(self.validate, errors=errors, **kwargs)
+        async for chunk in _amap_chunks(
+            validate, dataframe, chunksize=chunksize, executor=executor, concurrency=concurrency
+        ):
+            yield chunk
+
+    async def avalidate(  # type: ignore
+        self,
+        dataframe: TableTypes,
+        chunksize: int = 100_000,
+        executor: Optional[Executor] = None,
+        concurrency: int = 1,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        **kwargs,
+    ) -> Any:
+        """Validate a DataFrame without blocking the event loop, see `aiter_valid_chunks`.
+
+        NOTE: the chunks are validated separately, so `sample` and `stats`, which describe the
+            DataFrame as a whole, are not supported.
+
+        Returns:
+            Any: The same as `validate`, the valid rows if errors="skip" or "log".
+
+        Raises:
+            ValueError: If `sample` or `stats` is given.
+        """
+        unsupported = [name for name in ("sample", "stats") if kwargs.get(name) is not None]
+        if unsupported:
+            raise ValueError(
+                f"avalidate does not support {' or '.join(unsupported)}, "
+                "as it validates the chunks separately"
+            )
+
+        chunks = [
+            chunk
+            async for chunk in self.aiter_valid_chunks(
+                dataframe,
+                chunksize=chunksize,
+                executor=executor,
+                concurrency=concurrency,
+                errors=errors,
+                **kwargs,
+            )
+        ]
+        if len(chunks) == 1:
+            return chunks[0]
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        return pd.concat(chunks)
+
+    async def aiterate(  # type: ignore
+        self,
+        dataframe: TableTypes,
+        chunksize: int = 100_000,
+        executor: Optional[Executor] = None,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Iterate over a DataFrame without blocking the event loop, yield validated schema models.
+
+        The rows are validated chunk by chunk on the executor, like in `aiter_valid_chunks`.
+
+        Args: see `aiter_valid_chunks`, the `**kwargs` are passed on to `iterate` (e.g. context,
+            verbose, batch_size).
+
+        Yields:
+            Any: The same as `iterate`, e.g. the index label and model of each valid row.
+        """
+        iterate = functools.partial(_iterate_chunk, self.iterate, **kwargs)
+        async for items in _amap_chunks(
+            iterate, dataframe, chunksize=chunksize, executor=executor, concurrency=concurrency
+        ):
+            for item in items:
+                yield item
+
+    def iter_valid_chunks(  # type: ignore
+        self,
+        path: Union[str, os.PathLike[str]],
+        chunksize: int = 100_000,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        file_format: Optional[FileFormat] = None,
+        read_kwargs: Optional[dict[str, Any]] = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a CSV or Parquet file chunk by chunk and yield the validated chunks.
+
+        Only one chunk of the file is held in memory at a time, so files larger than memory
+        can be validated.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): The path of the CSV or Parquet file.
+            chunksize (int, optional): The number of rows read per chunk. Defaults to 100_000.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            file_format (Optional[FileFormat], optional): "csv" or "parquet". Defaults to None, which
+                infers the format from the suffix of the path.
+            read_kwargs (Optional[dict[str, Any]], optional): Passed on to the reader, see `read_chunks`.
+            **kwargs: Passed on to `validate` (e.g. strict, context, n_jobs).
+
+        Yields:
+            pd.DataFrame: The validated (if errors="skip" or "log", filtered) chunks.
+        """
+        from pandantic.readers import (  # pylint: disable=import-outside-toplevel
+            read_chunks,
+        )
+
+        for chunk in read_chunks(
+            path, chunksize=chunksize, file_format=file_format, **(read_kwargs or {})
+        ):
+            yield self.validate(dataframe=chunk, errors=errors, **kwargs)
+
+    def validate_file(  # type: ignore
+        self,
+        path: Union[str, os.PathLike[str]],
+        chunksize: int = 100_000,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        file_format: Optional[FileFormat] = None,
+        read_kwargs: Optional[dict[str, Any]] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Validate a CSV or Parquet file chunk by chunk and return the valid rows.
+
+        NOTE: the valid rows are collected into a single DataFrame, use `iter_valid_chunks` to
+            process them chunk by chunk instead.
+
+        Args: see `iter_valid_chunks`.
+
+        Returns:
+            pd.DataFrame: The validated (if errors="skip" or "log", filtered) rows of the file.
+        """
+        chunks = list(
+            self.iter_valid_chunks(
+                path,
+                chunksize=chunksize,
+                errors=errors,
+                file_format=file_format,
+                read_kwargs=read_kwargs,
+                **kwargs,
+            )
+        )
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks)
@@ -0,0 +1,169 @@
+"""Process-wide cache of prepared validation plans.
+
+Preparing a schema for validation (building its TypeAdapter, compiling its vectorized column
+checks, resolving it against the columns of a table) is far more expensive than validating a
+small table. The `plan_cache` keeps the most recently used plans, so validating many tables
+against the same schemas only pays this price once.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any, NamedTuple, Optional
+
+from pydantic import TypeAdapter
+
+from pandantic.types import SchemaTypes
+from pandantic.validators.dtypes import DtypeCandidates, compile_dtype_candidates
+from pandantic.validators.nulls import NullPlan, compile_null_plan
+from pandantic.validators.unique import UniqueValuePlan, compile_unique_value_plan
+from pandantic.validators.vectorized import ColumnarPlan, compile_columnar_plan
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a PlanCache, similar to `functools.lru_cache().cache_info()`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationPlan:
+    """Everything prepared to validate a table layout against a schema.
+
+    Args:
+        schema (SchemaTypes): The schema to validate against.
+        columns (tuple[Hashable, ...]): The columns of the table, in order.
+        strict (bool): Whether extra columns are disallowed.
+        adapter (TypeAdapter): The TypeAdapter validating a `list[schema]` in a single call.
+        columnar (Optional[ColumnarPlan]): The vectorized plan of the schema, if it can be compiled.
+        unique (Optional[UniqueValuePlan]): The per-field plan of the schema, if its fields can be
+            validated independently. Defaults to None.
+        nulls (Optional[NullPlan]): The normalization of the missing values of the schema, if it has
+            `pandantic.Optional` fields. Defaults to None.
+        dtypes (Optional[DtypeCandidates]): The fields of the schema that could be guaranteed by
+            the dtypes of their columns, if any. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        schema: SchemaTypes,
+        columns: tuple[Hashable, ...],
+        strict: bool,
+        adapter: TypeAdapter,  # type: ignore[type-arg]
+        columnar: Optional[ColumnarPlan],
+        unique: Optional[UniqueValuePlan] = None,
+        nulls: Optional[NullPlan] = None,
+        dtypes: Optional[DtypeCandidates] = None,
+    ):
+        self.schema = schema
+        self.columns = columns
+        self.strict = strict
+        self.adapter = adapter
+        self.columnar = columnar
+        self.unique = unique
+        self.nulls = nulls
+        self.dtypes = dtypes
+        self.field_columns = tuple(col for col in columns if col in schema.model_fields)
+        self.extra_columns = frozenset(col for col in columns if col not in schema.model_fields)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(schema={self.schema.__name__}, columns={self.columns}, "
+            f"strict={self.strict})"
+        )
+
+
+class PlanCache:
+    """A thread-safe, size-bounded (LRU) cache of ValidationPlans.
+
+    Args:
+        maxsize (int, optional): The maximum number of plans to keep. Defaults to 128.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._plans: OrderedDict[tuple[Any, ...], ValidationPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        schema: SchemaTypes,
+        columns: Iterable[Hashable] = (),
+        strict: bool = False,
+    ) -> ValidationPlan:
+        """Return the plan for the schema and table layout, preparing it on a cache miss.
+
+        Args:
+            schema (SchemaTypes): The schema to validate against.
+            columns (Iterable[Hashable], optional): The columns of the table, in order.
+            strict (bool, optional): Whether extra columns are disallowed. Defaults to False.
+
+        Returns:
+            ValidationPlan: The (cached) plan.
+        """
+        columns = tuple(columns)
+        key = (schema, columns, strict)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._hits += 1
+                self._plans.move_to_end(key)
+                return plan
+            self._misses += 1
+            # the schema level parts are shared by all layouts of the same schema
+            sibling = next((p for p in self._plans.values() if p.schema is schema), None)
+
+        if sibling is not None:
+            adapter, columnar, unique = sibling.adapter, sibling.columnar, sibling.unique
+            nulls, dtypes = sibling.nulls, sibling.dtypes
+        else:
+            adapter = TypeAdapter(list[schema])  # type: ignore[valid-type]
+            columnar = compile_columnar_plan(schema)
+            unique = compile_unique_value_plan(schema)
+            nulls = compile_null_plan(schema)
+            dtypes = compile_dtype_candidates(
+                schema, model=nulls.model if nulls is not None else None
+            )
+        plan = ValidationPlan(
+            schema,
+            columns,
+            strict,
+            adapter=adapter,
+            columnar=columnar,
+            unique=unique,
+            nulls=nulls,
+            dtypes=dtypes,
+        )
+
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def info(self) -> CacheInfo:
+        """Return the hits, misses, maximum and current size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._plans))
+
+    def clear(self) -> None:
+        """Remove all plans and reset the statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+plan_cache = PlanCache()
@@ -4,6 +4,7 @@ See: https://pandas.pydata.org/pandas-docs/version/2.1/development/extending.htm
 Adds the following methods:
     df.pydantic.validate()
     df.pydantic.filter()
+    df.pydantic.mask()
     df.pydantic.itertuples()
     df.pydantic.iterrows()
     df.pydantic.iterschemas()
@@ -12,12 +13,15 @@ To register plugin: `from pandantic.plugins import pandas_plugin #(or *)`
 """
 import logging
 from collections.abc import Hashable, Iterable
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from pandantic.basemodel import CoreValidator
+from pandantic.sampling import Sample, SampleReport
+from pandantic.validators.pandas import PandasValidator
 
 
 logger = logging.getLogger(__name__)
@@ -39,12 +43,31 @@ class PydanticAccessor:
         self,
         schema: BaseModel,
         n_jobs: Optional[int] = None,
+        sample: Optional[Union[float, int, Sample]] = None,
         **kwargs: Optional[dict[str, Any]],
-    ) -> bool:
+    ) -> Union[bool, SampleReport]:
+        """Return whether all rows of the DataFrame are valid.
+
+        With `sample` (a fraction, a number of rows or a `Sample`), only a random sample is
+        validated and a SampleReport with the estimated invalid rate is returned instead.
+        """
         if not isinstance(schema, type(BaseModel)):
             raise TypeError("Arg `schema` must be a pydantic.BaseModel subclass!")
 
         schema_validator = CoreValidator(schema)  # type: ignore
+        if sample is not None:
+            report: SampleReport = schema_validator.validate(
+                dataframe=self.obj,
+                errors="skip",
+                context=kwargs,
+                n_jobs=n_jobs or 1,
+                sample=sample,
+            )
+            logger.info(
+                f"Estimated invalid rate for {schema=}: {report.invalid_rate:.2%} "
+                f"({report.interval[0]:.2%} - {report.interval[1]:.2%})."
+            )
+            return report
         try:
             _ = schema_validator.validate(
                 dataframe=self.obj,
@@ -63,6 +86,7 @@ class PydanticAccessor:
         schema: BaseModel,
         n_jobs: Optional[int] = None,
         verbose: bool = True,
+        dedupe: bool = False,
         **kwargs: Optional[dict[str, Any]],
     ) -> pd.DataFrame:
         if not isinstance(schema, type(BaseModel)):
@@ -78,24 +102,61 @@ class PydanticAccessor:
             errors=errors,
             context=kwargs,
             n_jobs=n_jobs or 1,
+            dedupe=dedupe,
         )
         assert isinstance(filtered_df, pd.DataFrame)
         return filtered_df
 
+    def mask(
+        self,
+        schema: BaseModel,
+        n_jobs: Optional[int] = None,
+        verbose: bool = True,
+        dedupe: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> np.ndarray:
+        """Return a boolean array, by position, of the rows of the DataFrame that are valid.
+
+        Unlike a filter on the index labels, the mask is correct for non-unique indexes, and can
+        be used to select the valid rows with `df[mask]` or the invalid ones with `df[~mask]`.
+        """
+        if not isinstance(schema, type(BaseModel)):
+            raise TypeError("Arg `schema` must be a pydantic.BaseModel subclass!")
+
+        schema_validator = CoreValidator(schema)  # type: ignore
+        valid: np.ndarray = schema_validator.validity_mask(
+            dataframe=self.obj,
+            errors="log" if verbose else "skip",
+            context=kwargs,
+            n_jobs=n_jobs or 1,
+            dedupe=dedupe,
+        )
+        return valid
+
     def itertuples(
         self,
         schema: BaseModel,
         verbose: bool = True,
+        chunksize: Optional[int] = None,
+        **kwargs: Optional[dict[str, Any]],
     ) -> Iterable[tuple[Any, ...]]:
-        """Same as normal .itertuples(), except invalid rows are skipped."""
-        for row in self.obj.itertuples(name=None):
-            try:
-                _ = schema(**dict(zip(self.obj.columns, row[1:])))  # type: ignore
-            except ValidationError as e:
-                if verbose:
-                    logger.info(f"Invalid row {row} with error: {e}")
-                continue
-            yield row
+        """Same as normal .itertuples(), except invalid rows are skipped.
+
+        The valid rows are determined up front in a single (batched) validation pass, after which
+        the tuples are streamed straight from the valid rows of the DataFrame. With `chunksize`,
+        this is done chunk by chunk instead, which keeps the memory use low for large DataFrames.
+        """
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+
+        schema_validator = PandasValidator(schema)  # type: ignore
+        step = chunksize or max(len(self.obj), 1)
+        for start in range(0, len(self.obj), step):
+            chunk = self.obj.iloc[start : start + step]
+            mask = schema_validator.validity_mask(
+                chunk, errors="log" if verbose else "skip", context=kwargs
+            )
+            yield from chunk[mask].itertuples(name=None)
 
     def iterrows(  # type: ignore[no-untyped-def]
         self, schema: BaseModel, verbose: bool = True, **kwargs
@@ -0,0 +1,85 @@
+"""Chunked readers for tables stored in files, to validate them with a bounded memory footprint."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal, Optional, Union
+
+import pandas as pd
+
+
+FileFormat = Literal["csv", "parquet"]
+
+_SUFFIXES: dict[str, FileFormat] = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".txt": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def infer_file_format(path: Union[str, os.PathLike[str]]) -> FileFormat:
+    """Infer the format of a file from its suffix (ignoring compression suffixes for CSV files)."""
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    for suffix in reversed(suffixes):
+        if suffix in _SUFFIXES:
+            return _SUFFIXES[suffix]
+    raise ValueError(f"Could not infer the file format of {path}, please pass `file_format`.")
+
+
+def read_chunks(
+    path: Union[str, os.PathLike[str]],
+    chunksize: int = 100_000,
+    file_format: Optional[FileFormat] = None,
+    **read_kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or Parquet file as a stream of DataFrames of (at most) `chunksize` rows.
+
+    The index of the chunks continues across chunks, i.e. it is the row number within the file
+    unless an index column is read from the file itself.
+
+    Args:
+        path (Union[str, os.PathLike[str]]): The path of the file.
+        chunksize (int, optional): The maximum number of rows per chunk. Defaults to 100_000.
+        file_format (Optional[FileFormat], optional): "csv" or "parquet". Defaults to None, which
+            infers the format from the suffix of the path.
+        **read_kwargs: Passed on to `pd.read_csv` or `pyarrow.parquet.ParquetFile.iter_batches`.
+
+    Yields:
+        pd.DataFrame: The chunks of the file.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+    file_format = file_format or infer_file_format(path)
+    if file_format == "csv":
+        with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+    elif file_format == "parquet":
+        yield from _read_parquet_chunks(path, chunksize=chunksize, **read_kwargs)
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}, must be 'csv' or 'parquet'.")
+
+
+def _read_parquet_chunks(
+    path: Union[str, os.PathLike[str]],
+    chunksize: int,
+    **read_kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError("Reading Parquet files requires `pyarrow` to be installed.") from exc
+
+    offset = 0
+    with pq.ParquetFile(path) as parquet_file:
+        # the file is decoded incrementally, row group by row group
+        for batch in parquet_file.iter_batches(batch_size=chunksize, **read_kwargs):
+            chunk = batch.to_pandas()
+            if isinstance(chunk.index, pd.RangeIndex) and chunk.index.start == 0:
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
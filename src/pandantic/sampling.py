@@ -0,0 +1,192 @@
+"""Validation of a random sample of a DataFrame, to estimate the share of invalid rows.
+
+A sample is drawn at random (simple or stratified by a column), validated, and the invalid rate
+of the whole DataFrame is estimated from it, with a (Wilson score) confidence interval that takes
+the finite size of the DataFrame into account.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Sample:
+    """How to sample the rows of a DataFrame.
+
+    Exactly one of `frac` and `n` is required. Passing `sample=0.01` or `sample=10_000` to
+    `validate` is short for `Sample(frac=0.01)` and `Sample(n=10_000)` respectively.
+
+    Attributes:
+        frac (Optional[float]): The share of the rows to sample, between 0 (exclusive) and 1.
+        n (Optional[int]): The number of rows to sample.
+        by (Optional[str]): The column to stratify by. Every distinct value (including missing)
+            is sampled proportionally to its number of rows, and at least once.
+        random_state (Optional[int]): The seed of the random generator, for reproducible samples.
+        confidence (float): The confidence level of the interval of the estimate. Defaults to 0.95.
+    """
+
+    frac: Optional[float] = None
+    n: Optional[int] = None
+    by: Optional[str] = None
+    random_state: Optional[int] = None
+    confidence: float = 0.95
+
+    def __post_init__(self) -> None:
+        if (self.frac is None) == (self.n is None):
+            raise ValueError("Exactly one of `frac` and `n` must be given.")
+        if self.frac is not None and not 0 < self.frac <= 1:
+            raise ValueError("frac must be between 0 (exclusive) and 1.")
+        if self.n is not None and self.n < 1:
+            raise ValueError("n must be a positive integer")
+        if not 0 < self.confidence < 1:
+            raise ValueError("confidence must be between 0 and 1 (exclusive).")
+
+    @classmethod
+    def from_arg(cls, sample: Union[float, int, Sample]) -> Sample:
+        """Interpret the `sample` argument of `validate`: a Sample, a fraction or a number."""
+        if isinstance(sample, Sample):
+            return sample
+        if isinstance(sample, bool) or not isinstance(sample, (int, float)):
+            raise TypeError("sample must be a fraction (float), a number of rows (int) or a Sample")
+        if isinstance(sample, float):
+            return cls(frac=sample)
+        return cls(n=sample)
+
+    def _size(self, rows: int) -> int:
+        if self.frac is not None:
+            return min(max(round(self.frac * rows), 1), rows)
+        assert self.n is not None  # checked in __post_init__
+        return min(self.n, rows)
+
+    def draw(self, dataframe: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw the sample, without replacement.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The (sorted) positions of the sampled rows,
+                the stratum of each of them (all zeros if not stratified), and the number of rows
+                of each stratum.
+        """
+        if self.by is not None and self.by not in dataframe.columns:
+            raise KeyError(f"Column {self.by!r} to stratify by was not found in the DataFrame.")
+        rng = np.random.default_rng(self.random_state)
+        rows = len(dataframe)
+        if self.by is None or rows == 0:
+            positions = np.sort(rng.choice(rows, size=self._size(rows), replace=False))
+            return positions, np.zeros(len(positions), dtype=np.intp), np.array([rows])
+
+        codes, _ = pd.factorize(dataframe[self.by], use_na_sentinel=False)
+        sizes = np.bincount(codes)
+        # rows grouped by stratum, each stratum in its original order (a radix sort for small codes)
+        order = np.argsort(codes.astype(np.min_scalar_type(len(sizes))), kind="stable")
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+        total = self._size(rows)
+        drawn = []
+        for start, size in zip(starts, sizes):
+            allocated = min(max(round(total * size / rows), 1), size)
+            offsets = rng.choice(size, size=allocated, replace=False)
+            drawn.append(order[start + offsets])
+        sampled = np.sort(np.concatenate(drawn))
+        return sampled, codes[sampled], sizes
+
+
+@dataclass(frozen=True)
+class SampleReport:
+    """The validation result of a random sample of a DataFrame.
+
+    Attributes:
+        rows (int): The number of rows of the DataFrame.
+        sampled_rows (int): The number of rows validated.
+        invalid_count (int): The number of invalid rows in the sample.
+        invalid_rate (float): The estimated share of invalid rows of the DataFrame.
+        interval (tuple[float, float]): The confidence interval of the invalid rate.
+        confidence (float): The confidence level of the interval.
+        invalid_rows (pd.DataFrame): The invalid rows of the sample.
+    """
+
+    rows: int
+    sampled_rows: int
+    invalid_count: int
+    invalid_rate: float
+    interval: tuple[float, float]
+    confidence: float
+    invalid_rows: pd.DataFrame
+
+
+def _wilson_interval(
+    rate: float, sampled: float, confidence: float, fpc: float
+) -> tuple[float, float]:
+    """The Wilson score interval of a rate, with a finite population correction."""
+    if fpc <= 0:
+        return rate, rate
+    z2 = NormalDist().inv_cdf(0.5 + confidence / 2) ** 2 * fpc
+    denominator = 1 + z2 / sampled
+    center = (rate + z2 / (2 * sampled)) / denominator
+    half_width = (
+        math.sqrt(z2 * (rate * (1 - rate) / sampled + z2 / (4 * sampled**2))) / denominator
+    )
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def estimate(
+    dataframe: pd.DataFrame,
+    sample: Sample,
+    positions: np.ndarray,
+    strata: np.ndarray,
+    population_sizes: np.ndarray,
+    valid: np.ndarray,
+) -> SampleReport:
+    """Estimate the invalid rate of the DataFrame from the validity of its sampled rows.
+
+    Args:
+        dataframe (pd.DataFrame): The sampled DataFrame.
+        sample (Sample): How the sample was drawn.
+        positions (np.ndarray): The positions of the sampled rows, see `Sample.draw`.
+        strata (np.ndarray): The stratum of each sampled row, see `Sample.draw`.
+        population_sizes (np.ndarray): The number of rows of each stratum, see `Sample.draw`.
+        valid (np.ndarray): Whether each sampled row is valid.
+
+    Returns:
+        SampleReport: The estimate, with the invalid rows of the sample.
+    """
+    rows, sampled = len(dataframe), len(positions)
+    invalid = ~valid
+    if sampled == 0:
+        return SampleReport(rows, 0, 0, 0.0, (0.0, 1.0), sample.confidence, dataframe.iloc[:0])
+
+    sample_sizes = np.bincount(strata, minlength=len(population_sizes))
+    invalid_counts = np.bincount(strata, weights=invalid, minlength=len(population_sizes))
+
+    weights = population_sizes / rows
+    rates = invalid_counts / sample_sizes
+    rate = float(np.dot(weights, rates))
+    # the variance of the (stratified) estimate, each stratum with its finite population correction
+    variance = float(
+        np.sum(
+            weights**2
+            * (1 - sample_sizes / population_sizes)
+            * rates
+            * (1 - rates)
+            / sample_sizes
+        )
+    )
+    fpc = 1 - sampled / rows
+    # the Wilson interval of a simple random sample with the same variance as the estimate
+    effective_size = rate * (1 - rate) * fpc / variance if variance > 0 else sampled
+
+    return SampleReport(
+        rows=rows,
+        sampled_rows=sampled,
+        invalid_count=int(invalid.sum()),
+        invalid_rate=rate,
+        interval=_wilson_interval(rate, effective_size, sample.confidence, fpc),
+        confidence=sample.confidence,
+        invalid_rows=dataframe.take(positions[invalid]),
+    )
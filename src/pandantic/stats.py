@@ -0,0 +1,97 @@
+"""Instrumentation of validation runs, to find out where the time of a slow validation goes."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class ValidationStats:
+    """Statistics of one or more validation runs, filled in when passed as `stats=` to `validate`
+    or `iterate`. Passing the same object to multiple runs accumulates their statistics.
+
+    The phases (in seconds) are:
+        * "plan": getting the validation plan and checking the columns.
+        * "dedupe": hashing the rows to find the distinct ones (`dedupe=True` only).
+        * "certify": certifying rows column-wise, without converting them to dictionaries.
+        * "conversion": converting the remaining rows to dictionaries.
+        * "validation": validating the dictionaries with pydantic.
+        * "transfer": moving the results from the worker processes to the main process
+            (parallel runs only), including the time results wait to be collected in order.
+        * "invalid_rows": validating the invalid rows once more, to log or raise their errors.
+        * "filtering": filtering the invalid rows out of the DataFrame.
+        * "assembly": collecting the coerced values into a new DataFrame (`output="coerced"` only).
+
+    NOTE: in parallel runs, "conversion" and "validation" add up the time spent in all workers.
+
+    Attributes:
+        rows (int): The number of rows processed.
+        certified_rows (int): The number of rows certified valid without row-wise validation.
+        invalid_rows (int): The number of invalid rows.
+        errors (Counter[tuple[str, str]]): The number of errors by field (dot-separated for nested
+            locations, empty for model-level errors) and error type.
+        phases (dict[str, float]): The time spent in each phase, in seconds.
+        n_jobs (int): The largest number of processes used by a run.
+        pool_time (float): The time (in seconds) the pools of worker processes were running.
+        worker_busy (dict[int, float]): The time (in seconds) each worker process spent on chunks.
+    """
+
+    rows: int = 0
+    certified_rows: int = 0
+    invalid_rows: int = 0
+    errors: Counter[tuple[str, str]] = field(default_factory=Counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    n_jobs: int = 1
+    pool_time: float = 0.0
+    worker_busy: dict[int, float] = field(default_factory=dict)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add time (in seconds) to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block and add it to the phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+    def add_errors(self, errors: Any) -> None:
+        """Count the errors (as returned by `ValidationError.errors()`) of a batch of rows."""
+        self.errors.update(
+            (".".join(str(loc) for loc in error["loc"][1:]), error["type"]) for error in errors
+        )
+
+    def merge(self, other: ValidationStats) -> None:
+        """Add the statistics of another run, e.g. of a single chunk validated by a worker."""
+        self.rows += other.rows
+        self.certified_rows += other.certified_rows
+        self.invalid_rows += other.invalid_rows
+        self.errors.update(other.errors)
+        for phase, seconds in other.phases.items():
+            self.add_time(phase, seconds)
+        self.n_jobs = max(self.n_jobs, other.n_jobs)
+        self.pool_time += other.pool_time
+        for pid, seconds in other.worker_busy.items():
+            self.worker_busy[pid] = self.worker_busy.get(pid, 0.0) + seconds
+
+    @property
+    def worker_utilization(self) -> Optional[float]:
+        """The share of the time the worker processes were busy, None if no pool was used."""
+        if not self.pool_time:
+            return None
+        return sum(self.worker_busy.values()) / (self.pool_time * self.n_jobs)
+
+
+def timer(stats: Optional[ValidationStats], phase: str) -> contextlib.AbstractContextManager[None]:
+    """Time the enclosed block into the phase of the stats, if any."""
+    if stats is None:
+        return contextlib.nullcontext()
+    return stats.timer(phase)
@@ -1,8 +1,22 @@
-from typing import Union, TypeAlias
+from typing import TYPE_CHECKING, TypeAlias, Union
 
-import pandas as pd
 import pydantic
 
 
+if TYPE_CHECKING:
+    import dask.dataframe as dd
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+
 SchemaTypes: TypeAlias = Union[type[pydantic.BaseModel]]
-TableTypes: TypeAlias = Union[pd.DataFrame]
+TableTypes: TypeAlias = Union[
+    "pd.DataFrame",
+    "pl.DataFrame",
+    "pl.LazyFrame",
+    "pa.Table",
+    "pa.RecordBatch",
+    "pa.RecordBatchReader",
+    "dd.DataFrame",
+]
@@ -1,4 +1,5 @@
 import math
+import sys
 from typing import Annotated, Any, Optional, TypeVar
 
 from pydantic.functional_validators import BeforeValidator
@@ -8,7 +9,7 @@ TypeT = TypeVar("TypeT")
 
 
 def coerce_nan_to_none(x: Any) -> Any:
-    """Coerce NaN values to None.
+    """Coerce NaN values (and the other missing values of pandas: NA and NaT) to None.
 
     Args:
         x (Any): The value to coerce.
@@ -19,10 +20,28 @@ def coerce_nan_to_none(x: Any) -> Any:
     if x is None:
         return None
 
-    if isinstance(x, (float, int)) and math.isnan(x):
+    if isinstance(x, float):
+        return None if math.isnan(x) else x
+
+    # the missing values of pandas and NumPy only exist once these are imported, so there is no
+    # need to import them here (which keeps `import pandantic` cheap)
+    pd = sys.modules.get("pandas")
+    if pd is not None and (x is pd.NA or x is pd.NaT):
         return None
 
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(x, np.floating) and math.isnan(x):
+            return None
+        if isinstance(x, (np.datetime64, np.timedelta64)) and np.isnat(x):
+            return None
+
     return x
 
 
+def is_nan_to_none(metadata: Any) -> bool:
+    """Return whether the field metadata is the validator coercing NaN to None of `Optional`."""
+    return isinstance(metadata, BeforeValidator) and metadata.func is coerce_nan_to_none
+
+
 Optional = Annotated[Optional[TypeT], BeforeValidator(coerce_nan_to_none)]
@@ -1,2 +1,24 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseValidator
-from .pandas import PandasValidator
+
+
+if TYPE_CHECKING:
+    from .incremental import IncrementalValidator
+    from .pandas import PandasValidator
+
+
+# the validators import their backend, so they are only imported on first access
+_EXPORTS = {
+    "PandasValidator": ".pandas",
+    "IncrementalValidator": ".incremental",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,328 @@
+import logging
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Literal, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import ValidationError
+
+from pandantic.cache import ValidationPlan, plan_cache
+from pandantic.types import SchemaTypes
+from pandantic.validators.base import BATCH_SIZE, BaseValidator
+from pandantic.validators.vectorized import _MAX_SAFE_FLOAT_INT, ColumnCheck
+
+
+ArrowTypes = Union[pa.Table, pa.RecordBatch, pa.RecordBatchReader]
+
+
+def _is_string(arrow_type: pa.DataType) -> bool:
+    return bool(pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type))
+
+
+def _certify_array(  # pylint: disable=too-many-return-statements
+    check: ColumnCheck, array: pa.Array
+) -> pa.Array:
+    """Return a boolean array of the values of the array that are guaranteed to be valid.
+
+    Like the pandas plan, the check is conservative: values it does not certify are left to
+    pydantic. Nulls are never certified, as they are converted to None.
+    """
+    arrow_type = array.type
+    if pa.types.is_dictionary(arrow_type) and _is_string(arrow_type.value_type):
+        array, arrow_type = pc.cast(array, arrow_type.value_type), arrow_type.value_type
+    mask = pc.is_valid(array)
+
+    if check.kind == "str":
+        if not _is_string(arrow_type):
+            return pa.repeat(False, len(array))
+        if check.min_length is not None:
+            mask = pc.and_(mask, pc.greater_equal(pc.utf8_length(array), check.min_length))
+        if check.max_length is not None:
+            mask = pc.and_(mask, pc.less_equal(pc.utf8_length(array), check.max_length))
+        if check.pattern is not None:
+            # the RE2 engine of Arrow is neither of the regex engines of pydantic
+            return pa.repeat(False, len(array))
+        return mask
+
+    if check.kind == "literal":
+        if all(isinstance(value, str) for value in check.values):
+            if not _is_string(arrow_type):
+                return pa.repeat(False, len(array))
+        elif not pa.types.is_integer(arrow_type):
+            return pa.repeat(False, len(array))
+        return pc.and_(mask, pc.is_in(array, value_set=pa.array(check.values)))
+
+    if check.kind == "bool":
+        if pa.types.is_boolean(arrow_type):
+            return mask
+        if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+            return pc.and_(mask, pc.is_in(array, value_set=pa.array([0, 1], type=arrow_type)))
+        return pa.repeat(False, len(array))
+
+    # boolean arrays are left to pydantic, see `ColumnCheck`
+    if not (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)):
+        return pa.repeat(False, len(array))
+
+    if check.kind == "int" and pa.types.is_floating(arrow_type):
+        mask = pc.and_(mask, pc.is_finite(array))
+        mask = pc.and_(mask, pc.less_equal(pc.abs(array), _MAX_SAFE_FLOAT_INT))
+        mask = pc.and_(mask, pc.equal(pc.floor(array), array))
+    for bound, compare in (
+        (check.gt, pc.greater),
+        (check.ge, pc.greater_equal),
+        (check.lt, pc.less),
+        (check.le, pc.less_equal),
+    ):
+        if bound is not None:
+            mask = pc.and_(mask, compare(array, bound))
+    return mask
+
+
+class ArrowValidator(BaseValidator):
+    def __init__(self, schema: SchemaTypes):
+        self.schema = schema
+
+    def _certify(self, batch: pa.RecordBatch, plan: ValidationPlan) -> pa.Array:
+        """Return a boolean array of the rows that are guaranteed to be valid."""
+        if plan.columnar is None:
+            return pa.repeat(False, batch.num_rows)
+
+        mask = pa.repeat(True, batch.num_rows)
+        for check in plan.columnar.checks:
+            if check.column not in batch.schema.names:
+                if check.required:
+                    return pa.repeat(False, batch.num_rows)
+                continue
+            try:
+                mask = pc.and_(mask, _certify_array(check, batch.column(check.column)))
+            except pa.ArrowInvalid:
+                # e.g. a compute kernel that does not support the type, leave it to pydantic
+                return pa.repeat(False, batch.num_rows)
+        return pc.fill_null(mask, False)
+
+    def _validate_record_batch(
+        self,
+        batch: pa.RecordBatch,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        offset: int = 0,
+    ) -> list[int]:
+        """Validate a single record batch.
+
+        Returns:
+            list[int]: The (sorted) positions within the batch of the rows that failed validation.
+        """
+        plan = plan_cache.get(self.schema, batch.schema.names, strict=strict)
+
+        # check for extra columns and handle strict mode
+        self._check_strict(plan, strict)
+
+        # only the rows that could not be certified are converted to python objects
+        pending_rows = pc.indices_nonzero(pc.invert(self._certify(batch, plan))).to_pylist()
+        pending = batch.take(pa.array(pending_rows, type=pa.int64())).to_pylist()
+        # the missing values are already None, NaN is kept as is
+        positions, _, _ = self._validate_batch(
+            pending, plan=plan, context=context, adapter=plan.adapter
+        )
+
+        if errors in ["raise", "log"]:
+            for position in positions:
+                row_number = offset + pending_rows[position]
+                try:
+                    self.schema.model_validate(obj=pending[position], context=context)
+                except ValidationError as exc:
+                    if errors == "raise":
+                        if hasattr(exc, "add_note"):  # python >= 3.11
+                            exc.add_note(f"Validation error found at row {row_number}")
+                        raise exc
+                    logging.info("Validation error found at row %s\n%s", row_number, exc)
+        return [pending_rows[position] for position in positions]
+
+    @staticmethod
+    def _valid_mask(num_rows: int, invalid_rows: list[int]) -> pa.Array:
+        mask = np.ones(num_rows, dtype=bool)
+        mask[invalid_rows] = False
+        return pa.array(mask)
+
+    @staticmethod
+    def _iter_batches(data: ArrowTypes, batch_size: int) -> Iterator[pa.RecordBatch]:
+        """Iterate over the record batches of the data, slicing them to at most `batch_size` rows.
+
+        Slicing a record batch is zero-copy, it only offsets the underlying buffers.
+        """
+        if isinstance(data, pa.RecordBatch):
+            batches: Iterable[pa.RecordBatch] = [data]
+        elif isinstance(data, pa.Table):
+            batches = data.to_batches()
+        else:
+            batches = data
+        for batch in batches:
+            for start in range(0, batch.num_rows, batch_size):
+                yield batch.slice(start, batch_size)
+
+    def validate(
+        self,
+        dataframe: ArrowTypes,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> Union[pa.Table, pa.RecordBatch]:
+        """Validate an Arrow Table, RecordBatch or RecordBatchReader, record batch by record batch.
+
+        The cheap checks derived from the field constraints of the schema are run with
+        `pyarrow.compute`, the remaining rows are converted to python objects and validated in
+        batches, without ever converting the data to pandas.
+
+        Args:
+            dataframe (ArrowTypes): The Table, RecordBatch or RecordBatchReader to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "raise".
+                NOTE: "skip" and "log" effectively filter the table, excluding invalid rows.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            batch_size (int, optional): The maximum number of rows validated at once. Defaults to 10_000.
+
+        Returns:
+            Union[pa.Table, pa.RecordBatch]: A RecordBatch when given one, a Table otherwise; with only
+                the valid rows if errors="skip" or "log".
+        """
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if isinstance(dataframe, pa.RecordBatchReader):
+            # a stream is filtered batch by batch, it can only be consumed once
+            batches = []
+            offset = 0
+            for batch in self._iter_batches(dataframe, batch_size=batch_size):
+                invalid_rows = self._validate_record_batch(
+                    batch, errors=errors, strict=strict, context=context, offset=offset
+                )
+                offset += batch.num_rows
+                if invalid_rows and errors in ["skip", "log"]:
+                    batch = batch.filter(self._valid_mask(batch.num_rows, invalid_rows))
+                batches.append(batch)
+            return pa.Table.from_batches(batches, schema=dataframe.schema)
+
+        offset = 0
+        invalid_rows = []
+        for batch in self._iter_batches(dataframe, batch_size=batch_size):
+            invalid_rows.extend(
+                offset + row_number
+                for row_number in self._validate_record_batch(
+                    batch, errors=errors, strict=strict, context=context, offset=offset
+                )
+            )
+            offset += batch.num_rows
+
+        logging.debug("# invalid rows: %s", len(invalid_rows))
+
+        if invalid_rows and errors in ["skip", "log"]:
+            return dataframe.filter(self._valid_mask(dataframe.num_rows, invalid_rows))
+        return dataframe
+
+    def validity_mask(
+        self,
+        dataframe: ArrowTypes,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> pa.Array:
+        """Return a boolean array, by position, of the rows of the table that pass validation.
+
+        Args:
+            dataframe (ArrowTypes): The Table, RecordBatch or RecordBatchReader to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            batch_size (int, optional): The maximum number of rows validated at once. Defaults to 10_000.
+
+        Returns:
+            pa.Array: A boolean array with an entry per row, True for the valid rows.
+        """
+        masks = [
+            valid for _, valid in self._iter_masks(dataframe, errors, strict, context, batch_size)
+        ]
+        return pa.concat_arrays(masks) if masks else pa.array([], type=pa.bool_())
+
+    def split(
+        self,
+        dataframe: ArrowTypes,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> tuple[pa.Table, pa.Table]:
+        """Validate a table and split it into its valid and its invalid rows, in a single pass.
+
+        The rows are returned as Tables, also when given a RecordBatch or RecordBatchReader.
+        """
+        valid_batches, invalid_batches = [], []
+        for batch, valid in self._iter_masks(dataframe, errors, strict, context, batch_size):
+            valid_batches.append(batch.filter(valid))
+            invalid_batches.append(batch.filter(pc.invert(valid)))
+        return (
+            pa.Table.from_batches(valid_batches, schema=dataframe.schema),
+            pa.Table.from_batches(invalid_batches, schema=dataframe.schema),
+        )
+
+    def _iter_masks(
+        self,
+        dataframe: ArrowTypes,
+        errors: Literal["skip", "raise", "log"],
+        strict: bool,
+        context: Optional[
+            dict[str, Any]
+        ],  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int,
+    ) -> Iterator[tuple[pa.RecordBatch, pa.Array]]:
+        """Validate the record batches of the table, yield each with its validity mask."""
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        offset = 0
+        for batch in self._iter_batches(dataframe, batch_size=batch_size):
+            invalid_rows = self._validate_record_batch(
+                batch, errors=errors, strict=strict, context=context, offset=offset
+            )
+            yield batch, self._valid_mask(batch.num_rows, invalid_rows)
+            offset += batch.num_rows
+
+    def iterate(
+        self,
+        dataframe: ArrowTypes,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        verbose: bool = True,
+        batch_size: int = BATCH_SIZE,
+    ) -> Iterable[tuple[Hashable, SchemaTypes]]:
+        """Iterate over the rows and yield the row numbers and validated schema models."""
+        offset = 0
+        for batch in self._iter_batches(dataframe, batch_size=batch_size):
+            # the whole batch in a single pydantic-core call, see `PandasValidator.iterate`
+            yield from self._validate_models(
+                batch.to_pylist(),
+                range(offset, offset + batch.num_rows),
+                plan=plan_cache.get(self.schema, batch.schema.names),
+                context=context,
+                verbose=verbose,
+                location="row",
+            )
+            offset += batch.num_rows
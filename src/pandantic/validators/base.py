@@ -1,18 +1,189 @@
+from __future__ import annotations
+
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import Hashable, Iterable
-from typing import Any
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from pandantic.stats import ValidationStats, timer
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from pandantic.cache import ValidationPlan
+    from pandantic.types import SchemaTypes
+
+
+# number of rows handed to pydantic-core in a single validation call
+BATCH_SIZE = 10_000
 
 
 class BaseValidator(ABC):
+    schema: SchemaTypes
+
     @abstractmethod
     def validate(self, dataframe: Any) -> Any:
         raise NotImplementedError
 
+    def validate_report(self, dataframe: Any) -> tuple[Any, Any]:
+        """Validates the table and returns its valid rows together with a table of the errors.
+
+        Raises:
+            TypeError: If the backend does not support error reports.
+        """
+        raise TypeError(f"{type(self).__name__} does not support validate_report")
+
+    def validity_mask(self, dataframe: Any) -> Any:
+        """Validates the table and returns a boolean array, by position, of its valid rows.
+
+        Raises:
+            TypeError: If the backend does not support validity masks.
+        """
+        raise TypeError(f"{type(self).__name__} does not support validity_mask")
+
+    def split(self, dataframe: Any) -> tuple[Any, Any]:
+        """Validates the table and returns its valid rows and its invalid rows.
+
+        Raises:
+            TypeError: If the backend does not support splitting.
+        """
+        raise TypeError(f"{type(self).__name__} does not support split")
+
     @abstractmethod
-    def iterate(self, dataframe: Any) -> Iterable[tuple[Hashable, Any]]:
+    def iterate(self, dataframe: Any) -> Iterable[Any]:
         """Iterates over the rows and generate only validated schema models.
 
         NOTE: This is similar to iterrows() in pandas, except non-valid rows are
-            skipped.
+            skipped. Backends yield (label, model) pairs, or lists of them if asked to batch.
         """
         raise NotImplementedError
+
+    @staticmethod
+    def _check_strict(plan: ValidationPlan, strict: bool) -> None:
+        """Raise a ValueError if strict mode is enabled and the table has extra columns."""
+        if strict and plan.extra_columns:
+            raise ValueError(
+                "Strict mode is enabled but the following extra columns were found in the schema: "
+                f"{set(plan.extra_columns)}."
+            )
+
+    def _validate_batch(
+        self,
+        rows: Sequence[dict[Any, Any]],
+        plan: ValidationPlan,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        max_errors: Optional[int] = 0,
+        stats: Optional[ValidationStats] = None,
+        coerce: bool = False,
+        adapter: Optional[TypeAdapter] = None,  # type: ignore[type-arg]
+    ) -> tuple[list[int], list[ErrorDetails], list[Any]]:
+        """Validate a batch of rows in a single pydantic-core call.
+
+        Args:
+            rows (Sequence[dict[Any, Any]]): The rows to validate, as dictionaries, with the
+                missing values of the `pandantic.Optional` fields normalized (see `NullPlan`).
+            plan (ValidationPlan): The prepared plan of the schema.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            max_errors (Optional[int], optional): The maximum number of error details to return.
+                Defaults to 0, None returns all of them.
+            stats (Optional[ValidationStats], optional): The statistics to fill in. Defaults to None.
+            coerce (bool, optional): Whether to return the models of the valid rows as well. If the
+                batch has invalid rows, the valid rows are validated once more to get these.
+                Defaults to False.
+            adapter (Optional[TypeAdapter], optional): The adapter to validate the rows with, e.g.
+                that of a `DtypePlan`, or that of the plan itself for rows whose missing values are
+                not normalized. Defaults to None, the adapter of the `NullPlan` if any.
+
+        Returns:
+            tuple[list[int], list[ErrorDetails], list[Any]]: The (sorted) positions within `rows`
+                of the rows that failed validation, the details of (up to `max_errors` of) their
+                errors, and the models of the valid rows (only if `coerce`).
+        """
+        if adapter is None:
+            adapter = plan.nulls.adapter if plan.nulls is not None else plan.adapter
+        try:
+            with timer(stats, "validation"):
+                models = adapter.validate_python(rows, context=context)
+        except ValidationError as exc:
+            details = exc.errors(
+                include_url=False, include_context=False, include_input=max_errors != 0
+            )
+            if stats is not None:
+                stats.add_errors(details)
+            positions = sorted({int(error["loc"][0]) for error in details})
+            models = []
+            if coerce:
+                invalid = set(positions)
+                with timer(stats, "validation"):
+                    models = adapter.validate_python(
+                        [row for position, row in enumerate(rows) if position not in invalid],
+                        context=context,
+                    )
+            return positions, details[:max_errors] if max_errors is not None else details, models
+        return [], [], models if coerce else []
+
+    def _validate_models(
+        self,
+        rows: Sequence[dict[Any, Any]],
+        labels: Union[Sequence[Hashable], pd.Index],
+        plan: ValidationPlan,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        verbose: bool = True,
+        stats: Optional[ValidationStats] = None,
+        location: str = "index",
+    ) -> list[tuple[Hashable, SchemaTypes]]:
+        """Validate a batch of rows in a single pydantic-core call and return their models.
+
+        If the batch has invalid rows, these are left out and the valid rows are validated once
+        more, again in a single call.
+
+        Args:
+            rows (Sequence[dict[Any, Any]]): The rows to validate, as dictionaries.
+            labels (Union[Sequence[Hashable], pd.Index]): The label of each row, e.g. its index
+                or row number.
+            plan (ValidationPlan): The prepared plan of the schema.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            verbose (bool, optional): Whether to log the invalid rows. Defaults to True.
+            stats (Optional[ValidationStats], optional): The statistics to fill in. Defaults to None.
+            location (str, optional): What the labels are, in the logged messages. Defaults to "index".
+
+        Returns:
+            list[tuple[Hashable, SchemaTypes]]: The labels and models of the valid rows.
+        """
+        try:
+            with timer(stats, "validation"):
+                return list(zip(labels, plan.adapter.validate_python(rows, context=context)))
+        except ValidationError as exc:
+            details = exc.errors(include_url=False, include_context=False, include_input=False)
+            invalid: set[Any] = {error["loc"][0] for error in details}
+        if stats is not None:
+            stats.invalid_rows += len(invalid)
+            stats.add_errors(details)
+
+        if verbose:
+            for position in sorted(invalid):
+                try:
+                    self.schema.model_validate(obj=rows[position], context=context)
+                except ValidationError as e:
+                    logging.info(
+                        f"Validation error found at {location} {labels[position]}, skipping: {e}."
+                    )
+
+        valid = [position for position in range(len(rows)) if position not in invalid]
+        with timer(stats, "validation"):
+            return list(
+                zip(
+                    [labels[position] for position in valid],
+                    plan.adapter.validate_python(
+                        [rows[position] for position in valid], context=context
+                    ),
+                )
+            )
@@ -0,0 +1,154 @@
+"""Column-wise assembly of a DataFrame of the coerced values of a schema.
+
+With `output="coerced"`, validation returns the values as pydantic coerced them (e.g. strings
+parsed to ints, defaults filled in, values transformed by custom validators) rather than the
+original DataFrame. A `CoercionPlan` collects these values column by column from the models of a
+batched validation call, without dumping each model to a dictionary, and casts every column to
+the dtype of its field annotation.
+"""
+
+from __future__ import annotations
+
+import operator
+import types
+import typing
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pandantic.types import SchemaTypes
+from pandantic.validators.vectorized import compile_columnar_plan
+
+
+# the dtypes of the field annotations, without and with missing values
+_DTYPES: dict[Any, tuple[str, str]] = {
+    int: ("int64", "Int64"),
+    float: ("float64", "float64"),
+    bool: ("bool", "boolean"),
+    str: ("string", "string"),
+}
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    """Return the annotation without `None`, and whether it allowed `None`."""
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        args = typing.get_args(annotation)
+        if type(None) in args:
+            args = tuple(arg for arg in args if arg is not type(None))
+            return (args[0] if len(args) == 1 else Union[args]), True
+    return annotation, False
+
+
+def field_dtype(field_info: Any) -> Optional[str]:
+    """Return the dtype of the column of a field, or None to leave it to pandas to infer.
+
+    Fields that can be None (`Optional` fields, or fields defaulting to None) get the nullable
+    dtype, e.g. "Int64" for `Optional[int]`.
+    """
+    annotation, nullable = _unwrap_optional(field_info.annotation)
+    if annotation not in _DTYPES:
+        return None
+    dtype, nullable_dtype = _DTYPES[annotation]
+    return nullable_dtype if nullable or field_info.default is None else dtype
+
+
+def _cast(series: pd.Series, dtype: Optional[str]) -> pd.Series:
+    if dtype is None:
+        return series.infer_objects() if series.dtype == object else series
+    try:
+        return series.astype(pd.api.types.pandas_dtype(dtype))
+    except (TypeError, ValueError, OverflowError):
+        # e.g. a None default of a field annotated as `int`, or an int beyond 64 bits
+        return series.infer_objects() if series.dtype == object else series
+
+
+@dataclass(frozen=True)
+class CoercionPlan:
+    """The fields of a schema, and the dtypes of their columns in a coerced DataFrame.
+
+    Attributes:
+        fields (tuple[str, ...]): The names of the fields, in order.
+        dtypes (tuple[Optional[str], ...]): The dtype of each field, None to let pandas infer it.
+        direct (bool): Whether the rows certified by the vectorized plan of the schema can be
+            taken from their columns as they are, i.e. their coerced values are only a cast away.
+    """
+
+    fields: tuple[str, ...]
+    dtypes: tuple[Optional[str], ...]
+    direct: bool
+
+    def columns(self, models: Sequence[Any]) -> list[list[Any]]:
+        """Return the values of the fields of the models, column by column."""
+        if len(self.fields) == 1:
+            (name,) = self.fields
+            return [[getattr(model, name) for model in models]]
+        if not models:
+            return [[] for _ in self.fields]
+        rows = map(operator.attrgetter(*self.fields), models)
+        return [list(column) for column in zip(*rows)]
+
+    def assemble(
+        self,
+        dataframe: pd.DataFrame,
+        certified: np.ndarray,
+        validated: np.ndarray,
+        columns: list[list[Any]],
+    ) -> pd.DataFrame:
+        """Assemble the coerced DataFrame of the valid rows, with a positional index.
+
+        Args:
+            dataframe (pd.DataFrame): The validated DataFrame, indexed by position.
+            certified (np.ndarray): The positions of the rows certified by the vectorized plan,
+                whose values are taken from their columns (only if `direct`).
+            validated (np.ndarray): The positions of the valid rows validated by pydantic.
+            columns (list[list[Any]]): The coerced values of these rows, column by column.
+
+        Returns:
+            pd.DataFrame: The coerced values of all valid rows, in order of position.
+        """
+        data = {}
+        for name, dtype, values in zip(self.fields, self.dtypes, columns):
+            series = _cast(pd.Series(values, index=validated, dtype=object), dtype)
+            if len(certified) > 0:
+                column = dataframe[name].take(certified)
+                if dtype is None and column.hasnans:
+                    # the missing values of a `pandantic.Optional` field are coerced to None
+                    column = column.astype(object).mask(column.isna(), None)
+                column = _cast(column, dtype)
+                series = (
+                    column
+                    if len(validated) == 0
+                    else _cast(pd.concat([column, series]).sort_index(), dtype)
+                )
+            data[name] = series
+        if not data:
+            return pd.DataFrame(index=np.sort(np.concatenate([certified, validated])))
+        return pd.DataFrame(data)
+
+
+def compile_coercion_plan(schema: SchemaTypes) -> CoercionPlan:
+    """Compile a schema into a CoercionPlan.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+
+    Returns:
+        CoercionPlan: The compiled plan.
+    """
+    fields = tuple(schema.model_fields)
+    direct = compile_columnar_plan(schema) is not None and not any(
+        isinstance(annotation, type) and issubclass(annotation, Enum)
+        for annotation in (
+            _unwrap_optional(field_info.annotation)[0]
+            for field_info in schema.model_fields.values()
+        )
+    )
+    return CoercionPlan(
+        fields=fields,
+        dtypes=tuple(field_dtype(field_info) for field_info in schema.model_fields.values()),
+        direct=direct,
+    )
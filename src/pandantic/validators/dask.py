@@ -0,0 +1,167 @@
+import logging
+from collections.abc import Hashable, Iterable
+from typing import Any, Literal, Optional, Union
+
+import dask.dataframe as dd
+import pandas as pd
+
+from pandantic.types import SchemaTypes
+from pandantic.validators.base import BaseValidator
+from pandantic.validators.pandas import PandasValidator
+
+
+def _partition_mask(
+    partition: pd.DataFrame,
+    schema: SchemaTypes,
+    errors: Literal["skip", "raise", "log"],
+    strict: bool,
+    context: Optional[dict[str, Any]],  # pylint: disable=consider-alternative-union-syntax
+    kwargs: dict[str, Any],
+) -> pd.Series:
+    """Validate a single partition with the pandas engine and return its validity mask.
+
+    NOTE: this is a module level function, so it can be pickled by the process scheduler.
+    """
+    valid = PandasValidator(schema).validity_mask(
+        partition, errors=errors, strict=strict, context=context, **kwargs
+    )
+    return pd.Series(valid, index=partition.index, name="valid", dtype=bool)
+
+
+class DaskValidator(BaseValidator):
+    """Validates Dask DataFrames partition by partition, with the pandas engine per partition.
+
+    All methods are lazy: they return Dask collections that validate the partitions once they
+    are computed (on any scheduler), so a DataFrame larger than memory is never collected.
+    """
+
+    def __init__(self, schema: SchemaTypes):
+        self.schema = schema
+
+    def validity_mask(
+        self,
+        dataframe: dd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        **kwargs: Any,
+    ) -> dd.Series:
+        """Return a lazy boolean Series, partitioned like the DataFrame, of the valid rows.
+
+        Args:
+            dataframe (dd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+                NOTE: with "raise", the error is raised when the mask is computed.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            **kwargs: Passed on to the pandas engine of each partition (e.g. chunk_size, dedupe).
+
+        Returns:
+            dd.Series: The validity of each row, with the index of the DataFrame.
+        """
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        # the mask has the index of the DataFrame, so that filtering with it needs no reindexing
+        index = dataframe._meta.index  # pylint: disable=protected-access
+        return dataframe.map_partitions(
+            _partition_mask,
+            self.schema,
+            errors,
+            strict,
+            context,
+            kwargs,
+            meta=pd.Series([], index=index, dtype=bool, name="valid"),
+        )
+
+    def validate(
+        self,
+        dataframe: dd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        **kwargs: Any,
+    ) -> dd.DataFrame:
+        """Validate a Dask DataFrame using the schema defined in the Pydantic model.
+
+        Args:
+            dataframe (dd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "raise".
+                NOTE: "skip" and "log" effectively filter the dataframe, excluding invalid rows.
+                With "raise", the error is raised when the DataFrame is computed.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            **kwargs: Passed on to the pandas engine of each partition (e.g. chunk_size, dedupe).
+
+        Returns:
+            dd.DataFrame: The lazily validated (and, if errors="skip" or "log", filtered) DataFrame.
+        """
+        valid, _ = self.validate_count(
+            dataframe, errors=errors, strict=strict, context=context, **kwargs
+        )
+        return valid
+
+    def validate_count(
+        self,
+        dataframe: dd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        **kwargs: Any,
+    ) -> tuple[dd.DataFrame, Any]:
+        """Validate a Dask DataFrame and count its invalid rows.
+
+        Both results derive from the same validity mask, so computing them together (e.g. with
+        `dask.compute(valid, count)`) validates each partition only once.
+
+        Args:
+            dataframe (dd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            **kwargs: Passed on to the pandas engine of each partition (e.g. chunk_size, dedupe).
+
+        Returns:
+            tuple[dd.DataFrame, Any]: The lazily filtered DataFrame, and a lazy scalar with the
+                number of invalid rows of all partitions.
+        """
+        mask = self.validity_mask(
+            dataframe, errors=errors, strict=strict, context=context, **kwargs
+        )
+        return dataframe[mask], (~mask).sum()
+
+    def split(
+        self,
+        dataframe: dd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        **kwargs: Any,
+    ) -> tuple[dd.DataFrame, dd.DataFrame]:
+        """Validate a Dask DataFrame and lazily split it into its valid and its invalid rows."""
+        mask = self.validity_mask(dataframe, errors=errors, **kwargs)
+        return dataframe[mask], dataframe[~mask]
+
+    def iterate(
+        self,
+        dataframe: dd.DataFrame,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        verbose: bool = True,
+        **kwargs: Any,
+    ) -> Iterable[Union[tuple[Hashable, SchemaTypes], list[tuple[Hashable, SchemaTypes]]]]:
+        """Iterate over a Dask DataFrame and yield validated schema models.
+
+        The partitions are computed one at a time, so only a single partition is held in memory.
+        The `**kwargs` are passed on to `PandasValidator.iterate`, e.g. `batch_size`.
+        """
+        validator = PandasValidator(self.schema)
+        for number in range(dataframe.npartitions):
+            partition = dataframe.get_partition(number).compute()
+            logging.debug("Validating partition %s of %s", number + 1, dataframe.npartitions)
+            yield from validator.iterate(partition, context=context, verbose=verbose, **kwargs)
@@ -0,0 +1,240 @@
+"""Fields whose values are guaranteed to be valid by the dtype of their column.
+
+A field annotated as a plain `int` (without constraints or custom validators) accepts every value
+of an `int64` column, so validating its values one by one is redundant. A `DtypePlan` compares
+the dtypes of the columns to the field annotations once per chunk, and marks the fields it can
+guarantee as pre-validated. These fields are validated as `Any` by a copy of the schema, and are
+left out of the row dictionaries altogether if no validator could look at them (the other fields
+are then validated without them). If all fields of a schema without custom validators are
+pre-validated, all rows are valid without any row-wise validation at all.
+
+Like the other plans, the comparison is conservative: a field is only pre-validated if pydantic
+would accept each value of its column *as is*, so the validated models hold the same values.
+"""
+
+from __future__ import annotations
+
+import datetime
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from pandantic.types import SchemaTypes
+from pandantic.types_pandantic import is_nan_to_none
+from pandantic.validators.unique import _fields_model, _reads_other_fields
+from pandantic.validators.vectorized import _has_custom_validators, _supports_config
+
+
+# the dtype kinds whose values are accepted as is by a field of the annotation
+_KINDS: dict[Any, str] = {
+    int: "iu",
+    float: "f",
+    bool: "b",
+    datetime.datetime: "M",
+    pd.Timestamp: "M",
+}
+
+
+@dataclass(frozen=True)
+class DtypePlan:
+    """The fields of a schema guaranteed to be valid by the dtypes of the columns of a DataFrame.
+
+    Attributes:
+        fields (tuple[str, ...]): The pre-validated fields.
+        exclude (frozenset[str]): The columns of the pre-validated fields that can be left out of
+            the row dictionaries, as no validator could look at them.
+        complete (bool): Whether all rows are valid, i.e. all fields are pre-validated and the
+            schema has no custom validators.
+        candidates (DtypeCandidates): The schema level part of the plan, holding its adapters.
+    """
+
+    fields: tuple[str, ...]
+    exclude: frozenset[str]
+    complete: bool
+    candidates: DtypeCandidates = field(repr=False, compare=False)
+
+    def adapter(self, exclude: frozenset[str] = frozenset()) -> TypeAdapter:  # type: ignore[type-arg]
+        """Return the adapter validating a `list` of rows, which accepts any value of the
+        pre-validated fields.
+
+        Args:
+            exclude (frozenset[str], optional): The columns left out of the rows, either none or
+                all of `self.exclude`. Defaults to none.
+
+        Returns:
+            TypeAdapter: The (cached) adapter.
+        """
+        return self.candidates.adapter(self.fields, exclude)
+
+
+@dataclass(frozen=True)
+class DtypeCandidates:
+    """The fields of a schema that could be guaranteed by the dtypes of their columns.
+
+    Prepared once per schema and held by its `ValidationPlan`, so that the `plan_cache` bounds
+    (and clears) the adapters built for the DataFrames it is resolved against.
+
+    Attributes:
+        model (type[BaseModel]): The model the rows are validated with, the schema itself or e.g.
+            that of its `NullPlan`.
+        fields (dict[str, tuple[Any, bool]]): The candidate fields, with their annotation and
+            whether they are `pandantic.Optional` fields.
+        isolated (bool): Whether no validator of the schema could look at the other fields.
+        custom_validators (bool): Whether the schema has any custom validators.
+    """
+
+    model: type[BaseModel]
+    fields: dict[str, tuple[Any, bool]]
+    isolated: bool
+    custom_validators: bool
+    _adapters: dict[tuple[Any, ...], TypeAdapter] = field(  # type: ignore[type-arg]
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def resolve(self, dataframe: pd.DataFrame) -> Optional[DtypePlan]:
+        """Compare the dtypes of the columns of a DataFrame to the candidate fields.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame (or chunk) to validate, before the missing
+                values of its `pandantic.Optional` fields are normalized.
+
+        Returns:
+            Optional[DtypePlan]: The plan, or None if no field is guaranteed by the dtype of its
+                column.
+        """
+        fields = []
+        for name, (annotation, nullable) in self.fields.items():
+            if name not in dataframe.columns:
+                continue
+            series = dataframe[name]
+            if isinstance(series, pd.Series) and _guarantees(annotation, nullable, series):
+                fields.append(name)
+        if not fields:
+            return None
+
+        return DtypePlan(
+            fields=tuple(fields),
+            exclude=frozenset(fields) if self.isolated else frozenset(),
+            complete=len(fields) == len(self.model.model_fields) and not self.custom_validators,
+            candidates=self,
+        )
+
+    def adapter(
+        self, fields: tuple[str, ...], exclude: frozenset[str]
+    ) -> TypeAdapter:  # type: ignore[type-arg]
+        """Return the (cached) adapter of a copy of the model for the pre-validated fields."""
+        key = (fields, exclude)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            if exclude:
+                # no validator looks at the excluded fields, so the other fields are validated
+                # on their own, rather than with a made up value of the excluded fields
+                remaining = [name for name in self.model.model_fields if name not in exclude]
+                model = _fields_model(self.model, remaining, self.model.__name__)
+            else:
+                # a subclass keeps the config, validators and error titles of the model
+                model = create_model(  # type: ignore[call-overload]
+                    self.model.__name__,
+                    __base__=self.model,
+                    __module__=self.model.__module__,
+                    **{name: (Any, ...) for name in fields},
+                )
+            adapter = self._adapters[key] = TypeAdapter(list[model])  # type: ignore[valid-type]
+        return adapter
+
+
+def _unwrap(field_info: Any) -> tuple[Any, bool]:
+    """Return the annotation of a field without `None`, and whether it is a `pandantic.Optional`
+    field, whose missing values are normalized to None (see `NullPlan`)."""
+    annotation = field_info.annotation
+    nullable = any(is_nan_to_none(metadata) for metadata in field_info.metadata)
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    return annotation, nullable
+
+
+def _candidates(schema: SchemaTypes) -> dict[str, tuple[Any, bool]]:
+    """Return the fields of the schema that could be guaranteed by a dtype, with their annotation
+    and whether they are `pandantic.Optional` fields."""
+    if not _supports_config(schema):
+        return {}
+    validated_fields = {
+        name
+        for decorator in schema.__pydantic_decorators__.field_validators.values()
+        for name in decorator.info.fields
+    }
+    validated_fields.update(
+        name
+        for decorator in schema.__pydantic_decorators__.validators.values()
+        for name in decorator.info.fields
+    )
+    if "*" in validated_fields:
+        return {}
+
+    candidates = {}
+    for name, field_info in schema.model_fields.items():
+        if name in validated_fields:
+            continue
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            continue
+        annotation, nullable = _unwrap(field_info)
+        constraints = [metadata for metadata in field_info.metadata if not is_nan_to_none(metadata)]
+        if constraints or (annotation is not str and annotation not in _KINDS):
+            continue
+        candidates[name] = (annotation, nullable)
+    return candidates
+
+
+def _guarantees(annotation: Any, nullable: bool, series: pd.Series) -> bool:
+    """Return whether every value of the column is accepted as is by the field."""
+    dtype = series.dtype
+    if annotation is str:
+        if not isinstance(dtype, pd.StringDtype):
+            return False
+    elif dtype.kind not in _KINDS[annotation] or isinstance(dtype, pd.CategoricalDtype):
+        return False
+    # missing values are None for `pandantic.Optional` fields, and NaN is a valid float
+    if nullable or (annotation is float and isinstance(dtype, np.dtype)):
+        return True
+    return not series.hasnans
+
+
+def _is_isolated(schema: SchemaTypes) -> bool:
+    """Return whether no validator of the schema could look at the values of other fields."""
+    decorators = schema.__pydantic_decorators__
+    if decorators.validators or decorators.root_validators or decorators.model_validators:
+        return False
+    if schema.model_post_init is not BaseModel.model_post_init:
+        return False
+    return not _reads_other_fields(schema)
+
+
+def compile_dtype_candidates(
+    schema: SchemaTypes, model: Optional[type[BaseModel]] = None
+) -> Optional[DtypeCandidates]:
+    """Compile the fields of a schema that could be guaranteed by the dtypes of their columns.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+        model (Optional[type[BaseModel]], optional): The model the rows are validated with, if
+            not the schema itself (e.g. that of the `NullPlan`). Defaults to None.
+
+    Returns:
+        Optional[DtypeCandidates]: The candidates, or None if no field of the schema could be
+            guaranteed by a dtype.
+    """
+    fields = _candidates(schema)
+    if not fields:
+        return None
+    return DtypeCandidates(
+        model=model or schema,
+        fields=fields,
+        isolated=_is_isolated(schema),
+        custom_validators=_has_custom_validators(schema),
+    )
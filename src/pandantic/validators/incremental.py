@@ -0,0 +1,132 @@
+import copy
+import logging
+from typing import Any, Literal, Optional
+
+import numpy as np
+import pandas as pd
+
+from pandantic.types import SchemaTypes
+from pandantic.validators.pandas import PandasValidator, _hash_rows
+
+
+# the stored context of a context that cannot be copied
+_UNCOPYABLE = object()
+
+
+class IncrementalValidator:
+    """Validate successive versions of a DataFrame, only re-validating the rows that changed.
+
+    The validity of the rows of the last call is stored by the hash of their content (not their
+    index), so only rows with a new hash are validated again, e.g. appended or updated rows. The
+    stored validity is discarded whenever the columns, their dtypes or the context (compared to a
+    deep copy) change, so schemas depending on anything else (e.g. the date) do not fit.
+
+    Args:
+        schema (SchemaTypes): The schema to validate against.
+    """
+
+    def __init__(self, schema: SchemaTypes):
+        self.schema = schema
+        self._validator = PandasValidator(schema=schema)
+        self._key: Optional[tuple[Any, ...]] = None
+        self._context: Any = None
+        # sorted, unique row hashes and the validity of the rows
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._valid = np.empty(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def reset(self) -> None:
+        """Forget the stored validity, so that the next call validates all rows."""
+        self._key = None
+        self._context = None
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._valid = np.empty(0, dtype=bool)
+
+    @staticmethod
+    def _snapshot(context: Optional[dict[str, Any]]) -> Any:
+        """Return a copy of the context, so that changing it in place does not change the copy."""
+        try:
+            return copy.deepcopy(context)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. a context holding a connection, which is then never considered the same
+            return _UNCOPYABLE
+
+    def _same_context(self, context: Optional[dict[str, Any]]) -> bool:
+        """Return whether the context equals that of the last call."""
+        if self._context is _UNCOPYABLE:
+            return False
+        try:
+            return bool(context == self._context)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. values without a boolean comparison, such as arrays
+            return False
+
+    def _lookup(self, hashes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return which of the hashes are known, and whether their rows are valid."""
+        if len(self._hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool), np.zeros(len(hashes), dtype=bool)
+        positions = np.minimum(np.searchsorted(self._hashes, hashes), len(self._hashes) - 1)
+        known = self._hashes[positions] == hashes
+        return known, known & self._valid[positions]
+
+    def validate(
+        self,
+        dataframe: pd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Validate a DataFrame, re-validating only the rows that are new or changed.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "raise".
+                NOTE: "skip" and "log" effectively filter the dataframe, excluding invalid rows.
+                Known invalid rows are validated again with "raise" or "log", for their errors.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            n_jobs (int, optional): The number of processes to use for validation. Defaults to 1.
+            chunk_size (Optional[int], optional): The number of rows validated per task. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The original DataFrame if errors="raise", or a filtered DataFrame with valid rows if errors="skip" or "log".
+        """
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        key = (tuple(dataframe.columns), tuple(dataframe.dtypes))
+        if key != self._key or not self._same_context(context):
+            self.reset()
+
+        hashes = _hash_rows(dataframe)
+        known, valid = self._lookup(hashes)
+
+        # rows known to be invalid have to be validated again to raise or log their errors
+        pending = np.flatnonzero(~valid if errors != "skip" else ~known)
+        logging.debug("# rows to re-validate: %s of %s", len(pending), len(dataframe))
+
+        valid[pending] = self._validator._valid_mask(  # pylint: disable=protected-access
+            dataframe.iloc[pending],
+            errors=errors,
+            strict=strict,
+            context=context,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+        )
+
+        # only the rows of the latest DataFrame are kept, so the state never outgrows it
+        self._hashes, first = np.unique(hashes, return_index=True)
+        self._valid = valid[first]
+        self._key, self._context = key, self._snapshot(context)
+
+        logging.debug("# invalid rows: %s", np.count_nonzero(~valid))
+
+        if errors in ["skip", "log"] and not valid.all():
+            return dataframe[valid]
+        return dataframe
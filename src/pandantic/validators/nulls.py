@@ -0,0 +1,121 @@
+"""Vectorized normalization of the missing values of `pandantic.Optional` fields.
+
+`pandantic.Optional` fields coerce missing values to None with a `BeforeValidator`, a python call
+for every single value. A `NullPlan` instead replaces all missing values of pandas (NaN, None,
+`pd.NA` and `pd.NaT`) in the columns of these fields by None in one vectorized pass per column,
+and validates the rows with a copy of the schema without the per-value validators.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from pandantic.types import SchemaTypes
+from pandantic.types_pandantic import is_nan_to_none
+
+
+@dataclass(frozen=True)
+class NullPlan:
+    """The columns whose missing values are normalized to None before validation."""
+
+    columns: tuple[str, ...]
+    adapter: TypeAdapter  # type: ignore[type-arg]
+    # the copy of the schema validating the normalized rows
+    model: type[BaseModel]
+
+    def normalize(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Return the DataFrame with the missing values of the columns replaced by None.
+
+        The DataFrame itself is left as is, only the columns with missing values are replaced in
+        a (shallow) copy of it.
+        """
+        normalized = None
+        # by position (in a copy labelled by position), as a label may be duplicated
+        for position in np.flatnonzero(dataframe.columns.isin(self.columns)).tolist():
+            series = dataframe.iloc[:, position]
+            missing = series.isna().to_numpy(dtype=bool)
+            if not missing.any():
+                continue
+            values = series.astype(object).to_numpy(copy=True)
+            values[missing] = None
+            if normalized is None:
+                normalized = dataframe.copy(deep=False)
+                normalized.columns = pd.RangeIndex(len(dataframe.columns))
+            normalized[position] = pd.Series(values, index=dataframe.index, dtype=object)
+        if normalized is None:
+            return dataframe
+        normalized.columns = dataframe.columns
+        return normalized
+
+
+def _sees_raw_values(schema: SchemaTypes, name: str) -> bool:
+    """Return whether a custom validator of the schema sees the value of a field before it is
+    coerced, so that it could tell NaN from None."""
+    decorators = schema.__pydantic_decorators__
+    if any(decorator.info.mode != "after" for decorator in decorators.model_validators.values()):
+        return True
+    if any(decorator.info.mode != "after" for decorator in decorators.root_validators.values()):
+        return True
+    if any(
+        decorator.info.mode != "after"
+        and (name in decorator.info.fields or "*" in decorator.info.fields)
+        for decorator in decorators.validators.values()
+    ):
+        return True
+    return any(
+        decorator.info.mode != "after"
+        and (name in decorator.info.fields or "*" in decorator.info.fields)
+        for decorator in decorators.field_validators.values()
+    )
+
+
+def nullable_fields(schema: SchemaTypes) -> tuple[str, ...]:
+    """Return the names of the `pandantic.Optional` fields of the schema."""
+    return tuple(
+        name
+        for name, field_info in schema.model_fields.items()
+        if any(is_nan_to_none(metadata) for metadata in field_info.metadata)
+    )
+
+
+def _without_nan_to_none(field_info: Any) -> Any:
+    field_info = copy.copy(field_info)
+    field_info.metadata = [
+        metadata for metadata in field_info.metadata if not is_nan_to_none(metadata)
+    ]
+    return field_info
+
+
+def compile_null_plan(schema: SchemaTypes) -> Optional[NullPlan]:
+    """Compile a schema into a NullPlan.
+
+    Fields whose custom validators see their values before coercion (e.g. `mode="before"`) are
+    left to the per-value validator, as these validators could treat NaN differently from None.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+
+    Returns:
+        Optional[NullPlan]: The compiled plan, or None if the schema has no fields to normalize.
+    """
+    columns = tuple(name for name in nullable_fields(schema) if not _sees_raw_values(schema, name))
+    if not columns:
+        return None
+
+    fields = {}
+    for name in columns:
+        field_info = _without_nan_to_none(schema.model_fields[name])
+        fields[name] = (field_info.annotation, field_info)
+    # a subclass keeps the config, validators and error titles of the schema
+    model = create_model(  # type: ignore[call-overload]
+        schema.__name__, __base__=schema, __module__=schema.__module__, **fields
+    )
+    return NullPlan(
+        columns=columns, adapter=TypeAdapter(list[model]), model=model  # type: ignore[valid-type]
+    )
@@ -1,24 +1,465 @@
+import contextlib
 import logging
 import math
 import os
-from collections.abc import Hashable, Iterable
-from typing import Any, Literal, Optional
+import time
+import warnings
+from collections.abc import Generator, Hashable, Iterable, Sequence
+from typing import Any, Literal, Optional, Union
 
+import numpy as np
 import pandas as pd
-from multiprocess import (  # type:ignore # pylint: disable=no-name-in-module
-    Process,
-    Queue,
-)
 from pydantic import ValidationError
+from pydantic_core import ErrorDetails
 
+from pandantic.cache import ValidationPlan, plan_cache
+from pandantic.sampling import Sample, SampleReport, estimate
+from pandantic.stats import ValidationStats, timer
 from pandantic.types import SchemaTypes
-from pandantic.validators.base import BaseValidator
+from pandantic.validators.base import BATCH_SIZE, BaseValidator
+from pandantic.validators.coerced import CoercionPlan, compile_coercion_plan
+
+
+# number of chunks scheduled per process when no chunk_size is given
+CHUNKS_PER_JOB = 8
+# columns of the errors DataFrame returned by `validate_report`
+ERROR_COLUMNS = ["index", "loc", "type", "msg", "input"]
+
+# state of a worker process, set once by `_init_worker`
+_worker_validator: Optional["PandasValidator"] = None
+_worker_context: Optional[dict[str, Any]] = None
+_worker_max_errors: Optional[int] = 0
+_worker_collect_stats: bool = False
+_worker_coercion: Optional[CoercionPlan] = None
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Resolve `n_jobs` to a number of processes, counting back from all cores if negative."""
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _init_worker(
+    validator: "PandasValidator",
+    context: Optional[
+        dict[str, Any]
+    ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+    max_errors: Optional[int] = 0,
+    collect_stats: bool = False,
+    coercion: Optional[CoercionPlan] = None,
+) -> None:
+    global _worker_validator, _worker_context, _worker_max_errors  # pylint: disable=global-statement
+    global _worker_collect_stats, _worker_coercion  # pylint: disable=global-statement
+    _worker_validator, _worker_context, _worker_max_errors = validator, context, max_errors
+    _worker_collect_stats, _worker_coercion = collect_stats, coercion
+
+
+def _box(value: Any) -> Any:
+    """Convert a NumPy scalar to its python (or pandas) equivalent, like `DataFrame.to_dict`."""
+    if isinstance(value, np.datetime64):
+        return pd.Timestamp(value)
+    if isinstance(value, np.timedelta64):
+        return pd.Timedelta(value)
+    return value.item()
+
+
+def _records(
+    chunk: pd.DataFrame, exclude: frozenset[Hashable] = frozenset()
+) -> list[dict[Hashable, Any]]:
+    """Convert a chunk of a DataFrame to a list of row dictionaries, like `to_dict("records")`.
+
+    The values are extracted column by column (`tolist` boxes them in bulk), rather than cell by
+    cell, only NumPy scalars stored in object columns and missing values of nullable dtypes are
+    converted one by one. The columns in `exclude` are left out.
+    """
+    keys = []
+    columns = []
+    for position in range(chunk.shape[1]):
+        if chunk.columns[position] in exclude:
+            continue
+        keys.append(chunk.columns[position])
+        series = chunk.iloc[:, position]
+        values = series.tolist()
+        if series.dtype == object:
+            if any(isinstance(value, np.generic) for value in values):
+                values = [
+                    _box(value) if isinstance(value, np.generic) else value for value in values
+                ]
+        elif isinstance(series.dtype, pd.api.extensions.ExtensionDtype) and series.hasnans:
+            # the missing values of nullable dtypes (e.g. "Int64") are None, not pd.NA
+            values = [None if value is pd.NA else value for value in values]
+        columns.append(values)
+    if not columns:
+        return [{} for _ in range(len(chunk))]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def _serialize(value: Any) -> str:
+    """Return a string telling apart the values pydantic could validate differently."""
+    return f"{type(value).__module__}.{type(value).__qualname__}:{value!r}"
+
+
+def _hash_rows(dataframe: pd.DataFrame) -> np.ndarray:
+    """Return a 64 bit hash of the content of each row of the DataFrame (without its index).
+
+    `pd.util.hash_pandas_object` hashes python objects by their string value, so that e.g. 1,
+    1.0, "1" and True hash the same, and fails on unhashable objects such as lists and dicts.
+    The values of object columns (other than plain strings) are hashed by their type and `repr`.
+    """
+    columns = {}
+    for position in range(dataframe.shape[1]):
+        series = dataframe.iloc[:, position]
+        dtype = series.dtype
+        values = series.cat.categories if isinstance(dtype, pd.CategoricalDtype) else series
+        if values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) != "string":
+            series = series.astype(object).map(_serialize)
+        columns[position] = series
+    return pd.util.hash_pandas_object(
+        pd.DataFrame(columns, index=dataframe.index, copy=False), index=False
+    ).to_numpy()
+
+
+def _positional(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Return a shallow copy of the DataFrame indexed by position, to track its rows by position
+    through the chunks."""
+    positional = dataframe.copy(deep=False)
+    positional.index = pd.RangeIndex(len(dataframe))
+    return positional
+
+
+class _Chunks(Sequence[pd.DataFrame]):
+    """The rows of a DataFrame (at the given positions, or all of them) in chunks.
+
+    A chunk is only sliced (or, with positions, copied) from the DataFrame when it is accessed,
+    so there is never more than a chunk of rows copied at once.
+    """
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        positions: Optional[np.ndarray],
+        chunk_size: int,
+    ):
+        self.dataframe = dataframe
+        self.positions = positions
+        self.chunk_size = chunk_size
+        self.rows = len(dataframe) if positions is None else len(positions)
+
+    def __len__(self) -> int:
+        return math.ceil(self.rows / self.chunk_size)
+
+    def __getitem__(self, number: int) -> pd.DataFrame:  # type: ignore[override]
+        if not 0 <= number < len(self):
+            raise IndexError("chunk number out of range")
+        start = number * self.chunk_size
+        if self.positions is None:
+            return self.dataframe.iloc[start : start + self.chunk_size]
+        return self.dataframe.take(self.positions[start : start + self.chunk_size])
+
+
+def _validate_chunk_in_worker(
+    task: tuple[int, pd.DataFrame]
+) -> tuple[
+    int,
+    list[int],
+    list[ErrorDetails],
+    Optional[list[list[Any]]],
+    Optional[ValidationStats],
+    float,
+]:
+    assert _worker_validator is not None, "Worker process was not initialized."
+    number, chunk = task
+    stats = ValidationStats() if _worker_collect_stats else None
+    start = time.perf_counter()
+    (
+        positions,
+        details,
+        columns,
+    ) = _worker_validator._validate_chunk(  # pylint: disable=protected-access
+        chunk,
+        context=_worker_context,
+        max_errors=_worker_max_errors,
+        stats=stats,
+        coercion=_worker_coercion,
+    )
+    finished = time.perf_counter()
+    if stats is not None:
+        stats.worker_busy[os.getpid()] = finished - start
+    return number, positions, details, columns, stats, finished
 
 
 class PandasValidator(BaseValidator):
     def __init__(self, schema: SchemaTypes):
         self.schema = schema
 
+    def _validate_chunk(
+        self,
+        chunk: pd.DataFrame,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        max_errors: Optional[int] = 0,
+        stats: Optional[ValidationStats] = None,
+        coercion: Optional[CoercionPlan] = None,
+    ) -> tuple[list[int], list[ErrorDetails], Optional[list[list[Any]]]]:
+        """Validate a single chunk of a DataFrame.
+
+        Args:
+            chunk (pd.DataFrame): The DataFrame chunk to validate.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            max_errors (Optional[int], optional): The maximum number of error details to return. Defaults to 0.
+            stats (Optional[ValidationStats], optional): The statistics to fill in. Defaults to None.
+            coercion (Optional[CoercionPlan], optional): If given, the coerced values of the valid
+                rows are returned as well. Defaults to None.
+
+        Returns:
+            tuple[list[int], list[ErrorDetails], Optional[list[list[Any]]]]: The (sorted) positions
+                within the chunk of the rows that failed validation, the details of (up to
+                `max_errors` of) their errors, and the coerced values of the valid rows, column by
+                column (only with `coercion`).
+        """
+        plan = plan_cache.get(self.schema, chunk.columns)
+        # fields guaranteed by the dtypes of their columns are not validated row by row
+        dtypes = plan.dtypes.resolve(chunk) if plan.dtypes is not None else None
+        with timer(stats, "conversion"):
+            if plan.nulls is not None:
+                chunk = plan.nulls.normalize(chunk)
+            # the coerced values of all fields are taken from the models
+            exclude = dtypes.exclude if dtypes is not None and coercion is None else frozenset()
+            rows = _records(chunk, exclude=exclude)
+        positions, details, models = self._validate_batch(
+            rows,
+            plan=plan,
+            context=context,
+            max_errors=max_errors,
+            stats=stats,
+            coerce=coercion is not None,
+            adapter=dtypes.adapter(exclude) if dtypes is not None else None,
+        )
+        if coercion is None:
+            return positions, details, None
+        with timer(stats, "assembly"):
+            return positions, details, coercion.columns(models)
+
+    def _iter_chunk_results(
+        self,
+        chunks: Sequence[pd.DataFrame],
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        max_errors: Optional[int] = 0,
+        ordered: bool = True,
+        stats: Optional[ValidationStats] = None,
+        coercion: Optional[CoercionPlan] = None,
+    ) -> Generator[
+        tuple[pd.DataFrame, list[int], list[ErrorDetails], Optional[list[list[Any]]]], None, None
+    ]:
+        """Validate the chunks using a pool of (at most) `n_jobs` processes.
+
+        NOTE: the pool is terminated as soon as the generator is closed, which cancels the
+            validation of the remaining chunks.
+
+        Args:
+            ordered (bool, optional): Whether to yield the chunks in order, rather than as soon as
+                they are validated. Defaults to True.
+            stats (Optional[ValidationStats], optional): The statistics to fill in, including those
+                of the worker processes. Defaults to None.
+            coercion (Optional[CoercionPlan], optional): If given, the coerced values of the valid
+                rows of each chunk are collected as well. Defaults to None.
+
+        Yields:
+            tuple[pd.DataFrame, list[int], list[ErrorDetails], Optional[list[list[Any]]]]: Each
+                chunk with the positions of its invalid rows, the details of (up to `max_errors`
+                of) their errors and the coerced values of its valid rows (only with `coercion`).
+        """
+        n_jobs = min(n_jobs, len(chunks))
+        if n_jobs <= 1:
+            for chunk in chunks:
+                yield chunk, *self._validate_chunk(
+                    chunk, context=context, max_errors=max_errors, stats=stats, coercion=coercion
+                )
+            return
+
+        # the multiprocessing machinery is only imported once a pool is needed
+        from multiprocess import (  # type:ignore # pylint: disable=no-name-in-module,import-outside-toplevel
+            Pool,
+        )
+
+        start = time.perf_counter()
+        try:
+            with Pool(
+                processes=n_jobs,
+                initializer=_init_worker,
+                initargs=(self, context, max_errors, stats is not None, coercion),
+            ) as pool:
+                # chunks are handed out one at a time, so a slow chunk never holds up idle workers
+                imap = pool.imap if ordered else pool.imap_unordered
+                for number, positions, details, columns, chunk_stats, finished in imap(
+                    _validate_chunk_in_worker, enumerate(chunks), chunksize=1
+                ):
+                    if stats is not None and chunk_stats is not None:
+                        stats.add_time("transfer", time.perf_counter() - finished)
+                        stats.merge(chunk_stats)
+                    yield chunks[number], positions, details, columns
+        finally:
+            if stats is not None:
+                stats.n_jobs = max(stats.n_jobs, n_jobs)
+                stats.pool_time += time.perf_counter() - start
+
+    def _split_pending(
+        self,
+        dataframe: pd.DataFrame,
+        strict: bool = False,
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        stats: Optional[ValidationStats] = None,
+        coercion: Optional[CoercionPlan] = None,
+    ) -> _Chunks:
+        """Split the rows of the DataFrame that still need row-wise validation into chunks.
+
+        Rows certified by the per-field or vectorized plan of the schema never have to be
+        converted to dictionaries, so they are left out. The chunks are only taken from the
+        DataFrame once they are validated, which bounds the memory use to a chunk per process.
+
+        With `coercion`, only rows certified by the vectorized plan are left out, and only if
+        their coerced values can be taken from their columns as they are.
+
+        Raises:
+            ValueError: If strict mode is enabled and the DataFrame has extra columns.
+        """
+        with timer(stats, "plan"):
+            plan = plan_cache.get(self.schema, dataframe.columns, strict=strict)
+
+        # check for extra columns and handle strict mode
+        self._check_strict(plan, strict)
+
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        logging.debug("Amount of available cores: %s, using: %s", os.cpu_count(), n_jobs)
+
+        pending = None
+        with timer(stats, "certify"):
+            dtypes = plan.dtypes.resolve(dataframe) if plan.dtypes is not None else None
+        # the per-field plan includes the vectorized checks of the columnar plan, if any
+        certifier = plan.unique or plan.columnar
+        if coercion is not None:
+            direct = coercion.direct and set(coercion.fields) <= set(plan.field_columns)
+            certifier = plan.columnar if direct else None
+        if dtypes is not None and dtypes.complete:
+            # the dtypes of the columns guarantee all fields, so all rows are valid as they are
+            pending = np.empty(0, dtype=np.intp)
+        elif certifier is not None:
+            with timer(stats, "certify"):
+                certified = certifier.certify(dataframe)
+            if certified.any():
+                pending = np.flatnonzero(~certified)
+        rows = len(dataframe) if pending is None else len(pending)
+        if stats is not None:
+            stats.rows += len(dataframe)
+            stats.certified_rows += len(dataframe) - rows
+
+        if chunk_size is None:
+            chunk_size = BATCH_SIZE
+            if n_jobs > 1:
+                chunk_size = min(chunk_size, math.ceil(rows / (n_jobs * CHUNKS_PER_JOB)))
+            chunk_size = max(chunk_size, 1)
+        return _Chunks(dataframe, positions=pending, chunk_size=chunk_size)
+
+    def _handle_invalid_rows(
+        self,
+        chunk: pd.DataFrame,
+        positions: list[int],
+        errors: Literal["skip", "raise", "log"],
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+    ) -> list[Hashable]:
+        """Apply the `errors` strategy to the invalid rows of a chunk.
+
+        The invalid rows are validated once more on their own, so that the logged or raised
+        ValidationError refers to the row itself rather than to its position in the chunk.
+
+        Returns:
+            list[Hashable]: The index labels of the invalid rows.
+        """
+        invalid = chunk.iloc[positions]
+        if errors in ["raise", "log"]:
+            for index, row_dict in zip(invalid.index, _records(invalid)):
+                try:
+                    self.schema.model_validate(obj=row_dict, context=context)
+                except ValidationError as exc:
+                    if errors == "raise":
+                        if hasattr(exc, "add_note"):  # python >= 3.11
+                            exc.add_note(f"Validation error found at index {index}")
+                        raise exc
+                    logging.info("Validation error found at index %s\n%s", index, exc)
+        return list(invalid.index)
+
+    def _dedupe_columns(self, plan: ValidationPlan) -> list[Hashable]:
+        """Return the columns that determine the validity of a row.
+
+        These are only the fields of the schema, unless the schema could look at the other
+        columns as well, through model validators or by allowing extra fields.
+        """
+        if (
+            self.schema.__pydantic_decorators__.model_validators
+            or self.schema.model_config.get("extra") == "allow"
+        ):
+            return list(plan.columns)
+        return list(plan.field_columns)
+
+    def _dedupe_valid_mask(
+        self,
+        dataframe: pd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        stats: Optional[ValidationStats] = None,
+    ) -> np.ndarray:
+        """Return the positional validity mask, validating each distinct row only once.
+
+        Identical rows are found by the hash of their content, the validity of the first one
+        (in order of appearance) is broadcast to all of its duplicates.
+        """
+        with timer(stats, "dedupe"):
+            plan = plan_cache.get(self.schema, dataframe.columns, strict=strict)
+            columns = self._dedupe_columns(plan)
+            if columns:
+                hashes = _hash_rows(dataframe[columns])
+            else:
+                # without any of the fields, all rows are the same
+                hashes = np.zeros(len(dataframe), dtype=np.uint64)
+            _, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+
+            # keep the distinct rows in order of appearance, so errors are raised in order as well
+            order = np.argsort(first)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+        logging.debug("# distinct rows: %s of %s", len(first), len(dataframe))
+
+        distinct_mask = self._valid_mask(
+            dataframe.iloc[first[order]],
+            errors=errors,
+            strict=strict,
+            context=context,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            stats=stats,
+        )
+        if stats is not None:
+            # the duplicates are processed as well, through their distinct row
+            stats.rows += len(dataframe) - len(first)
+        return distinct_mask[rank[inverse.reshape(-1)]]
+
     def validate(
         self,
         dataframe: pd.DataFrame,
@@ -28,8 +469,13 @@ class PandasValidator(BaseValidator):
             dict[str, Any]
         ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
         n_jobs: int = 1,
-        queue: Optional[Queue] = None,
-    ) -> pd.DataFrame:
+        queue: Optional[Any] = None,
+        chunk_size: Optional[int] = None,
+        dedupe: bool = False,
+        stats: Optional[ValidationStats] = None,
+        sample: Optional[Union[float, int, Sample]] = None,
+        output: Literal["original", "coerced"] = "original",
+    ) -> Union[pd.DataFrame, SampleReport]:
         """Validate a DataFrame using the schema defined in the Pydantic model.
 
         Args:
@@ -39,128 +485,325 @@ class PandasValidator(BaseValidator):
             strict (bool, default=False): whether to fail validation if extra fields/columns are present.
             context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
             n_jobs (int, optional): The number of processes to use for validation. Defaults to 1.
-            queue (Optional[Queue], optional): A custom Queue object for multiprocessing. Defaults to None.
+                NOTE: -1 uses all available cores, -2 all cores but one, etc.
+            queue (Optional[Any], optional): Deprecated and ignored. Defaults to None.
+            chunk_size (Optional[int], optional): The number of rows validated per task. Defaults to None,
+                which schedules many more chunks than processes to balance the load between them.
+            dedupe (bool, optional): Whether to validate identical rows only once. Defaults to False.
+                NOTE: with errors="log", only the first of identical invalid rows is logged.
+            stats (Optional[ValidationStats], optional): The statistics to fill in, e.g. the time
+                spent per phase and the number of errors per field. Defaults to None.
+            sample (Optional[Union[float, int, Sample]], optional): Validate a random sample only:
+                a fraction of the rows (float), a number of rows (int) or a `Sample`, e.g. to
+                stratify by a column. Defaults to None, which validates all rows.
+                NOTE: the errors of the sample are always collected, errors="raise" does not raise.
+            output (Literal["original", "coerced"], optional): Whether to return (the valid rows of)
+                the original DataFrame, or a new DataFrame of the values as coerced by the schema,
+                with a column per field and dtypes following the field annotations.
+                Defaults to "original". NOTE: "coerced" cannot be combined with `sample` or `dedupe`.
 
         Returns:
-            pd.DataFrame: The original DataFrame if errors="raise" or "log", or a filtered DataFrame with valid rows if errors="skip".
+            Union[pd.DataFrame, SampleReport]: The original DataFrame if errors="raise" or "log", or a filtered DataFrame with valid rows if errors="skip".
+                With `sample`, a SampleReport with the estimated invalid rate of the DataFrame and
+                the invalid rows of the sample.
+                With output="coerced", the coerced values of the valid rows.
         """
-        # check for extra columns and handle strict mode
-        # NOTE: this will need to be abstracted to handle different types of schema objects
-        if strict:
-            extras = {
-                col for col in dataframe.columns if col not in self.schema.model_fields.keys()
-            }
-            if extras:
-                raise ValueError(
-                    f"Strict mode is enabled but the following extra columns were found in the schema: {extras}."
-                )
-            del extras
-
         if errors not in ["skip", "raise", "log"]:
             raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
 
-        errors_index = []
-        logging.debug("Amount of available cores: %s", os.cpu_count())
+        if output not in ["original", "coerced"]:
+            raise ValueError("output must be one of 'original' or 'coerced'")
+        if output == "coerced" and (sample is not None or dedupe):
+            raise ValueError("output='coerced' cannot be combined with sample or dedupe")
 
-        if n_jobs < 1:
-            if n_jobs < 0:
-                n_jobs = os.cpu_count()  # type: ignore
+        if queue is not None:
+            warnings.warn(
+                "Arg `queue` is deprecated and ignored, processes are managed by a pool.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
 
-            chunks = []
-            chunk_size = math.floor(len(dataframe) / n_jobs)
-            num_chunks = len(dataframe) // chunk_size + 1
+        if sample is not None:
+            sample = Sample.from_arg(sample)
+            positions, strata, population_sizes = sample.draw(dataframe)
+            # the report holds the invalid rows of the sample, so these never raise
+            valid = self.validity_mask(
+                dataframe.take(positions),
+                errors="skip" if errors == "raise" else errors,
+                strict=strict,
+                context=context,
+                n_jobs=n_jobs,
+                chunk_size=chunk_size,
+                dedupe=dedupe,
+                stats=stats,
+            )
+            return estimate(dataframe, sample, positions, strata, population_sizes, valid)
 
-            # handle user input for queue
-            if queue is None:
-                queue = Queue()
-            elif "queue" not in str(type(queue)).lower():
-                logging.warning(f"Expecting queue object for arg:queue, not {type(queue)}!")
-            else:
-                assert hasattr(queue, "get"), "Queue object must have a put method."
-                assert hasattr(queue, "put"), "Queue object must have a put method."
+        if output == "coerced":
+            return self._coerce(
+                dataframe,
+                errors=errors,
+                strict=strict,
+                context=context,
+                n_jobs=n_jobs,
+                chunk_size=chunk_size,
+                stats=stats,
+            )
 
-            # send chunks to be processed
-            for i in range(num_chunks):
-                chunks.append(
-                    dataframe.iloc[i * chunk_size : (i + 1) * chunk_size].to_dict("index")
-                )
+        valid = self.validity_mask(
+            dataframe,
+            errors=errors,
+            strict=strict,
+            context=context,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            dedupe=dedupe,
+            stats=stats,
+        )
+        if errors in ["skip", "log"] and not valid.all():
+            with timer(stats, "filtering"):
+                return dataframe.take(np.flatnonzero(valid))
+        return dataframe
 
-            for i in range(num_chunks):
-                p = Process(
-                    target=self._validate_chunk,
-                    args=(chunks[i], errors, queue),
-                    daemon=True,
-                )
-                p.start()
-
-            num_stops = 0
-            for i in range(num_chunks):
-                while True:
-                    index = queue.get()
-                    if index is None:
-                        num_stops += 1
-                        break
-
-                    errors_index.append(index)
-
-                if num_stops == num_chunks:
-                    break
-        else:
-            for index, row_dict in dataframe.to_dict("index").items():
-                try:
-                    self.schema.model_validate(
-                        obj=row_dict,
-                        context=context,
-                    )
-                except ValidationError as exc:  # pylint: disable=broad-exception-caught
-                    if errors == "log":
-                        logging.info("Validation error found at index %s\n%s", index, exc)
-                    if errors == "raise":
-                        raise exc
-                    errors_index.append(index)
+    def validity_mask(
+        self,
+        dataframe: pd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        dedupe: bool = False,
+        stats: Optional[ValidationStats] = None,
+    ) -> np.ndarray:
+        """Return a boolean array, by position, of the rows of the DataFrame that pass validation.
 
-        logging.debug("# invalid rows: %s", len(errors_index))
+        The invalid rows are tracked by their position rather than their index label, so the
+        mask is correct for any index, including non-unique ones.
 
-        if len(errors_index) > 0 and errors in ["skip", "log"]:
-            return dataframe[~dataframe.index.isin(list(errors_index))]
-        return dataframe
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            n_jobs (int, optional): The number of processes to use for validation. Defaults to 1.
+            chunk_size (Optional[int], optional): The number of rows validated per task. Defaults to None.
+            dedupe (bool, optional): Whether to validate identical rows only once. Defaults to False.
+            stats (Optional[ValidationStats], optional): The statistics to fill in. Defaults to None.
 
-    def _validate_chunk(
+        Returns:
+            np.ndarray: A boolean array with an entry per row, True for the valid rows.
+        """
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        valid_mask = self._dedupe_valid_mask if dedupe else self._valid_mask
+        valid = valid_mask(
+            dataframe,
+            errors=errors,
+            strict=strict,
+            context=context,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            stats=stats,
+        )
+        if stats is not None:
+            stats.invalid_rows += int(np.count_nonzero(~valid))
+        logging.debug("# invalid rows: %s", int(np.count_nonzero(~valid)))
+        return valid
+
+    def split(
+        self,
+        dataframe: pd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        **kwargs: Any,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Validate a DataFrame and split it into its valid and its invalid rows, in a single pass.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to validate.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            **kwargs: Passed on to `validity_mask` (e.g. strict, context, n_jobs, dedupe).
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The valid rows and the invalid rows, both in order.
+        """
+        valid = self.validity_mask(dataframe, errors=errors, **kwargs)
+        return dataframe.take(np.flatnonzero(valid)), dataframe.take(np.flatnonzero(~valid))
+
+    def _valid_mask(
         self,
-        chunk: dict[Hashable, Any],
-        queue: Any,
+        dataframe: pd.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        stats: Optional[ValidationStats] = None,
+    ) -> np.ndarray:
+        """Return a boolean array, by position, of the rows of the DataFrame that pass validation.
+
+        The DataFrame is validated like in `validate`, but the invalid rows are tracked by their
+        position rather than their index label.
+        """
+        n_jobs = _resolve_n_jobs(n_jobs)
+        chunks = self._split_pending(
+            _positional(dataframe), strict=strict, n_jobs=n_jobs, chunk_size=chunk_size, stats=stats
+        )
+
+        mask = np.ones(len(dataframe), dtype=bool)
+        with contextlib.closing(
+            self._iter_chunk_results(
+                chunks, context=context, n_jobs=n_jobs, ordered=errors != "raise", stats=stats
+            )
+        ) as results:
+            for chunk, positions, _, _ in results:
+                invalid = chunk.index[positions]
+                mask[invalid] = False
+                if errors in ["raise", "log"] and len(invalid) > 0:
+                    with timer(stats, "invalid_rows"):
+                        self._handle_invalid_rows(
+                            chunk=dataframe.iloc[invalid],
+                            positions=list(range(len(invalid))),
+                            errors=errors,
+                            context=context,
+                        )
+        return mask
+
+    def _coerce(
+        self,
+        dataframe: pd.DataFrame,
         errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        stats: Optional[ValidationStats] = None,
+    ) -> pd.DataFrame:
+        """Validate a DataFrame and return the coerced values of its valid rows.
+
+        The values are collected column by column from the models of the batched validation calls,
+        so the rows are validated only once. Rows certified by the vectorized plan of the schema
+        are not validated row-wise at all, their values are cast column-wise instead.
+        """
+        n_jobs = _resolve_n_jobs(n_jobs)
+        coercion = compile_coercion_plan(self.schema)
+        positional = _positional(dataframe)
+        chunks = self._split_pending(
+            positional,
+            strict=strict,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            stats=stats,
+            coercion=coercion,
+        )
+
+        validated = []
+        columns: list[list[Any]] = [[] for _ in coercion.fields]
+        invalid_rows = 0
+        with contextlib.closing(
+            self._iter_chunk_results(
+                chunks, context=context, n_jobs=n_jobs, stats=stats, coercion=coercion
+            )
+        ) as results:
+            for chunk, positions, _, chunk_columns in results:
+                invalid = chunk.index[positions]
+                if errors in ["raise", "log"] and len(invalid) > 0:
+                    with timer(stats, "invalid_rows"):
+                        self._handle_invalid_rows(
+                            chunk=dataframe.iloc[invalid],
+                            positions=list(range(len(invalid))),
+                            errors=errors,
+                            context=context,
+                        )
+                invalid_rows += len(invalid)
+                validated.append(np.delete(chunk.index.to_numpy(), positions))
+                for column, values in zip(columns, chunk_columns or []):
+                    column.extend(values)
+        if stats is not None:
+            stats.invalid_rows += invalid_rows
+        logging.debug("# invalid rows: %s", invalid_rows)
+
+        certified = np.empty(0, dtype=np.intp)
+        if chunks.positions is not None:
+            pending = np.zeros(len(dataframe), dtype=bool)
+            pending[chunks.positions] = True
+            certified = np.flatnonzero(~pending)
+        with timer(stats, "assembly"):
+            coerced = coercion.assemble(
+                positional,
+                certified=certified,
+                validated=np.concatenate(validated) if validated else np.empty(0, dtype=np.intp),
+                columns=columns,
+            )
+            coerced.index = dataframe.index.take(np.asarray(coerced.index, dtype=np.intp))
+        return coerced
+
+    def validate_report(
+        self,
+        dataframe: pd.DataFrame,
+        strict: bool = False,
         context: Optional[
             dict[str, Any]
         ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
-    ) -> None:
-        """Validate a single chunk of a DataFrame converted to a dictionary w/ index values as keys.
+        n_jobs: int = 1,
+        chunk_size: Optional[int] = None,
+        max_errors: Optional[int] = None,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Validate a DataFrame and report the validation errors as a DataFrame.
+
+        The report is built in bulk from the errors of the batched validation, one row per error
+        (so an invalid row with multiple invalid fields has multiple entries).
 
         Args:
-            chunk (dict[Hashable, Any]): The DataFrame chunk to validate.
-            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "raise".
-                NOTE: "skip" and "log" effectively filter the dataframe, excluding invalid rows.
-            queue (Optional[Queue], optional): The queue to put the index of the row in case of an error.
+            dataframe (pd.DataFrame): The DataFrame to validate.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
             context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            n_jobs (int, optional): The number of processes to use for validation. Defaults to 1.
+            chunk_size (Optional[int], optional): The number of rows validated per task. Defaults to None.
+            max_errors (Optional[int], optional): The maximum number of errors to report. Defaults to None
+                (no limit). NOTE: all invalid rows are filtered out, regardless of this limit.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The DataFrame filtered to its valid rows, and the errors
+                with columns "index" (the index label of the row), "loc" (the field, dot-separated for
+                nested locations, empty for model-level errors), "type", "msg" and "input".
         """
-        logging.debug("Process started.")
+        if max_errors is not None and max_errors < 0:
+            raise ValueError("max_errors must be a non-negative integer or None")
 
-        for index, row_dict in chunk.items():
-            try:
-                self.schema.model_validate(
-                    obj=row_dict,
-                    context=context,
-                )
-            except ValidationError as exc:  # pylint: disable=broad-exception-caught
-                if errors == "log":
-                    logging.info("Validation error found at index %s\n%s", index, exc)
-                if errors == "raise":
-                    raise exc
-                queue.put(index)
+        n_jobs = _resolve_n_jobs(n_jobs)
+        chunks = self._split_pending(
+            _positional(dataframe), strict=strict, n_jobs=n_jobs, chunk_size=chunk_size
+        )
+
+        valid = np.ones(len(dataframe), dtype=bool)
+        report: dict[str, list[Any]] = {column: [] for column in ERROR_COLUMNS}
+        for chunk, positions, details, _ in self._iter_chunk_results(
+            chunks, context=context, n_jobs=n_jobs, max_errors=max_errors
+        ):
+            valid[chunk.index[positions]] = False
+            if max_errors is not None:
+                details = details[: max_errors - len(report["index"])]
+            for error in details:
+                report["index"].append(dataframe.index[chunk.index[int(error["loc"][0])]])
+                report["loc"].append(".".join(str(loc) for loc in error["loc"][1:]))
+                report["type"].append(error["type"])
+                report["msg"].append(error["msg"])
+                report["input"].append(error.get("input"))
 
-        logging.debug("Process ended.")
+        logging.debug("# invalid rows: %s", int(np.count_nonzero(~valid)))
 
-        queue.put(None)
+        errors_df = pd.DataFrame(report, columns=ERROR_COLUMNS)
+        if not valid.all():
+            return dataframe.take(np.flatnonzero(valid)), errors_df
+        return dataframe, errors_df
 
     def iterate(
         self,
@@ -169,18 +812,43 @@ class PandasValidator(BaseValidator):
             dict[str, Any]
         ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
         verbose: bool = True,
-    ) -> Iterable[tuple[Hashable, SchemaTypes]]:
-        """Iterate over a DataFrame and yield validated schema models."""
-        for i, row in dataframe.iterrows():
-            try:
-                yield (
-                    i,
-                    self.schema.model_validate(
-                        obj=row.to_dict(),
-                        context=context,
-                    ),
-                )
-            except Exception as e:
-                if verbose:
-                    logging.info(f"Validation error found at index {i}, skipping: {e}.")
-                continue
+        batch_size: Optional[int] = None,
+        stats: Optional[ValidationStats] = None,
+    ) -> Iterable[Union[tuple[Hashable, SchemaTypes], list[tuple[Hashable, SchemaTypes]]]]:
+        """Iterate over a DataFrame and yield validated schema models.
+
+        The rows are extracted column-wise and validated in batches, a single pydantic-core call
+        per batch, invalid rows are skipped.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to iterate over.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            verbose (bool, optional): Whether to log the invalid rows. Defaults to True.
+            batch_size (Optional[int], optional): If given, yield lists of (up to) `batch_size`
+                (index, model) pairs instead of the pairs themselves. Defaults to None.
+            stats (Optional[ValidationStats], optional): The statistics to fill in, e.g. the time
+                spent per phase and the number of errors per field. Defaults to None.
+
+        Yields:
+            Union[tuple[Hashable, SchemaTypes], list[tuple[Hashable, SchemaTypes]]]: The index label
+                and model of each valid row, or lists of them if `batch_size` is given.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        with timer(stats, "plan"):
+            plan = plan_cache.get(self.schema, dataframe.columns)
+        step = batch_size or BATCH_SIZE
+        for start in range(0, len(dataframe), step):
+            chunk = dataframe.iloc[start : start + step]
+            if stats is not None:
+                stats.rows += len(chunk)
+            with timer(stats, "conversion"):
+                rows = _records(chunk)
+            models = self._validate_models(
+                rows, chunk.index, plan=plan, context=context, verbose=verbose, stats=stats
+            )
+            if batch_size is None:
+                yield from models
+            elif models:
+                yield models
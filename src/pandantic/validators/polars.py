@@ -0,0 +1,356 @@
+import logging
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Literal, Optional, Union
+
+import polars as pl
+from pydantic import ValidationError
+
+from pandantic.cache import ValidationPlan, plan_cache
+from pandantic.types import SchemaTypes
+from pandantic.validators.base import BATCH_SIZE, BaseValidator
+from pandantic.validators.vectorized import _MAX_SAFE_FLOAT_INT, ColumnCheck
+
+
+def _certify_expr(  # pylint: disable=too-many-return-statements
+    check: ColumnCheck, dtype: pl.DataType
+) -> pl.Expr:
+    """Translate a ColumnCheck into a Polars expression certifying the valid values.
+
+    Like the pandas plan, the expression is conservative: values it does not certify are left
+    to pydantic. Nulls are never certified, as they are converted to None.
+    """
+    column = pl.col(check.column)
+    not_null = column.is_not_null()
+
+    if check.kind == "str":
+        if dtype != pl.String:
+            return pl.lit(False)
+        expr = not_null
+        if check.min_length is not None:
+            expr &= column.str.len_chars() >= check.min_length
+        if check.max_length is not None:
+            expr &= column.str.len_chars() <= check.max_length
+        if check.pattern is not None:
+            # patterns are only compiled for the python-re engine of pydantic, which Polars lacks
+            return pl.lit(False)
+        return expr
+
+    if check.kind == "literal":
+        if all(isinstance(value, str) for value in check.values):
+            if dtype not in (pl.String, pl.Categorical, pl.Enum):
+                return pl.lit(False)
+            return not_null & column.cast(pl.String).is_in(list(check.values))
+        if not dtype.is_integer():
+            return pl.lit(False)
+        return not_null & column.is_in(list(check.values))
+
+    if check.kind == "bool":
+        if dtype == pl.Boolean:
+            return not_null
+        if dtype.is_integer() or dtype.is_float():
+            return not_null & column.is_in([0, 1])
+        return pl.lit(False)
+
+    # Decimal columns are numeric in Polars but not floats for pydantic (e.g. `int_from_float`),
+    # and Boolean columns are not numeric in Polars, so both are left to pydantic
+    if not (dtype.is_integer() or dtype.is_float()):
+        return pl.lit(False)
+
+    expr = not_null
+    if check.kind == "int" and dtype.is_float():
+        expr &= (
+            column.is_finite() & (column.abs() <= _MAX_SAFE_FLOAT_INT) & (column.floor() == column)
+        )
+    bounds = (check.gt, check.ge, check.lt, check.le)
+    if dtype.is_float() and any(bound is not None for bound in bounds):
+        # Polars orders NaN above all numbers, whereas NaN fails every bound in pydantic
+        expr &= column.is_not_nan()
+    if check.gt is not None:
+        expr &= column > check.gt
+    if check.ge is not None:
+        expr &= column >= check.ge
+    if check.lt is not None:
+        expr &= column < check.lt
+    if check.le is not None:
+        expr &= column <= check.le
+    return expr
+
+
+class PolarsValidator(BaseValidator):
+    def __init__(self, schema: SchemaTypes):
+        self.schema = schema
+
+    def _certify(self, dataframe: pl.DataFrame, plan: ValidationPlan) -> pl.Series:
+        """Return a boolean Series of the rows that are guaranteed to be valid."""
+        if plan.columnar is None:
+            return pl.repeat(False, len(dataframe), eager=True)
+
+        exprs = []
+        for check in plan.columnar.checks:
+            if check.column not in dataframe.schema:
+                if check.required:
+                    return pl.repeat(False, len(dataframe), eager=True)
+                continue
+            exprs.append(_certify_expr(check, dataframe.schema[check.column]))
+        if not exprs:
+            return pl.repeat(True, len(dataframe), eager=True)
+        # `with_columns` broadcasts the checks that are a literal False to the length of the frame
+        return dataframe.with_columns(
+            pl.all_horizontal(exprs).fill_null(False).alias("__pandantic_valid__")
+        ).get_column("__pandantic_valid__")
+
+    def _invalid_rows(
+        self,
+        dataframe: pl.DataFrame,
+        plan: ValidationPlan,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> list[int]:
+        """Return the (sorted) row numbers of the rows of the DataFrame that fail validation."""
+        pending = dataframe.with_row_index("__pandantic_row__").filter(
+            ~self._certify(dataframe, plan)
+        )
+
+        invalid_rows: list[int] = []
+        for batch in pending.iter_slices(n_rows=batch_size):
+            row_numbers = batch.get_column("__pandantic_row__")
+            positions, _, _ = self._validate_batch(
+                batch.drop("__pandantic_row__").to_dicts(),
+                plan=plan,
+                context=context,
+                # the missing values are already None, NaN is kept as is
+                adapter=plan.adapter,
+            )
+            invalid_rows.extend(row_numbers[position] for position in positions)
+        return invalid_rows
+
+    def _frame_mask(
+        self,
+        dataframe: pl.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+        offset: int = 0,
+    ) -> Optional[pl.Series]:
+        """Validate a DataFrame and return a boolean Series of its valid rows, or None if all rows
+        are valid."""
+        plan = plan_cache.get(self.schema, dataframe.columns, strict=strict)
+
+        # check for extra columns and handle strict mode
+        self._check_strict(plan, strict)
+
+        invalid_rows = self._invalid_rows(dataframe, plan, context=context, batch_size=batch_size)
+        logging.debug("# invalid rows: %s", len(invalid_rows))
+        if not invalid_rows:
+            return None
+
+        if errors in ["raise", "log"]:
+            for row_number in invalid_rows:
+                try:
+                    self.schema.model_validate(
+                        obj=dataframe.row(row_number, named=True), context=context
+                    )
+                except ValidationError as exc:
+                    if errors == "raise":
+                        if hasattr(exc, "add_note"):  # python >= 3.11
+                            exc.add_note(f"Validation error found at row {offset + row_number}")
+                        raise exc
+                    logging.info("Validation error found at row %s\n%s", offset + row_number, exc)
+
+        valid = pl.repeat(True, len(dataframe), eager=True)
+        valid.scatter(invalid_rows, False)
+        return valid
+
+    def _validate_frame(
+        self,
+        dataframe: pl.DataFrame,
+        errors: Literal["skip", "raise", "log"] = "raise",
+        **kwargs: Any,
+    ) -> pl.DataFrame:
+        valid = self._frame_mask(dataframe, errors=errors, **kwargs)
+        if valid is not None and errors in ["skip", "log"]:
+            return dataframe.filter(valid)
+        return dataframe
+
+    def validate(
+        self,
+        dataframe: Union[pl.DataFrame, pl.LazyFrame],
+        errors: Literal["skip", "raise", "log"] = "raise",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> pl.DataFrame:
+        """Validate a Polars DataFrame (or LazyFrame) using the schema defined in the Pydantic model.
+
+        The cheap checks derived from the field constraints of the schema are run as Polars
+        expressions, the remaining rows are converted to dictionaries and validated in batches.
+
+        Args:
+            dataframe (Union[pl.DataFrame, pl.LazyFrame]): The DataFrame to validate. A LazyFrame is
+                collected in streaming batches of `batch_size` rows.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "raise".
+                NOTE: "skip" and "log" effectively filter the dataframe, excluding invalid rows.
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            batch_size (int, optional): The number of rows validated per pydantic call. Defaults to 10_000.
+
+        Returns:
+            pl.DataFrame: The original (collected) DataFrame if errors="raise", or a filtered DataFrame with valid rows if errors="skip" or "log".
+        """
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if isinstance(dataframe, pl.DataFrame):
+            return self._validate_frame(
+                dataframe, errors=errors, strict=strict, context=context, batch_size=batch_size
+            )
+
+        offset = 0
+        chunks = []
+        for chunk in self._collect_batches(dataframe, batch_size=batch_size):
+            chunks.append(
+                self._validate_frame(
+                    chunk,
+                    errors=errors,
+                    strict=strict,
+                    context=context,
+                    batch_size=batch_size,
+                    offset=offset,
+                )
+            )
+            offset += len(chunk)
+        if not chunks:
+            return dataframe.collect()
+        return pl.concat(chunks)
+
+    def validity_mask(
+        self,
+        dataframe: Union[pl.DataFrame, pl.LazyFrame],
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> pl.Series:
+        """Return a boolean Series, by position, of the rows of the DataFrame that pass validation.
+
+        Args:
+            dataframe (Union[pl.DataFrame, pl.LazyFrame]): The DataFrame to validate. A LazyFrame is
+                collected in streaming batches of `batch_size` rows.
+            errors (Literal["skip", "raise", "log"], optional): How to handle validation errors. Defaults to "skip".
+            strict (bool, default=False): whether to fail validation if extra fields/columns are present.
+            context (Optional[dict[str, Any]], optional): The context to use for validation. Defaults to None.
+            batch_size (int, optional): The number of rows validated per pydantic call. Defaults to 10_000.
+
+        Returns:
+            pl.Series: A boolean Series with an entry per row, True for the valid rows.
+        """
+        masks = [
+            valid for _, valid in self._iter_masks(dataframe, errors, strict, context, batch_size)
+        ]
+        if not masks:
+            return pl.Series("valid", dtype=pl.Boolean)
+        return pl.concat(masks).alias("valid")
+
+    def split(
+        self,
+        dataframe: Union[pl.DataFrame, pl.LazyFrame],
+        errors: Literal["skip", "raise", "log"] = "skip",
+        strict: bool = False,
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int = BATCH_SIZE,
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """Validate a DataFrame (or LazyFrame) and split it into its valid and its invalid rows,
+        in a single pass."""
+        valid_frames, invalid_frames = [], []
+        for frame, valid in self._iter_masks(dataframe, errors, strict, context, batch_size):
+            valid_frames.append(frame.filter(valid))
+            invalid_frames.append(frame.filter(~valid))
+        if not valid_frames:
+            empty = dataframe.collect() if isinstance(dataframe, pl.LazyFrame) else dataframe
+            return empty, empty.clear()
+        return pl.concat(valid_frames), pl.concat(invalid_frames)
+
+    def _iter_masks(
+        self,
+        dataframe: Union[pl.DataFrame, pl.LazyFrame],
+        errors: Literal["skip", "raise", "log"],
+        strict: bool,
+        context: Optional[
+            dict[str, Any]
+        ],  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        batch_size: int,
+    ) -> Iterator[tuple[pl.DataFrame, pl.Series]]:
+        """Validate the (collected batches of the) DataFrame, yield each with its validity mask."""
+        if errors not in ["skip", "raise", "log"]:
+            raise ValueError("errors must be one of 'skip', 'raise', or 'log'")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if isinstance(dataframe, pl.LazyFrame):
+            frames: Iterable[pl.DataFrame] = self._collect_batches(dataframe, batch_size)
+        else:
+            frames = [dataframe]
+
+        offset = 0
+        for frame in frames:
+            valid = self._frame_mask(
+                frame,
+                errors=errors,
+                strict=strict,
+                context=context,
+                batch_size=batch_size,
+                offset=offset,
+            )
+            yield frame, pl.repeat(True, len(frame), eager=True) if valid is None else valid
+            offset += len(frame)
+
+    @staticmethod
+    def _collect_batches(lazyframe: pl.LazyFrame, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Collect a LazyFrame in batches, streaming them if supported by Polars."""
+        if hasattr(lazyframe, "collect_batches"):
+            yield from lazyframe.collect_batches(chunk_size=batch_size)
+        else:
+            yield from lazyframe.collect().iter_slices(n_rows=batch_size)
+
+    def iterate(
+        self,
+        dataframe: Union[pl.DataFrame, pl.LazyFrame],
+        context: Optional[
+            dict[str, Any]
+        ] = None,  # pylint: disable=consider-alternative-union-syntax,useless-suppression
+        verbose: bool = True,
+        batch_size: int = BATCH_SIZE,
+    ) -> Iterable[tuple[Hashable, SchemaTypes]]:
+        """Iterate over a DataFrame and yield the row numbers and validated schema models."""
+        if isinstance(dataframe, pl.LazyFrame):
+            batches: Iterable[pl.DataFrame] = self._collect_batches(dataframe, batch_size)
+        else:
+            batches = dataframe.iter_slices(n_rows=batch_size)
+
+        offset = 0
+        for batch in batches:
+            # the whole batch in a single pydantic-core call, see `PandasValidator.iterate`
+            yield from self._validate_models(
+                batch.to_dicts(),
+                range(offset, offset + len(batch)),
+                plan=plan_cache.get(self.schema, batch.columns),
+                context=context,
+                verbose=verbose,
+                location="row",
+            )
+            offset += len(batch)
@@ -0,0 +1,290 @@
+"""Per-field validation of the distinct values of a column.
+
+When the fields of a schema are validated independently of each other (no model validators, no
+field validators looking at other fields), a row is valid if and only if each of its values is
+valid for its field. A `UniqueValuePlan` uses this to validate the distinct values of each
+column once, through a model of that single field, and maps the result back to the rows. A
+categorical column with a dozen categories then only takes a dozen validations, regardless of
+the number of rows.
+
+Like the `ColumnarPlan`, the plan only ever *certifies* rows: rows with any value that is not
+certified valid are left to pydantic for the actual verdict (and for the error message).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import typing
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    PlainValidator,
+    TypeAdapter,
+    ValidationError,
+    WrapValidator,
+    create_model,
+    field_validator,
+)
+
+from pandantic.types import SchemaTypes
+from pandantic.validators.vectorized import ColumnCheck, compile_column_checks
+
+
+# columns with more distinct values than this share of their rows are not validated per value
+MAX_UNIQUE_RATIO = 0.5
+# number of rows used to estimate the number of distinct values of a column
+_SAMPLE_SIZE = 10_000
+# inferred types of object columns whose equal values are validated the same
+_HOMOGENEOUS_TYPES = ("string", "integer", "floating", "boolean")
+# the validators that can be attached to a field through `Annotated` metadata, by mode
+_FUNCTIONAL_VALIDATORS = {
+    AfterValidator: "after",
+    BeforeValidator: "before",
+    PlainValidator: "plain",
+    WrapValidator: "wrap",
+}
+
+
+def _is_homogeneous(values: Any) -> bool:
+    """Return whether the values are not of mixed types, if stored as python objects.
+
+    Distinct objects of different types may compare equal (e.g. 1 and True), yet validate
+    differently, so they cannot be validated per distinct value.
+    """
+    if values.dtype != object:
+        return True
+    return pd.api.types.infer_dtype(values, skipna=True) in _HOMOGENEOUS_TYPES
+
+
+@dataclass(frozen=True)
+class UniqueValueCheck:
+    """The per-value validation of a single schema field against its DataFrame column."""
+
+    column: str
+    adapter: TypeAdapter  # type: ignore[type-arg]
+    required: bool = True
+    check: Optional[ColumnCheck] = None
+    # whether all missing values (NaN, None, NA, NaT) pass validation, see `validates_missing`
+    missing: bool = False
+
+    def certify(self, series: pd.Series) -> np.ndarray:
+        """Return a boolean mask of the values that are guaranteed to pass validation."""
+        if self.check is not None:
+            mask = self.check.certify(series)
+            if mask.all():
+                return mask
+            rest = np.flatnonzero(~mask)
+            mask[rest] = self._certify_values(series.iloc[rest])
+            return mask
+        return self._certify_values(series)
+
+    def certify_missing(self) -> bool:
+        """Return whether the field is guaranteed to pass validation when its column is missing."""
+        return not self.required and self._validate([{}])[0]
+
+    def validates_missing(self) -> bool:
+        """Return whether all missing values of pandas pass validation, e.g. for a
+        `pandantic.Optional` field."""
+        try:
+            valid = self._validate(
+                [{self.column: value} for value in (None, float("nan"), pd.NA, pd.NaT)]
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. a custom validator raising a TypeError on None
+            return False
+        return bool(valid.all())
+
+    def _validate(self, rows: list[dict[str, Any]]) -> np.ndarray:
+        """Validate rows of the single field model in one call, return which ones are valid."""
+        valid = np.ones(len(rows), dtype=bool)
+        try:
+            self.adapter.validate_python(rows)
+        except ValidationError as exc:
+            valid[
+                [
+                    int(error["loc"][0])
+                    for error in exc.errors(
+                        include_url=False, include_context=False, include_input=False
+                    )
+                ]
+            ] = False
+        return valid
+
+    def _certify_values(self, series: pd.Series) -> np.ndarray:
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            values = series.cat.categories
+            codes = series.cat.codes.to_numpy()
+            if not _is_homogeneous(values):
+                return np.zeros(len(series), dtype=bool)
+        else:
+            if not _is_homogeneous(series):
+                return np.zeros(len(series), dtype=bool)
+            sample = series.iloc[:_SAMPLE_SIZE]
+            if sample.nunique(dropna=False) > len(sample) * MAX_UNIQUE_RATIO:
+                return np.zeros(len(series), dtype=bool)
+            codes, values = pd.factorize(series)
+
+        if len(values) > len(series) * MAX_UNIQUE_RATIO:
+            return np.zeros(len(series), dtype=bool)
+
+        # missing values (code -1) come in many flavours, all of which have to be valid
+        valid = np.append(
+            self._validate([{self.column: value} for value in values.tolist()]), self.missing
+        )
+        return valid[codes]
+
+
+@dataclass(frozen=True)
+class UniqueValuePlan:
+    """A set of per-field checks that together certify whole rows of a DataFrame."""
+
+    checks: tuple[UniqueValueCheck, ...] = field(default_factory=tuple)
+
+    def certify(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """Return a positional boolean mask of the rows that are guaranteed to be valid."""
+        if not dataframe.columns.is_unique:
+            # duplicated column labels, leave it to pydantic
+            return np.zeros(len(dataframe), dtype=bool)
+        mask = np.ones(len(dataframe), dtype=bool)
+        for check in self.checks:
+            if check.column not in dataframe.columns:
+                if not check.certify_missing():
+                    return np.zeros(len(dataframe), dtype=bool)
+                continue
+            mask &= check.certify(dataframe[check.column])
+            if not mask.any():
+                break
+        return mask
+
+
+def _takes_info(function: Any, mode: str) -> bool:
+    """Return whether a (bound) validator function takes a ValidationInfo argument."""
+    parameters = [
+        parameter
+        for parameter in inspect.signature(function).parameters.values()
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    return len(parameters) > (2 if mode == "wrap" else 1)
+
+
+def _metadata_validators(field_info: Any) -> Iterator[tuple[Any, str]]:
+    """Yield the functional validators (e.g. `AfterValidator`) attached to a field through
+    `Annotated` metadata, including those nested in its annotation, with their mode."""
+    pending = [*field_info.metadata, field_info.annotation]
+    while pending:
+        item = pending.pop()
+        mode = _FUNCTIONAL_VALIDATORS.get(type(item))
+        if mode is not None:
+            yield item.func, mode
+        else:
+            pending.extend(typing.get_args(item))
+
+
+def _reads_other_fields(schema: SchemaTypes) -> bool:
+    """Return whether a field validator of the schema, decorated or attached through `Annotated`
+    metadata, takes a ValidationInfo, through which it may look at the other fields (`info.data`).
+    """
+    validators: list[tuple[Any, str]] = [
+        (decorator.func, decorator.info.mode)
+        for decorator in schema.__pydantic_decorators__.field_validators.values()
+    ]
+    for field_info in schema.model_fields.values():
+        validators.extend(_metadata_validators(field_info))
+    for function, mode in validators:
+        try:
+            if _takes_info(function, mode):
+                return True
+        except (TypeError, ValueError):
+            # no signature (e.g. a builtin), assume the worst
+            return True
+    return False
+
+
+def _is_decomposable(schema: SchemaTypes) -> bool:
+    """Return whether the fields of the schema can be validated independently of each other."""
+    decorators = schema.__pydantic_decorators__
+    if decorators.validators or decorators.root_validators or decorators.model_validators:
+        return False
+    if schema.model_post_init is not BaseModel.model_post_init:
+        return False
+
+    config = schema.model_config
+    if config.get("extra") == "forbid" or config.get("alias_generator") is not None:
+        return False
+
+    for field_info in schema.model_fields.values():
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            return False
+    return not _reads_other_fields(schema)
+
+
+def _fields_model(schema: SchemaTypes, names: Iterable[str], model_name: str) -> type[BaseModel]:
+    """Create a model of some fields of the schema, with its config and their field validators."""
+    names = tuple(names)
+    validators = {
+        validator_name: field_validator(
+            *decorator.info.fields, mode=decorator.info.mode, check_fields=False
+        )(
+            # the validators stay bound to the schema, so `cls` still refers to it
+            staticmethod(decorator.func)
+        )
+        for validator_name, decorator in schema.__pydantic_decorators__.field_validators.items()
+        if "*" in decorator.info.fields or set(decorator.info.fields) & set(names)
+    }
+    return create_model(  # type: ignore[call-overload, no-any-return]
+        model_name,
+        __config__=schema.model_config,
+        __validators__=validators,
+        **{
+            name: (schema.model_fields[name].annotation, schema.model_fields[name])
+            for name in names
+        },
+    )
+
+
+def compile_unique_value_plan(schema: SchemaTypes) -> Optional[UniqueValuePlan]:
+    """Compile a schema into a UniqueValuePlan.
+
+    The fields without custom validators that can be vectorized (see `compile_column_checks`)
+    are checked column-wise first, only the values these checks do not certify are validated
+    per distinct value.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+
+    Returns:
+        Optional[UniqueValuePlan]: The compiled plan, or None if the fields of the schema cannot be
+            validated independently.
+    """
+    if not _is_decomposable(schema):
+        return None
+
+    validated_fields = {
+        name
+        for decorator in schema.__pydantic_decorators__.field_validators.values()
+        for name in decorator.info.fields
+    }
+    column_checks = {} if "*" in validated_fields else compile_column_checks(schema)
+
+    checks = []
+    for name, field_info in schema.model_fields.items():
+        model: Any = _fields_model(schema, [name], f"{schema.__name__}_{name}")
+        check = UniqueValueCheck(
+            column=name,
+            adapter=TypeAdapter(list[model]),
+            required=field_info.is_required(),
+            check=None if name in validated_fields else column_checks.get(name),
+        )
+        if check.validates_missing():
+            check = dataclasses.replace(check, missing=True)
+        checks.append(check)
+    return UniqueValuePlan(checks=tuple(checks))
@@ -0,0 +1,340 @@
+"""Vectorized, column-wise checks compiled from the field constraints of a schema.
+
+A `ColumnarPlan` certifies rows as valid using a handful of pandas/NumPy operations per column,
+without building any row dictionaries. The plan is conservative: it only ever *certifies* rows,
+every row it cannot prove to be valid is left to pydantic for the actual verdict (and for the
+error message).
+"""
+
+from __future__ import annotations
+
+import re
+import typing
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Literal, Optional
+
+import annotated_types
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from pandantic.types import SchemaTypes
+from pandantic.types_pandantic import is_nan_to_none
+
+
+# floats beyond this magnitude are not guaranteed to convert exactly to an int
+_MAX_SAFE_FLOAT_INT = 2**53
+
+# model config keys that change how scalars are validated
+_UNSUPPORTED_CONFIG = (
+    "strict",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+    "validate_default",
+)
+
+ColumnKind = Literal["int", "float", "str", "bool", "literal"]
+
+
+@dataclass(frozen=True)
+class ColumnCheck:
+    """The vectorized check of a single schema field against its DataFrame column."""
+
+    column: str
+    kind: ColumnKind
+    required: bool = True
+    # missing values are valid, as a `pandantic.Optional` field coerces them to None
+    nullable: bool = False
+    gt: Optional[float] = None
+    ge: Optional[float] = None
+    lt: Optional[float] = None
+    le: Optional[float] = None
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    # only set for schemas with regex_engine="python-re", matched with `re` like pydantic does
+    pattern: Optional[str] = None
+    values: tuple[Any, ...] = ()
+
+    def certify(self, series: pd.Series) -> np.ndarray:
+        """Return a boolean mask of the values that are guaranteed to pass validation."""
+        if self.nullable:
+            missing = series.isna().to_numpy(dtype=bool)
+            if missing.any():
+                mask = missing.copy()
+                present = np.flatnonzero(~missing)
+                mask[present] = self._certify_values(series.iloc[present])
+                return mask
+        return self._certify_values(series)
+
+    def _certify_values(self, series: pd.Series) -> np.ndarray:
+        dtype = series.dtype
+        if self.kind == "str":
+            if isinstance(dtype, pd.StringDtype):
+                mask: np.ndarray = series.notna().to_numpy(dtype=bool)
+            elif dtype == object and pd.api.types.infer_dtype(series, skipna=False) == "string":
+                mask = np.ones(len(series), dtype=bool)
+            else:
+                return np.zeros(len(series), dtype=bool)
+            mask &= self._certify_string(series, mask)
+            return mask
+
+        if self.kind == "literal":
+            return self._certify_literal(series)
+
+        # numeric and boolean fields are only certified for NumPy dtypes, or nullable extension
+        # dtypes (e.g. "Int64") without missing values
+        numpy_dtype: Optional[np.dtype] = (
+            dtype if isinstance(dtype, np.dtype) else getattr(dtype, "numpy_dtype", None)
+        )
+        if numpy_dtype is None or numpy_dtype.kind not in "biuf":
+            return np.zeros(len(series), dtype=bool)
+        if numpy_dtype is not dtype and series.hasnans:
+            return np.zeros(len(series), dtype=bool)
+        values = series.to_numpy(dtype=numpy_dtype)
+
+        if self.kind == "bool":
+            if numpy_dtype.kind == "b":
+                return np.ones(len(values), dtype=bool)
+            return np.isin(values, (0, 1))
+
+        if numpy_dtype.kind == "b":
+            # bools are accepted as numbers by pydantic, but rarely intended as such
+            return np.zeros(len(values), dtype=bool)
+
+        if self.kind == "int":
+            if numpy_dtype.kind == "f":
+                with np.errstate(invalid="ignore"):
+                    mask = (
+                        np.isfinite(values)
+                        & (np.abs(values) <= _MAX_SAFE_FLOAT_INT)
+                        & (np.floor(values) == values)
+                    )
+            else:
+                mask = np.ones(len(values), dtype=bool)
+        else:
+            mask = np.ones(len(values), dtype=bool)
+
+        mask &= self._certify_bounds(values)
+        return mask
+
+    def _certify_bounds(self, values: np.ndarray) -> np.ndarray:
+        mask = np.ones(len(values), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if self.gt is not None:
+                mask &= values > self.gt
+            if self.ge is not None:
+                mask &= values >= self.ge
+            if self.lt is not None:
+                mask &= values < self.lt
+            if self.le is not None:
+                mask &= values <= self.le
+        return mask
+
+    def _certify_string(self, series: pd.Series, mask: np.ndarray) -> np.ndarray:
+        result = np.ones(len(series), dtype=bool)
+        if self.min_length is None and self.max_length is None and self.pattern is None:
+            return result
+
+        strings = series.astype(object).where(mask, "")
+        if self.min_length is not None or self.max_length is not None:
+            lengths = strings.str.len().to_numpy()
+            if self.min_length is not None:
+                result &= lengths >= self.min_length
+            if self.max_length is not None:
+                result &= lengths <= self.max_length
+        if self.pattern is not None:
+            # pydantic matches patterns anywhere in the string (i.e. `re.search`)
+            result &= strings.str.contains(self.pattern, regex=True).to_numpy(dtype=bool)
+        return result
+
+    def _certify_literal(self, series: pd.Series) -> np.ndarray:
+        dtype = series.dtype
+        if all(isinstance(value, str) for value in self.values):
+            if not (isinstance(dtype, pd.StringDtype) or dtype == object):
+                return np.zeros(len(series), dtype=bool)
+        elif not (isinstance(dtype, np.dtype) and dtype.kind in "iu"):
+            return np.zeros(len(series), dtype=bool)
+        return series.isin(self.values).to_numpy(dtype=bool)
+
+
+@dataclass(frozen=True)
+class ColumnarPlan:
+    """A set of column checks that together certify whole rows of a DataFrame."""
+
+    checks: tuple[ColumnCheck, ...] = field(default_factory=tuple)
+
+    def certify(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """Return a positional boolean mask of the rows that are guaranteed to be valid."""
+        if not dataframe.columns.is_unique:
+            # duplicated column labels, leave it to pydantic
+            return np.zeros(len(dataframe), dtype=bool)
+        mask = np.ones(len(dataframe), dtype=bool)
+        for check in self.checks:
+            if check.column not in dataframe.columns:
+                if check.required:
+                    return np.zeros(len(dataframe), dtype=bool)
+                continue
+            mask &= check.certify(dataframe[check.column])
+            if not mask.any():
+                break
+        return mask
+
+
+def _has_custom_validators(schema: SchemaTypes) -> bool:
+    decorators = schema.__pydantic_decorators__
+    return bool(
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ) or (schema.model_post_init is not BaseModel.model_post_init)
+
+
+def _compile_check(
+    name: str, field_info: Any, regex_engine: str = "rust-regex"
+) -> Optional[ColumnCheck]:
+    """Compile a single field into a ColumnCheck, or None if it cannot be vectorized."""
+    if field_info.alias is not None or field_info.validation_alias is not None:
+        return None
+
+    annotation = field_info.annotation
+    field_metadata = field_info.metadata
+    nullable = any(is_nan_to_none(item) for item in field_metadata)
+    if nullable:
+        # a `pandantic.Optional[T]` field is checked as `T`, with missing values being valid
+        args = typing.get_args(annotation)
+        if typing.get_origin(annotation) is not typing.Union or len(args) != 2:
+            return None
+        annotation = next(arg for arg in args if arg is not type(None))
+        field_metadata = [item for item in field_metadata if not is_nan_to_none(item)]
+    kind: ColumnKind
+    values: tuple[Any, ...] = ()
+    if annotation is bool:
+        kind = "bool"
+    elif annotation is int:
+        kind = "int"
+    elif annotation is float:
+        kind = "float"
+    elif annotation is str:
+        kind = "str"
+    elif typing.get_origin(annotation) is Literal:
+        kind, values = "literal", typing.get_args(annotation)
+    elif isinstance(annotation, type) and issubclass(annotation, Enum):
+        kind, values = "literal", tuple(member.value for member in annotation)
+    else:
+        return None
+
+    if kind == "literal" and not (
+        all(isinstance(value, str) for value in values)
+        or all(isinstance(value, int) and not isinstance(value, bool) for value in values)
+    ):
+        return None
+
+    constraints: dict[str, Any] = {}
+    for metadata in field_metadata:
+        if isinstance(
+            metadata,
+            (annotated_types.Gt, annotated_types.Ge, annotated_types.Lt, annotated_types.Le),
+        ):
+            if kind not in ("int", "float"):
+                return None
+            constraints.update(
+                {
+                    key: getattr(metadata, key)
+                    for key in ("gt", "ge", "lt", "le")
+                    if hasattr(metadata, key)
+                }
+            )
+        elif isinstance(metadata, (annotated_types.MinLen, annotated_types.MaxLen)):
+            if kind != "str":
+                return None
+            constraints.update(
+                {
+                    key: getattr(metadata, key)
+                    for key in ("min_length", "max_length")
+                    if hasattr(metadata, key)
+                }
+            )
+        elif (
+            kind == "str"
+            and type(metadata).__name__ == "_PydanticGeneralMetadata"
+            and set(vars(metadata)) == {"pattern"}
+        ):
+            if regex_engine != "python-re":
+                # the rust regex engine of pydantic (the default) differs from `re`, e.g. on the
+                # Unicode classes (`\w`, `\d`, `\b`, ...), case folding and `$`
+                return None
+            try:
+                re.compile(metadata.pattern)
+            except re.error:
+                return None
+            constraints["pattern"] = metadata.pattern
+        else:
+            return None
+
+    return ColumnCheck(
+        column=name,
+        kind=kind,
+        required=field_info.is_required(),
+        nullable=nullable,
+        values=values,
+        **constraints,
+    )
+
+
+def _supports_config(schema: SchemaTypes) -> bool:
+    config = schema.model_config
+    if config.get("extra") == "forbid" or config.get("allow_inf_nan") is False:
+        return False
+    return not any(config.get(key) for key in _UNSUPPORTED_CONFIG)
+
+
+def compile_column_checks(schema: SchemaTypes) -> dict[str, ColumnCheck]:
+    """Compile the fields of a schema that can be vectorized into ColumnChecks.
+
+    NOTE: custom validators are not taken into account, the checks of fields with custom
+        validators cannot be trusted on their own.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+
+    Returns:
+        dict[str, ColumnCheck]: The checks of the fields that can be vectorized, by field name.
+    """
+    if not _supports_config(schema):
+        return {}
+
+    checks = {}
+    for name, field_info in schema.model_fields.items():
+        check = _compile_check(
+            name, field_info, regex_engine=schema.model_config.get("regex_engine", "rust-regex")
+        )
+        if check is not None:
+            checks[name] = check
+    return checks
+
+
+def compile_columnar_plan(schema: SchemaTypes) -> Optional[ColumnarPlan]:
+    """Compile a schema into a ColumnarPlan.
+
+    Only schemas made of plain scalar fields (`int`, `float`, `str`, `bool`, `Literal` and enums,
+    optionally constrained with `gt`/`ge`/`lt`/`le`/`min_length`/`max_length`, and with `pattern`
+    if the schema uses `regex_engine="python-re"`) and without any custom validators can be compiled.
+
+    Args:
+        schema (SchemaTypes): The pydantic model to compile.
+
+    Returns:
+        Optional[ColumnarPlan]: The compiled plan, or None if the schema cannot be vectorized.
+    """
+    if _has_custom_validators(schema) or not _supports_config(schema):
+        return None
+
+    checks = compile_column_checks(schema)
+    if len(checks) < len(schema.model_fields):
+        return None
+    return ColumnarPlan(checks=tuple(checks.values()))
@@ -0,0 +1,168 @@
+"""Tests the ArrowValidator, using the same schemas as the pandas tests."""
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from pandantic import Pandantic, plan_cache
+
+
+pa = pytest.importorskip("pyarrow")
+
+from pandantic.validators.arrow import ArrowValidator  # noqa: E402
+
+
+class ScalarSchema(BaseModel):
+    """Example schema made of plain, constrained scalars."""
+
+    example_str: str = Field(max_length=3)
+    example_int: int = Field(ge=0)
+
+
+class EvenSchema(BaseModel):
+    """Example schema with a custom validator."""
+
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def table() -> "pa.Table":
+    """Fixture for an arrow Table with the first and last row invalid."""
+    return pa.table(
+        {
+            "example_str": [None, "bar", "baz", "quux"],
+            "example_int": [1, 2, 4, -3],
+        }
+    )
+
+
+def test_get_arrow_implementation(table: "pa.Table"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    assert isinstance(validator._get_implementation(table), ArrowValidator)
+    assert isinstance(validator._get_implementation(table.to_batches()[0]), ArrowValidator)
+
+
+def test_certify(table: "pa.Table"):
+    validator = ArrowValidator(schema=ScalarSchema)
+    plan = plan_cache.get(ScalarSchema, table.column_names)
+
+    assert validator._certify(table.to_batches()[0], plan).to_pylist() == [
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "regex_engine, pattern, values",
+    [
+        # an Arabic-Indic digit is a digit for the rust regex engine, not for RE2
+        ("rust-regex", r"^\D+$", ["a\u0663", "ab"]),
+        ("python-re", r"^\D+$", ["a\u0663", "ab"]),
+        # RE2 does not support lookarounds
+        ("python-re", r"^(?=a)\w+$", ["ab", "ba"]),
+    ],
+)
+def test_validate_pattern(regex_engine: str, pattern: str, values: list[str]):
+    class Model(BaseModel):
+        model_config = ConfigDict(regex_engine=regex_engine)
+
+        a: str = Field(pattern=pattern)
+
+    table = pa.table({"a": values})
+    plan = plan_cache.get(Model, table.column_names)
+    expected = [index for index, value in enumerate(values) if _is_valid(Model, value)]
+
+    # patterns are never certified by Arrow's own regex engine, RE2
+    assert not any(ArrowValidator(schema=Model)._certify(table.to_batches()[0], plan).to_pylist())
+    assert Pandantic(schema=Model).validate(table, errors="skip").equals(table.take(expected))
+
+
+def _is_valid(model, value: str) -> bool:
+    try:
+        model(a=value)
+    except ValidationError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("schema", [ScalarSchema, EvenSchema])
+def test_validate_table(table: "pa.Table", schema):
+    validator = Pandantic(schema=schema)
+
+    result = validator.validate(table, errors="skip", batch_size=3)
+
+    assert isinstance(result, pa.Table)
+    assert result.equals(table.slice(1, 2))
+
+
+def test_validate_record_batch(table: "pa.Table"):
+    validator = Pandantic(schema=ScalarSchema)
+    batch = table.to_batches()[0]
+
+    result = validator.validate(batch, errors="log")
+
+    assert isinstance(result, pa.RecordBatch)
+    assert result.equals(batch.slice(1, 2))
+
+
+def test_validate_record_batch_reader(table: "pa.Table"):
+    validator = Pandantic(schema=EvenSchema)
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=2))
+
+    result = validator.validate(reader, errors="skip")
+
+    assert result.equals(table.slice(1, 2))
+
+
+def test_validate_raise(table: "pa.Table"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    assert validator.validate(table.slice(1, 2), errors="raise").equals(table.slice(1, 2))
+    with pytest.raises(ValidationError):
+        validator.validate(table, errors="raise")
+    with pytest.raises(ValueError):
+        Pandantic(schema=EvenSchema).validate(table, strict=True)
+
+
+def test_iterate(table: "pa.Table"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    out_list = list(validator.iterate(table))
+
+    assert [i for i, _ in out_list] == [1, 2]
+    assert isinstance(out_list[0][1], ScalarSchema)
+    # the row numbers continue across batches
+    assert [i for i, _ in validator.iterate(table, batch_size=2)] == [1, 2]
+
+
+def test_validity_mask(table: "pa.Table"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    assert validator.validity_mask(table, batch_size=3).to_pylist() == [False, True, True, False]
+    with pytest.raises(ValidationError):
+        validator.validity_mask(table, errors="raise")
+
+
+def test_split(table: "pa.Table"):
+    validator = Pandantic(schema=EvenSchema)
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=2))
+
+    for data in [table, table.to_batches()[0], reader]:
+        valid, invalid = validator.split(data)
+
+        assert valid.equals(table.slice(1, 2))
+        assert invalid.equals(table.take([0, 3]))
+
+
+def test_validate_report_unsupported(table: "pa.Table"):
+    with pytest.raises(TypeError, match="ArrowValidator does not support validate_report"):
+        Pandantic(schema=ScalarSchema).validate_report(table)
@@ -0,0 +1,132 @@
+"""Tests the asyncio API of the CoreValidator."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from pandantic import Pandantic, ValidationStats
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame of 100 rows, of which the ones with an odd int are invalid."""
+    return pd.DataFrame(
+        data={"example_str": ["foo"] * 100, "example_int": list(range(100))},
+        index=[f"row_{i}" for i in range(100)],
+    )
+
+
+def test_avalidate(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    df_valid = asyncio.run(validator.avalidate(dataframe, chunksize=30, errors="skip"))
+
+    pd.testing.assert_frame_equal(df_valid, validator.validate(dataframe, errors="skip"))
+
+
+def test_avalidate_raise(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(validator.avalidate(dataframe, chunksize=30))
+
+
+def test_avalidate_coerced(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    df_coerced = asyncio.run(
+        validator.avalidate(dataframe, chunksize=30, errors="skip", output="coerced")
+    )
+
+    pd.testing.assert_frame_equal(
+        df_coerced, validator.validate(dataframe, errors="skip", output="coerced")
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{"sample": 10}, {"stats": ValidationStats()}])
+def test_avalidate_unsupported(dataframe: pd.DataFrame, kwargs: dict):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    with pytest.raises(ValueError, match="avalidate does not support"):
+        asyncio.run(validator.avalidate(dataframe, chunksize=30, errors="skip", **kwargs))
+
+
+def test_avalidate_process_pool(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        df_valid = asyncio.run(
+            validator.avalidate(
+                dataframe, chunksize=10, executor=executor, concurrency=2, errors="skip"
+            )
+        )
+
+    assert list(df_valid["example_int"]) == list(range(0, 100, 2))
+
+
+def test_aiter_valid_chunks_yields_control(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+    events = []
+
+    async def _tick() -> None:
+        await asyncio.sleep(0)
+        events.append("tick")
+
+    async def _validate() -> None:
+        async for chunk in validator.aiter_valid_chunks(dataframe, chunksize=20):
+            events.append(len(chunk))
+
+    async def _main() -> None:
+        await asyncio.gather(_validate(), _tick())
+
+    asyncio.run(_main())
+
+    assert events.count("tick") == 1
+    assert events.index("tick") < len(events) - 1
+    assert [event for event in events if event != "tick"] == [10] * 5
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_aiterate(dataframe: pd.DataFrame, executor_class):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    async def _collect(executor) -> list:
+        return [
+            item
+            async for item in validator.aiterate(
+                dataframe, chunksize=25, executor=executor, concurrency=2, verbose=False
+            )
+        ]
+
+    with executor_class(max_workers=2) as executor:
+        items = asyncio.run(_collect(executor))
+
+    assert items == list(validator.iterate(dataframe, verbose=False))
+
+
+@pytest.mark.parametrize("kwargs", [{"chunksize": 0}, {"concurrency": 0}])
+def test_aiterate_invalid_args(dataframe: pd.DataFrame, kwargs):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    async def _collect() -> list:
+        return [item async for item in validator.aiterate(dataframe, **kwargs)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(_collect())
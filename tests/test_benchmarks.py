@@ -0,0 +1,73 @@
+"""Smoke tests of the benchmark suite, so that it keeps running as the code changes."""
+
+import json
+import signal
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from benchmarks.run import (
+    BenchmarkTimeout,
+    Result,
+    compare,
+    main,
+    measure,
+    run,
+    supports,
+)
+from benchmarks.schemas import SCHEMAS, make_frame
+
+
+@pytest.mark.parametrize("name", list(SCHEMAS))
+def test_make_frame(name: str):
+    schema, _, context = SCHEMAS[name]
+
+    valid = make_frame(name, n_rows=100, invalid_ratio=0)
+    invalid = make_frame(name, n_rows=100, invalid_ratio=1)
+
+    assert isinstance(valid, pd.DataFrame) and len(valid) == 100
+    for row in valid.to_dict("records"):
+        schema.model_validate(row, context=context)
+    with pytest.raises(ValidationError):
+        schema.model_validate(invalid.to_dict("records")[0], context=context)
+
+
+def test_run_and_compare():
+    results = run(sizes=[10], schema_names=["even_int"], name_filter="validate[", repeat=1)
+
+    assert [result.name for result in results][:2] == [
+        "even_int.validate[errors=skip]",
+        "even_int.validate[errors=log]",
+    ]
+    assert all(result.rows == 10 for result in results)
+
+    name = "even_int.validate[errors=skip]"
+    baseline = [{"name": name, "rows": 10, "seconds": 1.0, "rows_per_sec": 10.0, "peak_mib": 8.0}]
+    assert compare([Result(name, 10, 2.0, 5.0, 8.0)], baseline)
+    assert compare([Result(name, 10, 1.0, 10.0, 16.0)], baseline)
+    assert compare([Result(name, 10, float("inf"), 0.0, 0.0)], baseline)
+    assert not compare([Result(name, 10, 1.1, 9.0, 9.0)], baseline)
+    assert "8.0 MiB" in compare([Result(name, 10, 2.0, 5.0, 8.0)], baseline)[0]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="timeouts need SIGALRM")
+def test_measure_timeout():
+    with pytest.raises(BenchmarkTimeout):
+        measure(lambda _: time.sleep(10), pd.DataFrame(), repeat=1, timeout=0.1)
+
+
+def test_supports():
+    assert supports(errors="skip", n_jobs=2)
+    assert not supports(unknown_option=True)
+
+
+def test_main_compares_with_saved_baseline(tmp_path: Path):
+    baseline = tmp_path / "baseline.json"
+    args = ["--sizes", "10", "--schemas", "even_int", "--filter", "validate[errors=skip]"]
+
+    assert main([*args, "--repeat", "1", "--save", str(baseline)]) == 0
+    assert json.loads(baseline.read_text())["results"][0]["rows"] == 10
+    assert main([*args, "--repeat", "1", "--baseline", str(baseline)]) == 0
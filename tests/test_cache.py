@@ -0,0 +1,71 @@
+"""Tests the process-wide cache of validation plans."""
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel
+
+from pandantic import Pandantic, plan_cache
+from pandantic.cache import PlanCache
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+
+@pytest.fixture
+def cache() -> PlanCache:
+    """Fixture for an empty cache."""
+    return PlanCache(maxsize=2)
+
+
+def test_get_reuses_plan(cache: PlanCache):
+    plan = cache.get(DataFrameSchema, ["example_str", "example_int"])
+
+    assert cache.get(DataFrameSchema, ("example_str", "example_int")) is plan
+    assert cache.info() == (1, 1, 2, 1)
+
+
+def test_get_per_layout(cache: PlanCache):
+    plan = cache.get(DataFrameSchema, ["example_str", "example_int"])
+    other_plan = cache.get(DataFrameSchema, ["example_str", "example_int", "extra"], strict=True)
+
+    assert other_plan is not plan
+    assert other_plan.extra_columns == {"extra"}
+    # the schema level parts are shared between layouts
+    assert other_plan.adapter is plan.adapter
+    assert other_plan.columnar is plan.columnar
+
+
+def test_lru_eviction(cache: PlanCache):
+    first = cache.get(DataFrameSchema, ["a"])
+    cache.get(DataFrameSchema, ["b"])
+    cache.get(DataFrameSchema, ["a"])
+    cache.get(DataFrameSchema, ["c"])
+
+    assert len(cache) == 2
+    assert cache.get(DataFrameSchema, ["a"]) is first
+    assert cache.info().misses == 3
+
+
+def test_clear(cache: PlanCache):
+    cache.get(DataFrameSchema, ["a"])
+    cache.clear()
+
+    assert cache.info() == (0, 0, 2, 0)
+
+
+def test_validate_uses_plan_cache():
+    plan_cache.clear()
+    validator = Pandantic(schema=DataFrameSchema)
+    dataframe = pd.DataFrame(data={"example_str": ["foo", "bar"], "example_int": [1, 2]})
+
+    validator.validate(dataframe, errors="skip")
+    misses = plan_cache.info().misses
+    validator.validate(dataframe, errors="skip")
+    Pandantic(schema=DataFrameSchema).validate(dataframe.copy(), errors="skip")
+
+    assert plan_cache.info().misses == misses
+    assert validator._get_implementation(dataframe) is validator._get_implementation(dataframe)
@@ -0,0 +1,140 @@
+"""Tests the validation returning a DataFrame of the values as coerced by the schema."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from pandantic import Optional, Pandantic
+from pandantic.validators.coerced import compile_coercion_plan
+
+
+class PlainSchema(BaseModel):
+    """Example schema that can be vectorized."""
+
+    example_int: int
+    example_float: float
+    example_str: str
+    example_optional: Optional[int] = None
+
+
+class TransformingSchema(BaseModel):
+    """Example schema with a custom validator transforming its values."""
+
+    example_int: int
+    example_str: str
+    example_time: datetime.datetime
+    example_flag: bool = True
+
+    @field_validator("example_str")
+    def to_upper(cls, x: str) -> str:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator transforming the value."""
+        return x.upper()
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame with a non-unique index, of which only the last row is invalid."""
+    return pd.DataFrame(
+        data={
+            "example_int": ["1", "2", 3, "x"],
+            "example_str": ["foo", "bar", "baz", "qux"],
+            "example_time": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+        },
+        index=["a", "a", "b", "c"],
+    )
+
+
+def test_coerced(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=TransformingSchema)
+
+    coerced = validator.validate(dataframe, errors="skip", output="coerced")
+
+    expected = pd.DataFrame(
+        data={
+            "example_int": [1, 2, 3],
+            "example_str": pd.array(["FOO", "BAR", "BAZ"], dtype="string"),
+            "example_time": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "example_flag": [True, True, True],
+        },
+        index=["a", "a", "b"],
+    )
+    pd.testing.assert_frame_equal(coerced, expected)
+
+
+def test_coerced_parallel(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=TransformingSchema)
+
+    coerced = validator.validate(dataframe, errors="skip", output="coerced", n_jobs=2, chunk_size=1)
+
+    pd.testing.assert_frame_equal(
+        coerced, validator.validate(dataframe, errors="skip", output="coerced")
+    )
+
+
+def test_coerced_certified_rows():
+    """Test that rows certified column-wise and rows validated by pydantic are merged in order."""
+    validator = Pandantic(schema=PlainSchema)
+    # floats beyond 2**53 are not certified, but are valid ints all the same
+    dataframe = pd.DataFrame(
+        {
+            "example_int": [1.0, 1e17, 3.0, 4.5, 5.0],
+            "example_float": [0.5, 1.0, 2.0, 3.5, 4.0],
+            "example_str": ["foo", "bar", "baz", "qux", "quux"],
+            "example_optional": [1, np.nan, None, 4, 5],
+        },
+        index=[4, 3, 2, 1, 0],
+    )
+
+    coerced = validator.validate(dataframe, errors="skip", output="coerced")
+
+    assert compile_coercion_plan(PlainSchema).direct
+    expected = pd.DataFrame(
+        {
+            "example_int": [1, 10**17, 3, 5],
+            "example_float": [0.5, 1.0, 2.0, 4.0],
+            "example_str": pd.array(["foo", "bar", "baz", "quux"], dtype="string"),
+            "example_optional": pd.array([1, None, None, 5], dtype="Int64"),
+        },
+        index=[4, 3, 2, 0],
+    )
+    pd.testing.assert_frame_equal(coerced, expected)
+
+
+def test_coerced_int_overflow():
+    """Test that ints beyond 64 bits, valid for pydantic, are kept in an object column."""
+
+    class Model(BaseModel):
+        a: int
+
+    dataframe = pd.DataFrame({"a": [1, 2**70]}, dtype=object)
+
+    coerced = Pandantic(schema=Model).validate(dataframe, errors="skip", output="coerced")
+
+    assert coerced["a"].dtype == object
+    assert coerced["a"].tolist() == [1, 2**70]
+
+
+def test_coerced_raise(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=TransformingSchema)
+
+    with pytest.raises(ValidationError):
+        validator.validate(dataframe, output="coerced")
+    assert len(validator.validate(dataframe.iloc[:3], output="coerced")) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"output": "models"},
+        {"output": "coerced", "dedupe": True},
+        {"output": "coerced", "sample": 2},
+    ],
+)
+def test_coerced_invalid_args(dataframe: pd.DataFrame, kwargs):
+    validator = Pandantic(schema=TransformingSchema)
+
+    with pytest.raises(ValueError):
+        validator.validate(dataframe, errors="skip", **kwargs)
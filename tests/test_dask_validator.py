@@ -0,0 +1,100 @@
+"""Tests the DaskValidator, using the same schema as the pandas tests."""
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from pandantic import Pandantic
+
+
+dd = pytest.importorskip("dask.dataframe")
+dask = pytest.importorskip("dask")
+
+from pandantic.validators.dask import DaskValidator  # noqa: E402
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame of 100 rows, of which the ones with an odd int are invalid.
+
+    NOTE: `dd.from_pandas` sorts the index, and may convert strings to pyarrow strings, so the
+        index is a sorted integer one, and results are compared to those of the computed DataFrame.
+    """
+    return pd.DataFrame(
+        data={"example_str": ["foo"] * 100, "example_int": list(range(100))},
+        index=range(1000, 1100),
+    )
+
+
+def test_validate(dataframe: pd.DataFrame):
+    ddf = dd.from_pandas(dataframe, npartitions=4)
+    validator = Pandantic(schema=DataFrameSchema)
+
+    ddf_valid = validator.validate(ddf, errors="skip")
+
+    assert isinstance(ddf_valid, dd.DataFrame)
+    pd.testing.assert_frame_equal(
+        ddf_valid.compute(scheduler="sync"),
+        validator.validate(ddf.compute(scheduler="sync"), errors="skip"),
+    )
+
+
+def test_validate_raise(dataframe: pd.DataFrame):
+    ddf = dd.from_pandas(dataframe, npartitions=4)
+    validator = Pandantic(schema=DataFrameSchema)
+
+    # validation is lazy, the error is raised once the DataFrame is computed
+    ddf_valid = validator.validate(ddf, errors="raise")
+    with pytest.raises(ValidationError):
+        ddf_valid.compute(scheduler="sync")
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "threads", "processes"])
+def test_validate_count(dataframe: pd.DataFrame, scheduler: str):
+    ddf = dd.from_pandas(dataframe, npartitions=4)
+
+    ddf_valid, n_invalid = DaskValidator(schema=DataFrameSchema).validate_count(ddf)
+    df_valid, n_invalid = dask.compute(ddf_valid, n_invalid, scheduler=scheduler)
+
+    assert n_invalid == 50
+    assert list(df_valid["example_int"]) == list(range(0, 100, 2))
+
+
+def test_split(dataframe: pd.DataFrame):
+    ddf = dd.from_pandas(dataframe, npartitions=3)
+
+    ddf_valid, ddf_invalid = Pandantic(schema=DataFrameSchema).split(ddf)
+
+    assert len(ddf_valid.compute(scheduler="sync")) == 50
+    assert list(ddf_invalid.compute(scheduler="sync")["example_int"]) == list(range(1, 100, 2))
+
+
+def test_validate_report_unsupported(dataframe: pd.DataFrame):
+    ddf = dd.from_pandas(dataframe, npartitions=4)
+
+    with pytest.raises(TypeError, match="DaskValidator does not support validate_report"):
+        Pandantic(schema=DataFrameSchema).validate_report(ddf)
+
+
+def test_iterate(dataframe: pd.DataFrame):
+    ddf = dd.from_pandas(dataframe, npartitions=4)
+    validator = Pandantic(schema=DataFrameSchema)
+
+    items = list(validator.iterate(ddf, verbose=False))
+
+    assert items == list(validator.iterate(ddf.compute(scheduler="sync"), verbose=False))
+    assert [index for index, _ in items] == list(dataframe.index[::2])
@@ -0,0 +1,205 @@
+"""Tests the fields pre-validated by the dtypes of their columns."""
+
+import datetime
+from typing import Annotated
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+from pandantic import Optional, Pandantic, ValidationStats, plan_cache
+from pandantic.validators.dtypes import compile_dtype_candidates
+
+
+class TypedSchema(BaseModel):
+    """Example schema of plain fields only."""
+
+    example_int: int
+    example_float: float
+    example_time: datetime.datetime
+    example_str: str
+    example_optional: Optional[int] = None
+
+
+class ValidatedSchema(BaseModel):
+    """Example schema with a field validator that only looks at its own field."""
+
+    example_int: int
+    example_time: datetime.datetime
+    example_str: str
+
+    @field_validator("example_str")
+    def validate_country(cls, x: str) -> str:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator."""
+        if x not in ("USA", "UK"):
+            raise ValueError(f"example_str must be a country, is {x}.")
+        return x
+
+
+class ModelValidatedSchema(BaseModel):
+    """Example schema with a model validator looking at a field of a typed column."""
+
+    example_int: int
+    example_bounded: int = Field(ge=0)
+
+    @model_validator(mode="after")
+    def validate_even(self) -> "ModelValidatedSchema":
+        """Example custom validator across fields."""
+        if self.example_int % 2 != 0:
+            raise ValueError(f"example_int must be even, is {self.example_int}.")
+        return self
+
+
+def compile_dtype_plan(schema, dataframe: pd.DataFrame):
+    """Resolve the dtype candidates of the schema against the DataFrame."""
+    candidates = compile_dtype_candidates(schema)
+    return candidates.resolve(dataframe) if candidates is not None else None
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame of correctly typed columns."""
+    return pd.DataFrame(
+        {
+            "example_int": np.arange(6),
+            "example_float": np.linspace(0, 1, 6),
+            "example_time": pd.date_range("2024-01-01", periods=6, freq="D"),
+            "example_str": pd.array(["USA", "UK", "USA", "NL", "UK", "USA"], dtype="string"),
+            "example_optional": pd.array([1, None, 3, None, 5, 6], dtype="Int64"),
+        },
+        index=list("abcdef"),
+    )
+
+
+def test_dtype_plan(dataframe: pd.DataFrame):
+    plan = compile_dtype_plan(TypedSchema, dataframe)
+
+    assert plan is not None
+    assert plan.fields == tuple(TypedSchema.model_fields)
+    assert plan.complete
+
+
+@pytest.mark.parametrize(
+    "column, values",
+    [
+        ("example_int", np.linspace(0, 5, 6)),
+        ("example_int", [True, False] * 3),
+        ("example_str", ["USA"] * 6),
+        ("example_str", pd.array(["USA", None] * 3, dtype="string")),
+        ("example_time", ["2024-01-01"] * 6),
+        ("example_time", pd.to_datetime(["2024-01-01", None] * 3)),
+    ],
+)
+def test_dtype_plan_not_guaranteed(dataframe: pd.DataFrame, column: str, values):
+    dataframe[column] = values
+
+    plan = compile_dtype_plan(TypedSchema, dataframe)
+
+    assert plan is not None
+    assert column not in plan.fields
+    assert not plan.complete
+
+
+def test_validate_complete(dataframe: pd.DataFrame):
+    stats = ValidationStats()
+
+    df_valid = Pandantic(schema=TypedSchema).validate(dataframe, errors="skip", stats=stats)
+
+    assert df_valid is dataframe
+    assert stats.certified_rows == len(dataframe)
+
+
+def test_validate_validated_field(dataframe: pd.DataFrame):
+    plan = compile_dtype_plan(ValidatedSchema, dataframe)
+
+    df_valid, errors = Pandantic(schema=ValidatedSchema).validate_report(dataframe)
+
+    assert plan is not None
+    assert plan.fields == ("example_int", "example_time")
+    assert plan.exclude == frozenset(plan.fields)
+    assert list(df_valid.index) == ["a", "b", "c", "e", "f"]
+    assert errors[["index", "loc"]].values.tolist() == [["d", "example_str"]]
+
+
+def test_validate_model_validator():
+    dataframe = pd.DataFrame({"example_int": np.arange(6), "example_bounded": np.arange(-2, 4)})
+    plan = compile_dtype_plan(ModelValidatedSchema, dataframe)
+
+    df_valid = Pandantic(schema=ModelValidatedSchema).validate(dataframe, errors="skip")
+
+    # the model validator looks at the pre-validated field, so it is not left out
+    assert plan is not None
+    assert plan.fields == ("example_int",)
+    assert plan.exclude == frozenset()
+    assert df_valid["example_int"].tolist() == [2, 4]
+
+
+def test_coerced_complete(dataframe: pd.DataFrame):
+    coerced = Pandantic(schema=TypedSchema).validate(dataframe, output="coerced")
+
+    assert coerced["example_time"].equals(dataframe["example_time"])
+    assert coerced.dtypes.astype(str).tolist() == [
+        "int64",
+        "float64",
+        "datetime64[ns]",
+        "string",
+        "Int64",
+    ]
+
+
+def check_against_a(x: int, info: ValidationInfo) -> int:
+    """Example annotated validator comparing a field to the field a."""
+    if x <= info.data["a"]:
+        raise ValueError("b must be greater than a")
+    return x
+
+
+class AnnotatedInfoSchema(BaseModel):
+    """Example schema with an annotated validator looking at a typed column."""
+
+    a: int
+    b: Annotated[int, AfterValidator(check_against_a)]
+
+
+def test_validate_annotated_dependent_fields():
+    # a high cardinality column, so that its values are not validated per distinct value
+    dataframe = pd.DataFrame({"a": np.full(1000, 2000), "b": np.arange(1000)})
+    plan = compile_dtype_plan(AnnotatedInfoSchema, dataframe)
+
+    df_valid = Pandantic(schema=AnnotatedInfoSchema).validate(dataframe, errors="skip")
+
+    # the annotated validator looks at the pre-validated field, so it is not left out
+    assert plan is not None
+    assert plan.fields == ("a",)
+    assert plan.exclude == frozenset()
+    assert df_valid.empty
+
+
+def test_validate_excluded_fields(dataframe: pd.DataFrame):
+    plan = compile_dtype_plan(ValidatedSchema, dataframe)
+
+    assert plan is not None
+    models = plan.adapter(plan.exclude).validate_python([{"example_str": "UK"}])
+    # the excluded fields are left out of the models, rather than made up
+    assert models[0].model_dump() == {"example_str": "UK"}
+    with pytest.raises(ValueError):
+        plan.adapter().validate_python([{"example_str": "UK"}])
+
+
+def test_candidates_are_cached():
+    plan_cache.clear()
+
+    candidates = plan_cache.get(TypedSchema, TypedSchema.model_fields).dtypes
+
+    assert candidates is not None
+    assert plan_cache.get(TypedSchema).dtypes is candidates
+    plan_cache.clear()
+    assert plan_cache.get(TypedSchema).dtypes is not candidates
@@ -26,3 +26,18 @@ def test_get_pandas_implementation(df: pd.DataFrame):
     base_model_validator = Pandantic(PydanticBasdeModel)
     impl = base_model_validator._get_implementation(df)
     assert isinstance(impl, PandasValidator)
+
+
+def test_get_pandas_subclass_implementation(df: pd.DataFrame):
+    class SubclassedDataFrame(pd.DataFrame):
+        pass
+
+    base_model_validator = Pandantic(PydanticBasdeModel)
+    impl = base_model_validator._get_implementation(SubclassedDataFrame(df))
+    assert isinstance(impl, PandasValidator)
+
+
+def test_get_implementation_series(df: pd.DataFrame):
+    base_model_validator = Pandantic(PydanticBasdeModel)
+    with pytest.raises(TypeError):
+        base_model_validator.validate(df["a"])
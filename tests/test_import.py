@@ -0,0 +1,36 @@
+"""Tests that importing pandantic stays cheap, i.e. it does not import any backend eagerly."""
+
+import pytest
+
+from benchmarks.importtime import LAZY_MODULES, import_times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import pandantic",
+        "from pandantic import Pandantic, Optional",
+        "from pandantic import Pandantic; Pandantic",
+        "from pandantic.validators import BaseValidator",
+    ],
+)
+def test_import_is_lazy(statement: str):
+    times = import_times(statement)
+
+    assert "pandantic" in times
+    assert [module for module in LAZY_MODULES if module in times] == []
+
+
+def test_import_on_use():
+    statement = (
+        "import pandas as pd; from pydantic import BaseModel; from pandantic import Pandantic\n"
+        "class Model(BaseModel):\n"
+        "    a: int\n"
+        "Pandantic(schema=Model).validate(pd.DataFrame({'a': [1, 2]}), n_jobs=1)"
+    )
+
+    times = import_times(statement)
+
+    # a single process never needs the multiprocessing machinery
+    assert "pandantic.validators.pandas" in times
+    assert "multiprocess" not in times
@@ -0,0 +1,116 @@
+"""Tests the IncrementalValidator, re-validating only the changed rows of a DataFrame."""
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from pandantic import IncrementalValidator
+from pandantic.validators.pandas import PandasValidator
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def validated_rows(monkeypatch) -> list[int]:
+    """Fixture recording the number of rows validated by each call of the PandasValidator."""
+    calls: list[int] = []
+    valid_mask = PandasValidator._valid_mask
+
+    def _valid_mask(self, dataframe, *args, **kwargs):
+        calls.append(len(dataframe))
+        return valid_mask(self, dataframe, *args, **kwargs)
+
+    monkeypatch.setattr(PandasValidator, "_valid_mask", _valid_mask)
+    return calls
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """Fixture for a DataFrame with every other row invalid."""
+    return pd.DataFrame(
+        data={"example_str": [f"row {i}" for i in range(10)], "example_int": list(range(10))}
+    )
+
+
+def test_revalidates_changed_rows(dataframe: pd.DataFrame, validated_rows: list[int]):
+    # GIVEN
+    validator = IncrementalValidator(schema=DataFrameSchema)
+    first = validator.validate(dataframe, errors="skip")
+
+    # WHEN
+    changed = pd.concat([dataframe, pd.DataFrame({"example_str": ["new"], "example_int": [10]})])
+    changed.iloc[0, 1] = 1
+    second = validator.validate(changed, errors="skip")
+
+    # THEN
+    assert first.equals(dataframe.iloc[::2])
+    assert validated_rows == [10, 2]
+    assert second.equals(changed.iloc[[2, 4, 6, 8, 10]])
+    assert len(validator) == 11
+
+
+def test_reset_on_new_layout_or_context(dataframe: pd.DataFrame, validated_rows: list[int]):
+    validator = IncrementalValidator(schema=DataFrameSchema)
+
+    validator.validate(dataframe, errors="skip")
+    validator.validate(dataframe, errors="skip", context={"key": "value"})
+    validator.validate(dataframe.astype({"example_int": "int32"}), errors="skip")
+    validator.reset()
+    validator.validate(dataframe, errors="skip")
+
+    assert validated_rows == [10] * 4
+
+
+def test_known_invalid_rows_still_raise(dataframe: pd.DataFrame, validated_rows: list[int]):
+    validator = IncrementalValidator(schema=DataFrameSchema)
+    validator.validate(dataframe, errors="skip")
+
+    with pytest.raises(ValidationError):
+        validator.validate(dataframe, errors="raise")
+    # the known valid rows are not validated again
+    assert validated_rows == [10, 5]
+
+    with pytest.raises(ValueError):
+        validator.validate(dataframe.assign(extra=1), strict=True)
+
+
+def test_reset_on_context_mutated_in_place(dataframe: pd.DataFrame, validated_rows: list[int]):
+    validator = IncrementalValidator(schema=DataFrameSchema)
+    context = {"countries": ["USA"]}
+
+    validator.validate(dataframe, errors="skip", context=context)
+    validator.validate(dataframe, errors="skip", context=context)
+    context["countries"].append("UK")
+    validator.validate(dataframe, errors="skip", context=context)
+
+    assert validated_rows == [10, 0, 10]
+
+
+def test_unhashable_values(validated_rows: list[int]):
+    class TagSchema(BaseModel):
+        """Example schema with a list field."""
+
+        tags: list[str]
+
+    dataframe = pd.DataFrame(data={"tags": [["a"], ["b"], [1]]})
+    validator = IncrementalValidator(schema=TagSchema)
+
+    first = validator.validate(dataframe, errors="skip")
+    dataframe.iloc[2, 0] = ["c"]
+    second = validator.validate(dataframe, errors="skip")
+
+    assert first.equals(dataframe.iloc[:2])
+    assert second.equals(dataframe)
+    assert validated_rows == [3, 1]
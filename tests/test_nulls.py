@@ -0,0 +1,127 @@
+"""Tests the vectorized normalization of the missing values of `pandantic.Optional` fields."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, field_validator
+
+from pandantic import Optional, Pandantic
+from pandantic.types_pandantic import coerce_nan_to_none
+from pandantic.validators.nulls import compile_null_plan, nullable_fields
+from pandantic.validators.vectorized import compile_columnar_plan
+
+
+class OptionalSchema(BaseModel):
+    """Example schema with optional fields."""
+
+    example_int: Optional[int] = None
+    example_float: Optional[float] = None
+    example_str: Optional[str]
+    example_time: Optional[pd.Timestamp] = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+
+class BeforeValidatorSchema(BaseModel):
+    """Example schema with a validator seeing the raw values of an optional field."""
+
+    example_int: Optional[int] = None
+    example_str: Optional[str] = None
+
+    @field_validator("example_int", mode="before")
+    def reject_nan(cls, x):  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator telling NaN from None."""
+        if isinstance(x, float) and np.isnan(x):
+            raise ValueError("example_int must not be NaN.")
+        return x
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame with every flavour of missing value, and a single invalid (last) row."""
+    return pd.DataFrame(
+        {
+            "example_int": pd.array([1, None, 3, 4], dtype="Int64"),
+            "example_float": [1.5, np.nan, 2.5, None],
+            "example_str": pd.array(["foo", None, "bar", "baz"], dtype="string"),
+            "example_time": pd.to_datetime(["2024-01-01", None, "2024-01-03", "2024-01-04"]),
+        }
+    ).astype({"example_float": object})
+
+
+@pytest.mark.parametrize(
+    "value", [None, float("nan"), np.float32("nan"), pd.NA, pd.NaT, np.datetime64("NaT")]
+)
+def test_coerce_nan_to_none(value):
+    assert coerce_nan_to_none(value) is None
+
+
+@pytest.mark.parametrize("value", [0, 1.5, "nan", pd.Timestamp("2024-01-01")])
+def test_coerce_nan_to_none_values(value):
+    assert coerce_nan_to_none(value) is value
+
+
+def test_null_plan_normalize(dataframe: pd.DataFrame):
+    plan = compile_null_plan(OptionalSchema)
+
+    normalized = plan.normalize(dataframe)
+
+    assert plan.columns == nullable_fields(OptionalSchema)
+    assert normalized.iloc[1].tolist() == [None, None, None, None]
+    assert normalized.iloc[0].tolist() == dataframe.iloc[0].tolist()
+    # the DataFrame itself is left as is
+    assert dataframe["example_int"].dtype == "Int64"
+    # rows without missing values are returned as is
+    complete = dataframe.iloc[[0, 2]]
+    assert plan.normalize(complete) is complete
+
+
+def test_null_plan_normalize_duplicated_columns():
+    plan = compile_null_plan(OptionalSchema)
+    dataframe = pd.DataFrame([[1.5, np.nan], [np.nan, 2.5]], columns=["example_float"] * 2)
+
+    normalized = plan.normalize(dataframe)
+
+    assert normalized.columns.tolist() == ["example_float"] * 2
+    assert normalized.to_numpy().tolist() == [[1.5, None], [None, 2.5]]
+
+
+def test_null_plan_skips_before_validators():
+    plan = compile_null_plan(BeforeValidatorSchema)
+
+    assert plan.columns == ("example_str",)
+
+
+def test_validate_missing_values(dataframe: pd.DataFrame):
+    dataframe.loc[3, "example_float"] = "foo"
+    validator = Pandantic(schema=OptionalSchema)
+
+    df_valid = validator.validate(dataframe, errors="skip")
+
+    assert list(df_valid.index) == [0, 1, 2]
+
+
+def test_validate_before_validator():
+    validator = Pandantic(schema=BeforeValidatorSchema)
+    dataframe = pd.DataFrame({"example_int": [1.0, np.nan, 3.0], "example_str": ["a", None, "c"]})
+
+    df_valid = validator.validate(dataframe, errors="skip")
+
+    assert list(df_valid.index) == [0, 2]
+
+
+def test_optional_fields_are_vectorized():
+    class Schema(BaseModel):
+        example_int: Optional[int] = None
+        example_str: Optional[str] = None
+
+    plan = compile_columnar_plan(Schema)
+    dataframe = pd.DataFrame(
+        {
+            "example_int": [1.0, np.nan, 2.5, 3.0],
+            "example_str": ["foo", None, "bar", np.nan],
+        }
+    )
+
+    assert plan is not None
+    assert plan.certify(dataframe).tolist() == [True, True, False, True]
@@ -72,6 +72,20 @@ def test_itertuples(dataframe: pd.DataFrame):
     assert isinstance(out_list[0], tuple)
 
 
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_itertuples_skips_invalid_rows(chunksize):
+    import pandantic.plugins.pandas
+
+    dataframe = pd.DataFrame(
+        data={"str_col": ["foo", "bar", "baz", "qux"], "float_col": [1.0, "x", 3.5, None]},
+        index=[0, 0, 1, 1],
+    )
+
+    out_list = list(dataframe.pandantic.itertuples(DataFrameSchema2, chunksize=chunksize))
+
+    assert out_list == [(0, "foo", 1.0), (1, "baz", 3.5)]
+
+
 def test_iterrows(dataframe: pd.DataFrame):
     import pandantic.plugins.pandas
 
@@ -96,3 +110,27 @@ def test_iterschemas(dataframe: pd.DataFrame):
     assert isinstance(out_list[0], tuple)
     assert len(out_list[0]) == 2
     assert issubclass(type(out_list[0][1]), DataFrameSchema1)
+
+
+def test_filter_dedupe():
+    import pandantic.plugins.pandas
+
+    dataframe = pd.DataFrame(data={"str_col": ["foo", "bar"] * 3, "float_col": [1.0, "x"] * 3})
+
+    assert dataframe.pandantic.filter(schema=DataFrameSchema2, dedupe=True).equals(
+        dataframe.iloc[::2]
+    )
+
+
+def test_mask():
+    import pandantic.plugins.pandas
+
+    dataframe = pd.DataFrame(
+        data={"str_col": ["foo", "bar", "baz"], "float_col": [1.0, "x", 3.5]},
+        index=[0, 0, 0],
+    )
+
+    mask = dataframe.pandantic.mask(DataFrameSchema2)
+
+    assert mask.tolist() == [True, False, True]
+    assert dataframe[mask].equals(dataframe.iloc[[0, 2]])
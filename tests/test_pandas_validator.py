@@ -5,13 +5,21 @@ pydantic model w/ a custom int and str column validator:
 """
 
 import logging
+import sys
+import time
 from typing import Optional
 
 import pandas as pd
 import pytest
-from pydantic import BaseModel, field_validator
+from pydantic import (
+    BaseModel,
+    StrictInt,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
-from pandantic.validators.pandas import PandasValidator
+from pandantic.validators.pandas import PandasValidator, _records
 
 
 logging.basicConfig(level=logging.DEBUG)
@@ -181,3 +189,356 @@ def test_strict_mode():
             strict=True,
             errors="raise",
         )
+
+
+def test_batch_maps_errors_to_index_labels(validator: PandasValidator, monkeypatch):
+    """Test that invalid rows are mapped back to their index labels across batches."""
+    # GIVEN
+    monkeypatch.setattr("pandantic.validators.pandas.BATCH_SIZE", 2)
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "foo", "UK", "CANADA", "UK"],
+            "example_int": [2, 4, 3, 12, 6],
+        },
+        index=["a", "b", "c", "d", "e"],
+    )
+
+    # WHEN
+    result = validator.validate(df_example, errors="log")
+
+    # THEN
+    assert result.equals(df_example.drop(index=["b", "c"]))
+
+
+def test_batch_model_validator_fail():
+    """Test that model-level validation errors are mapped to the failing rows."""
+
+    # GIVEN
+    class Model(BaseModel):
+        a: int
+        b: int
+
+        @model_validator(mode="after")
+        def check_a_lower_than_b(self) -> "Model":
+            if self.a >= self.b:
+                raise ValueError("a must be lower than b")
+            return self
+
+    df_example = pd.DataFrame({"a": [1, 5, 2], "b": [2, 3, 4]})
+    validator = PandasValidator(schema=Model)
+
+    # WHEN
+    df_skipped = validator.validate(df_example, errors="skip")
+
+    # THEN
+    assert df_skipped.equals(df_example.drop(index=[1]))
+
+    with pytest.raises(ValidationError, match="a must be lower than b"):
+        validator.validate(df_example, errors="raise")
+
+
+@pytest.mark.parametrize("n_jobs", [2, 4, -1])
+@pytest.mark.parametrize("chunk_size", [None, 1, 7])
+def test_parallel_matches_serial(validator: PandasValidator, n_jobs: int, chunk_size: int):
+    """Test that parallel validation filters the same rows as serial validation."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "UK", "foo", "CANADA"] * 25,
+            "example_int": list(range(100)),
+        },
+    )
+
+    # WHEN
+    result = validator.validate(df_example, errors="skip", n_jobs=n_jobs, chunk_size=chunk_size)
+
+    # THEN
+    assert result.equals(validator.validate(df_example, errors="skip"))
+    assert len(result) == 25
+
+
+def test_invalid_n_jobs_and_chunk_size(validator: PandasValidator):
+    df_example = pd.DataFrame(data={"example_str": ["USA"], "example_int": [2]})
+
+    with pytest.raises(ValueError):
+        validator.validate(df_example, n_jobs=0)
+
+    with pytest.raises(ValueError):
+        validator.validate(df_example, chunk_size=0)
+
+    with pytest.warns(DeprecationWarning):
+        validator.validate(df_example, queue=object())
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_validate_report(validator: PandasValidator, n_jobs: int):
+    """Test that the errors are reported per index label and field."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "foo", "UK", "bar"],
+            "example_int": [2, 4, "x", 3],
+        },
+        index=["a", "b", "c", "d"],
+    )
+
+    # WHEN
+    df_valid, df_errors = validator.validate_report(df_example, n_jobs=n_jobs, chunk_size=2)
+
+    # THEN
+    assert df_valid.equals(df_example.loc[["a"]])
+    assert list(df_errors.columns) == ["index", "loc", "type", "msg", "input"]
+    assert df_errors[["index", "loc", "type"]].values.tolist() == [
+        ["b", "example_str", "value_error"],
+        ["c", "example_int", "int_parsing"],
+        ["d", "example_str", "value_error"],
+        ["d", "example_int", "value_error"],
+    ]
+    assert df_errors["input"].tolist() == ["foo", "x", "bar", 3]
+
+
+def test_validate_report_max_errors(validator: PandasValidator):
+    """Test that the report is capped, while all invalid rows are still filtered."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["foo"] * 10,
+            "example_int": [1] * 10,
+        },
+    )
+
+    # WHEN
+    df_valid, df_errors = validator.validate_report(df_example, max_errors=3, chunk_size=2)
+
+    # THEN
+    assert df_valid.empty
+    assert len(df_errors) == 3
+
+    _, df_errors = validator.validate_report(df_example.iloc[:0])
+    assert df_errors.empty
+    assert list(df_errors.columns) == ["index", "loc", "type", "msg", "input"]
+
+
+class SlowSchema(BaseModel):
+    """Example schema that takes a while to validate valid rows."""
+
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_slowly(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator that is slow for valid values."""
+        if x < 0:
+            raise ValueError(f"example_int must be positive, is {x}.")
+        time.sleep(0.1)
+        return x
+
+
+def test_parallel_raise_fails_fast():
+    """Test that the first error in raise mode stops all workers."""
+    # GIVEN
+    validator = PandasValidator(schema=SlowSchema)
+    df_example = pd.DataFrame(data={"example_int": [-1] + [1] * 99})
+
+    # WHEN
+    start = time.perf_counter()
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate(df_example, errors="raise", n_jobs=2, chunk_size=5)
+
+    # THEN
+    # validating all (valid) rows takes ~5 seconds using 2 processes
+    assert time.perf_counter() - start < 3
+    if sys.version_info >= (3, 11):
+        assert exc_info.value.__notes__ == ["Validation error found at index 0"]
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 7])
+def test_iterate(validator: PandasValidator, batch_size: Optional[int]):
+    """Test that iterate yields the models of the valid rows, in batches if requested."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "UK", "foo", "CANADA"] * 5,
+            "example_int": list(range(20)),
+            "example_float": [0.5] * 20,
+        },
+        index=range(100, 120),
+    )
+
+    # WHEN
+    out = list(validator.iterate(df_example, batch_size=batch_size))
+    if batch_size is not None:
+        assert all(0 < len(batch) <= batch_size for batch in out)
+        out = [pair for batch in out for pair in batch]
+
+    # THEN
+    assert [index for index, _ in out] == [100, 104, 108, 112, 116]
+    # the int column is not upcast to float by the float column
+    assert out[1][1] == DataFrameSchema(example_str="USA", example_int=4)
+
+
+def test_iterate_invalid_batch_size(validator: PandasValidator):
+    df_example = pd.DataFrame(data={"example_str": ["USA"], "example_int": [2]})
+
+    with pytest.raises(ValueError):
+        list(validator.iterate(df_example, batch_size=0))
+
+
+@pytest.mark.parametrize("errors", ["skip", "log"])
+def test_dedupe_matches_validate(validator: PandasValidator, errors: str, monkeypatch):
+    """Test that deduplicated validation filters the same rows, validating distinct rows once."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "UK", "foo", "CANADA"] * 25,
+            "example_int": [2, 4, 6, 7] * 25,
+            "extra": range(100),
+        },
+        index=[0, 1] * 50,
+    )
+    validated_rows = []
+    valid_mask = PandasValidator._valid_mask
+
+    def _valid_mask(self, dataframe, *args, **kwargs):
+        validated_rows.append(len(dataframe))
+        return valid_mask(self, dataframe, *args, **kwargs)
+
+    monkeypatch.setattr(PandasValidator, "_valid_mask", _valid_mask)
+
+    # WHEN
+    result = validator.validate(df_example, errors=errors, dedupe=True)
+
+    # THEN
+    # the extra column is not part of the schema, so there are only 4 distinct rows
+    assert validated_rows == [4]
+    assert result.equals(df_example.iloc[[i for i in range(100) if i % 4 < 2]])
+
+
+def test_dedupe_raise(validator: PandasValidator):
+    df_example = pd.DataFrame(
+        data={"example_str": ["USA", "UK", "USA", "foo"], "example_int": [2, 4, 2, 2]},
+        index=list("abcd"),
+    )
+
+    assert validator.validate(df_example.iloc[:3], dedupe=True).equals(df_example.iloc[:3])
+    with pytest.raises(ValidationError) as exc_info:
+        validator.validate(df_example, dedupe=True)
+    if sys.version_info >= (3, 11):
+        assert exc_info.value.__notes__ == ["Validation error found at index d"]
+
+
+def test_dedupe_unhashable_values():
+    class TagSchema(BaseModel):
+        """Example schema with a list field."""
+
+        tags: list[str]
+
+    df_example = pd.DataFrame(
+        data={"tags": [["a", "b"], ["a", "b"], {"a": 1}, ["a", 1], ["a", "1"]]},
+    )
+
+    result = PandasValidator(schema=TagSchema).validate(df_example, errors="skip", dedupe=True)
+
+    assert result.equals(df_example.iloc[[0, 1, 4]])
+
+
+def test_dedupe_mixed_types():
+    class StrictSchema(BaseModel):
+        """Example schema with a strict field."""
+
+        example_int: StrictInt
+
+    # pandas hashes these values to the same, pydantic validates them differently
+    df_example = pd.DataFrame(data={"example_int": pd.Series([1, "1", 1.0, True], dtype=object)})
+
+    result = PandasValidator(schema=StrictSchema).validate(df_example, errors="skip", dedupe=True)
+
+    assert result.equals(df_example.iloc[:1])
+
+
+def test_records_match_to_dict():
+    """Test that the column-wise row dictionaries equal those of `to_dict("records")`."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # GIVEN
+    df_example = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, np.nan, 3.0],
+            "object": [np.int64(1), "foo", np.datetime64("2024-01-01")],
+            "nullable": pd.array([1, None, 3], dtype="Int64"),
+            "time": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+            "category": pd.Categorical(["a", "b", "a"]),
+        }
+    )
+
+    # WHEN
+    records = _records(df_example)
+
+    # THEN
+    expected = df_example.to_dict("records")
+    assert [str(row) for row in records] == [str(row) for row in expected]
+    assert [[type(value) for value in row.values()] for row in records] == [
+        [type(value) for value in row.values()] for row in expected
+    ]
+
+
+def test_chunks_bound_row_dictionaries(validator: PandasValidator, monkeypatch):
+    """Test that the rows are converted to dictionaries one chunk at a time."""
+    # GIVEN
+    converted: list[int] = []
+
+    def _spy(chunk: pd.DataFrame, **kwargs) -> list:
+        converted.append(len(chunk))
+        return _records(chunk, **kwargs)
+
+    monkeypatch.setattr("pandantic.validators.pandas._records", _spy)
+    df_example = pd.DataFrame(
+        data={
+            "example_str": ["USA", "UK", "foo", "CANADA"] * 25,
+            "example_int": list(range(100)),
+        },
+    )
+
+    # WHEN
+    chunks = validator._split_pending(df_example, chunk_size=30)  # pylint: disable=protected-access
+    result = validator.validate(df_example, errors="skip", chunk_size=30)
+
+    # THEN
+    assert len(chunks) == 4
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert converted == [30, 30, 30, 10]
+    assert len(result) == 25
+
+
+def test_non_unique_index(validator: PandasValidator):
+    """Test that only the invalid row of rows sharing an index label is dropped."""
+    # GIVEN
+    df_example = pd.DataFrame(
+        data={"example_str": ["USA", "UK", "foo", "CANADA"], "example_int": [2, 4, 6, 8]},
+        index=["a", "b", "a", "b"],
+    )
+
+    # WHEN
+    df_valid = validator.validate(df_example, errors="skip")
+    df_report, errors_df = validator.validate_report(df_example)
+
+    # THEN
+    assert df_valid.equals(df_example.iloc[[0, 1, 3]])
+    assert df_report.equals(df_example.iloc[[0, 1, 3]])
+    assert errors_df["index"].tolist() == ["a"]
+
+
+def test_validity_mask_and_split(validator: PandasValidator):
+    df_example = pd.DataFrame(
+        data={"example_str": ["USA", "UK", "foo", "CANADA"], "example_int": [2, 3, 6, 8]},
+        index=[0, 0, 0, 1],
+    )
+
+    mask = validator.validity_mask(df_example)
+    df_valid, df_invalid = validator.split(df_example, chunk_size=2, n_jobs=2)
+
+    assert mask.tolist() == [True, False, False, True]
+    assert df_valid.equals(df_example[mask])
+    assert df_invalid.equals(df_example[~mask])
+    with pytest.raises(ValueError):
+        validator.validity_mask(df_example, errors="ignore")
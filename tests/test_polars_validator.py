@@ -0,0 +1,181 @@
+"""Tests the PolarsValidator, using the same schemas as the pandas tests."""
+
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from pandantic import Optional, Pandantic, plan_cache
+
+
+pl = pytest.importorskip("polars")
+
+from pandantic.validators.polars import PolarsValidator  # noqa: E402
+
+
+class ScalarSchema(BaseModel):
+    """Example schema made of plain, constrained scalars."""
+
+    example_str: str
+    example_int: int = Field(ge=0)
+    example_optional: Optional[float] = None
+
+
+class EvenSchema(BaseModel):
+    """Example schema with a custom validator."""
+
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def dataframe() -> "pl.DataFrame":
+    """Fixture for a polars DataFrame with the first and last row invalid."""
+    return pl.DataFrame(
+        data={
+            "example_str": [None, "bar", "baz", "qux"],
+            "example_int": [1, 2, 4, -3],
+            "example_optional": [1.0, None, 2.5, None],
+        }
+    )
+
+
+def test_get_polars_implementation(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    assert isinstance(validator._get_implementation(dataframe), PolarsValidator)
+    assert isinstance(validator._get_implementation(dataframe.lazy()), PolarsValidator)
+
+
+@pytest.mark.parametrize("schema", [ScalarSchema, EvenSchema])
+def test_validate_skip(dataframe: "pl.DataFrame", schema):
+    validator = Pandantic(schema=schema)
+
+    result = validator.validate(dataframe, errors="skip")
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.equals(dataframe[1:3])
+
+
+def test_validate_raise(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    assert validator.validate(dataframe[1:3], errors="raise").equals(dataframe[1:3])
+    with pytest.raises(ValidationError):
+        validator.validate(dataframe, errors="raise")
+
+
+def test_validate_strict(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=EvenSchema)
+
+    with pytest.raises(ValueError):
+        validator.validate(dataframe, errors="skip", strict=True)
+
+
+def test_validate_lazyframe(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    result = validator.validate(dataframe.lazy(), errors="log", batch_size=3)
+
+    assert result.equals(dataframe[1:3])
+
+
+def test_iterate(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    out_list = list(validator.iterate(dataframe))
+
+    assert [i for i, _ in out_list] == [1, 2]
+    assert isinstance(out_list[0][1], ScalarSchema)
+    # the row numbers continue across batches
+    assert [i for i, _ in validator.iterate(dataframe.lazy(), batch_size=3)] == [1, 2]
+
+
+def test_validity_mask(dataframe: "pl.DataFrame"):
+    validator = Pandantic(schema=ScalarSchema)
+
+    expected = [False, True, True, False]
+    assert validator.validity_mask(dataframe).to_list() == expected
+    # the mask continues across batches
+    assert validator.validity_mask(dataframe.lazy(), batch_size=3).to_list() == expected
+    with pytest.raises(ValidationError):
+        validator.validity_mask(dataframe, errors="raise")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_split(dataframe: "pl.DataFrame", lazy: bool):
+    validator = Pandantic(schema=ScalarSchema)
+
+    valid, invalid = validator.split(dataframe.lazy() if lazy else dataframe, batch_size=3)
+
+    assert valid.equals(dataframe[1:3])
+    assert invalid.equals(dataframe[[0, 3]])
+
+
+def test_validate_report_unsupported(dataframe: "pl.DataFrame"):
+    with pytest.raises(TypeError, match="PolarsValidator does not support validate_report"):
+        Pandantic(schema=ScalarSchema).validate_report(dataframe)
+
+
+def test_certify_with_expressions(dataframe: "pl.DataFrame"):
+    class Model(BaseModel):
+        example_str: str = Field(max_length=3)
+        example_int: int = Field(ge=0)
+
+    validator = PolarsValidator(schema=Model)
+    plan = plan_cache.get(Model, dataframe.columns)
+
+    certified = validator._certify(dataframe, plan)
+
+    assert plan.columnar is not None
+    assert certified.to_list() == [False, True, True, False]
+    assert validator.validate(dataframe, errors="skip").equals(dataframe[1:3])
+
+
+def test_certify_nan_bounds():
+    class Model(BaseModel):
+        x: float = Field(gt=0)
+
+    dataframe = pl.DataFrame(data={"x": [1.0, float("nan"), -1.0, float("inf")]})
+    plan = plan_cache.get(Model, dataframe.columns)
+
+    certified = PolarsValidator(schema=Model)._certify(dataframe, plan)
+
+    # Polars orders NaN above all numbers, pydantic rejects it for any bound
+    assert certified.to_list() == [True, False, False, True]
+    assert PolarsValidator(schema=Model).validate(dataframe, errors="skip")["x"].to_list() == [
+        1.0,
+        float("inf"),
+    ]
+
+
+def test_certify_decimal_int():
+    class Model(BaseModel):
+        x: int
+
+    dataframe = pl.DataFrame(data={"x": [Decimal("1"), Decimal("1.5")]})
+    plan = plan_cache.get(Model, dataframe.columns)
+
+    certified = PolarsValidator(schema=Model)._certify(dataframe, plan)
+
+    # Decimal columns are numeric in Polars, but pydantic rejects fractional values for an int
+    assert certified.to_list() == [False, False]
+    assert PolarsValidator(schema=Model).validate(dataframe, errors="skip").equals(dataframe[:1])
+
+
+def test_validate_python_re_pattern():
+    class Model(BaseModel):
+        model_config = ConfigDict(regex_engine="python-re")
+
+        x: str = Field(pattern=r"^(?=a)(\w)\1$")
+
+    dataframe = pl.DataFrame(data={"x": ["aa", "ab", "ba"]})
+
+    # the Rust regex engine of Polars supports neither lookarounds nor backreferences
+    assert PolarsValidator(schema=Model).validate(dataframe, errors="skip").equals(dataframe[:1])
@@ -0,0 +1,75 @@
+"""Tests the chunked validation of CSV and Parquet files."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pandantic import Pandantic
+from pandantic.readers import infer_file_format, read_chunks
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """Fixture for a dataframe with every third row invalid."""
+    return pd.DataFrame(
+        data={
+            "example_str": ["foo", "bar", "baz"] * 4,
+            "example_int": ["1", "2", "three"] * 4,
+        }
+    )
+
+
+@pytest.fixture(params=["csv", "parquet"])
+def path(request, tmp_path: Path, dataframe: pd.DataFrame) -> Path:
+    """Fixture for the dataframe written to a file."""
+    path = tmp_path / f"example.{request.param}"
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+        dataframe.to_parquet(path, row_group_size=5)
+    else:
+        dataframe.to_csv(path, index=False)
+    return path
+
+
+def test_infer_file_format():
+    assert infer_file_format("data.csv.gz") == "csv"
+    assert infer_file_format("data.parquet") == "parquet"
+    with pytest.raises(ValueError):
+        infer_file_format("data.json")
+
+
+def test_read_chunks(path: Path, dataframe: pd.DataFrame):
+    chunks = list(read_chunks(path, chunksize=5))
+
+    assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+    assert list(pd.concat(chunks).index) == list(dataframe.index)
+
+
+def test_iter_valid_chunks(path: Path):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    chunks = list(validator.iter_valid_chunks(path, chunksize=5, errors="skip"))
+
+    assert [len(chunk) for chunk in chunks] == [4, 3, 1]
+    assert list(pd.concat(chunks).index) == [0, 1, 3, 4, 6, 7, 9, 10]
+
+
+def test_validate_file(path: Path, dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    df_valid = validator.validate_file(path, chunksize=5)
+
+    assert len(df_valid) == 8
+    assert list(df_valid["example_str"]) == list(dataframe["example_str"].iloc[df_valid.index])
+
+    with pytest.raises(ValidationError):
+        validator.validate_file(path, chunksize=5, errors="raise")
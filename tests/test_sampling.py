@@ -0,0 +1,112 @@
+"""Tests the validation of a random sample of a DataFrame."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel
+
+import pandantic.plugins.pandas  # noqa: F401 # pylint: disable=unused-import
+from pandantic import Pandantic, Sample, SampleReport
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame of 10k rows, of which the 2k rows of group "b" have a missing str."""
+    example_str = np.array(["foo"] * 10_000, dtype=object)
+    example_str[8_000:] = None
+    return pd.DataFrame(
+        data={
+            "example_str": example_str,
+            "example_int": np.arange(10_000),
+            "group": ["a"] * 8_000 + ["b"] * 2_000,
+        },
+        index=np.arange(10_000) * 2,
+    )
+
+
+def test_sample_fraction(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(dataframe, errors="skip", sample=Sample(frac=0.1, random_state=0))
+
+    assert isinstance(report, SampleReport)
+    assert report.rows == 10_000
+    assert report.sampled_rows == 1_000
+    assert report.invalid_count == len(report.invalid_rows)
+    assert report.interval[0] <= 0.2 <= report.interval[1]
+    assert report.interval[0] <= report.invalid_rate <= report.interval[1]
+    assert report.invalid_rows["example_str"].isna().all()
+    assert report.invalid_rows.index.isin(dataframe.index[8_000:]).all()
+
+
+def test_sample_number(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(dataframe, errors="skip", sample=100)
+
+    assert report.sampled_rows == 100
+    assert report.interval[1] - report.interval[0] < 0.5
+
+
+def test_sample_stratified(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(
+        dataframe, errors="skip", sample=Sample(n=50, by="group", random_state=0)
+    )
+
+    # all rows of group "b" are invalid, so proportional strata estimate the rate exactly
+    assert report.sampled_rows == 50
+    assert report.invalid_count == 10
+    assert report.invalid_rate == pytest.approx(0.2)
+
+
+def test_sample_all_rows(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(dataframe, errors="skip", sample=1.0)
+
+    assert report.sampled_rows == 10_000
+    assert report.invalid_rate == pytest.approx(0.2)
+    assert report.interval == pytest.approx((0.2, 0.2))
+
+
+@pytest.mark.parametrize("errors", ["raise", "skip", "log"])
+def test_sample_collects_errors(dataframe: pd.DataFrame, errors: str):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(dataframe, errors=errors, sample=Sample(frac=0.5, random_state=0))
+
+    assert report.sampled_rows == 5_000
+    assert report.invalid_count == len(report.invalid_rows) > 0
+
+
+def test_sample_default_errors(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    report = validator.validate(dataframe, sample=100)
+
+    assert isinstance(report, SampleReport)
+
+
+@pytest.mark.parametrize("sample", [0.0, 1.5, 0, True, "10%"])
+def test_sample_invalid(dataframe: pd.DataFrame, sample):
+    validator = Pandantic(schema=DataFrameSchema)
+
+    with pytest.raises((ValueError, TypeError)):
+        validator.validate(dataframe, errors="skip", sample=sample)
+
+
+def test_sample_accessor(dataframe: pd.DataFrame):
+    report = dataframe.pandantic.validate(DataFrameSchema, sample=Sample(n=500, random_state=0))
+
+    assert isinstance(report, SampleReport)
+    assert report.sampled_rows == 500
+    assert 0.1 < report.invalid_rate < 0.3
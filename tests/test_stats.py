@@ -0,0 +1,86 @@
+"""Tests the ValidationStats filled in by validation runs."""
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, field_validator
+
+from pandantic import Pandantic, ValidationStats
+
+
+class DataFrameSchema(BaseModel):
+    """Example schema for testing."""
+
+    example_str: str
+    example_int: int
+
+    @field_validator("example_int")
+    def validate_even_integer(cls, x: int) -> int:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if int is even."""
+        if x % 2 != 0:
+            raise ValueError(f"example_int must be even, is {x}.")
+        return x
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """A DataFrame with one odd int and one missing str."""
+    return pd.DataFrame(
+        data={
+            "example_str": ["foo", "bar", None, "baz"] * 25,
+            "example_int": [2, 3, 4, 6] * 25,
+        }
+    )
+
+
+def test_validate_stats(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+    stats = ValidationStats()
+
+    df_valid = validator.validate(dataframe, errors="skip", stats=stats)
+
+    assert len(df_valid) == 50
+    assert stats.rows == 100
+    assert stats.invalid_rows == 50
+    assert stats.errors == {("example_int", "value_error"): 25, ("example_str", "string_type"): 25}
+    assert {"plan", "conversion", "validation", "filtering"} <= set(stats.phases)
+    assert stats.worker_utilization is None
+
+
+def test_validate_stats_accumulate(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+    stats = ValidationStats()
+
+    validator.validate(dataframe, errors="skip", stats=stats)
+    validator.validate(dataframe, errors="skip", dedupe=True, stats=stats)
+
+    assert stats.rows == 200
+    assert stats.invalid_rows == 100
+    assert "dedupe" in stats.phases
+
+
+def test_validate_stats_parallel(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+    stats = ValidationStats()
+
+    validator.validate(dataframe, errors="skip", n_jobs=2, chunk_size=10, stats=stats)
+
+    assert stats.rows == 100
+    assert stats.invalid_rows == 50
+    assert stats.n_jobs == 2
+    assert sum(stats.errors.values()) == 50
+    assert 0 < len(stats.worker_busy) <= 2
+    assert "transfer" in stats.phases
+    assert 0 < stats.worker_utilization <= 1
+
+
+def test_iterate_stats(dataframe: pd.DataFrame):
+    validator = Pandantic(schema=DataFrameSchema)
+    stats = ValidationStats()
+
+    models = list(validator.iterate(dataframe, verbose=False, stats=stats))
+
+    assert len(models) == 50
+    assert stats.rows == 100
+    assert stats.invalid_rows == 50
+    assert stats.errors[("example_int", "value_error")] == 25
+    assert {"conversion", "validation"} <= set(stats.phases)
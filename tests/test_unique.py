@@ -0,0 +1,157 @@
+"""Tests the per-field validation of the distinct values of the columns."""
+
+from typing import Annotated, ClassVar
+
+import pandas as pd
+import pytest
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from pydantic.types import StrictInt
+
+from pandantic.validators.pandas import PandasValidator
+from pandantic.validators.unique import compile_unique_value_plan
+
+
+class CountingSchema(BaseModel):
+    """Example schema counting the calls of its (only) field validator."""
+
+    calls: ClassVar[list[str]] = []
+
+    example_str: str
+    example_int: int = 0
+
+    @field_validator("example_str")
+    def validate_country(cls, x: str) -> str:  # pylint: disable=invalid-name, no-self-argument
+        """Example custom validator to validate if str is a country."""
+        cls.calls.append(x)
+        if x not in ("USA", "UK"):
+            raise ValueError(f"example_str must be a country, is {x}.")
+        return x
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    """Fixture resetting the calls of the field validator."""
+    CountingSchema.calls.clear()
+
+
+@pytest.mark.parametrize("dtype", ["category", object, "string"])
+def test_validates_distinct_values_once(dtype):
+    # GIVEN
+    dataframe = pd.DataFrame(
+        data={"example_str": ["USA", "UK", "NL"] * 100, "example_int": range(300)}
+    ).astype({"example_str": dtype})
+
+    # WHEN
+    result = PandasValidator(schema=CountingSchema).validate(dataframe, errors="skip")
+
+    # THEN
+    assert result.equals(dataframe[dataframe["example_str"] != "NL"])
+    # each distinct value once, plus the invalid rows once more to find the error
+    assert sorted(CountingSchema.calls) == sorted(["USA", "UK"] + ["NL"] * 101)
+
+
+def test_certify():
+    plan = compile_unique_value_plan(CountingSchema)
+    dataframe = pd.DataFrame(
+        data={
+            "example_str": pd.Categorical(["USA", "NL", None, "UK"] * 10),
+            "example_int": range(40),
+        }
+    )
+
+    assert plan is not None
+    assert plan.certify(dataframe).tolist() == [True, False, False, True] * 10
+    # the optional column may be missing, the required column may not
+    assert plan.certify(dataframe[["example_str"]]).tolist() == [True, False, False, True] * 10
+    assert not plan.certify(dataframe[["example_int"]]).any()
+    # duplicated column labels are left to pydantic
+    assert not plan.certify(dataframe[["example_str", "example_str"]]).any()
+
+
+def test_mixed_objects_are_not_certified():
+    class StrictSchema(BaseModel):
+        """Example schema with a strict field."""
+
+        example_int: StrictInt
+
+    plan = compile_unique_value_plan(StrictSchema)
+    dataframe = pd.DataFrame(data={"example_int": pd.Series([1, True] * 2, dtype=object)})
+
+    assert plan is not None
+    assert not plan.certify(dataframe).any()
+    assert (
+        PandasValidator(schema=StrictSchema)
+        .validate(dataframe, errors="skip")
+        .equals(dataframe.iloc[::2])
+    )
+
+
+def test_compile_dependent_fields():
+    class ModelValidatorSchema(BaseModel):
+        """Example schema with a model validator."""
+
+        a: int
+
+        @model_validator(mode="after")
+        def validate_a(self) -> "ModelValidatorSchema":
+            """Example model validator."""
+            return self
+
+    class InfoSchema(BaseModel):
+        """Example schema with a field validator looking at the other fields."""
+
+        a: int
+        b: int
+
+        @field_validator("b")
+        def validate_b(
+            cls, x: int, info: ValidationInfo
+        ) -> int:  # pylint: disable=no-self-argument
+            """Example custom validator comparing b to a."""
+            if x < info.data["a"]:
+                raise ValueError("b must be greater than a")
+            return x
+
+    assert compile_unique_value_plan(ModelValidatorSchema) is None
+    assert compile_unique_value_plan(InfoSchema) is None
+
+
+def check_against_a(x: int, info: ValidationInfo) -> int:
+    """Example annotated validator comparing a field to the field a."""
+    if x < info.data.get("a", 0):
+        raise ValueError("b must be greater than a")
+    return x
+
+
+class AnnotatedInfoSchema(BaseModel):
+    """Example schema with an annotated validator looking at the other fields."""
+
+    a: int
+    b: Annotated[int, AfterValidator(check_against_a)]
+
+
+class NestedInfoSchema(BaseModel):
+    """Example schema with an annotated validator nested in the annotation."""
+
+    a: int
+    b: list[Annotated[int, AfterValidator(check_against_a)]]
+
+
+@pytest.mark.parametrize("schema", [AnnotatedInfoSchema, NestedInfoSchema])
+def test_compile_annotated_dependent_fields(schema):
+    assert compile_unique_value_plan(schema) is None
+
+
+def test_validate_annotated_dependent_fields():
+    # object columns, so that no field is pre-validated by the dtype of its column
+    dataframe = pd.DataFrame(data={"a": [5, 0] * 100, "b": [1, 2] * 100}, dtype=object)
+
+    result = PandasValidator(schema=AnnotatedInfoSchema).validate(dataframe, errors="skip")
+
+    assert result.equals(dataframe.iloc[1::2])
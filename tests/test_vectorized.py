@@ -0,0 +1,161 @@
+"""Tests the vectorized column-wise fast path of the PandasValidator."""
+
+from typing import Annotated, Literal
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.types import StrictInt
+
+from pandantic.validators.pandas import PandasValidator
+from pandantic.validators.vectorized import compile_columnar_plan
+
+
+class ScalarSchema(BaseModel):
+    """Example schema made of plain, constrained scalars."""
+
+    model_config = ConfigDict(regex_engine="python-re")
+
+    example_int: int = Field(ge=0, lt=100)
+    example_float: float
+    example_str: Annotated[str, Field(max_length=3, pattern="^b")]
+    example_bool: bool
+    example_literal: Literal["x", "y"]
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    """Fixture for a dataframe with a single valid (first) row."""
+    return pd.DataFrame(
+        data={
+            "example_int": [1, 100, 2, 3, 4, 5],
+            "example_float": [1.0, 2.0, "foo", 3.0, 4.0, 5.0],
+            "example_str": ["bar", "baz", "bar", "foo", "bar", "bar"],
+            "example_bool": [True, False, True, True, "maybe", False],
+            "example_literal": ["x", "y", "x", "y", "x", "z"],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+def test_compile_scalar_schema():
+    plan = compile_columnar_plan(ScalarSchema)
+
+    assert plan is not None
+    assert [check.column for check in plan.checks] == list(ScalarSchema.model_fields)
+
+
+@pytest.mark.parametrize("annotation", [StrictInt, list[int], Annotated[int, Field(multiple_of=2)]])
+def test_compile_unsupported_field(annotation):
+    class Model(BaseModel):
+        a: annotation  # type: ignore[valid-type]
+
+    assert compile_columnar_plan(Model) is None
+
+
+def test_compile_custom_validator():
+    class Model(BaseModel):
+        a: int
+
+        @field_validator("a")
+        def validate_even_integer(cls, x: int) -> int:  # pylint: disable=no-self-argument
+            if x % 2 != 0:
+                raise ValueError(f"a must be even, is {x}.")
+            return x
+
+    assert compile_columnar_plan(Model) is None
+
+
+def test_certify_only_valid_rows(dataframe: pd.DataFrame):
+    plan = compile_columnar_plan(ScalarSchema)
+
+    # mixed (object) columns are always left to pydantic
+    assert not plan.certify(dataframe).any()
+
+    typed_dataframe = pd.DataFrame(
+        data={
+            "example_int": [1, 100, 2, 3],
+            "example_float": [1.0, 2.0, np.nan, 3.0],
+            "example_str": ["bar", "bar", "bar", "foo"],
+            "example_bool": [True, False, True, True],
+            "example_literal": ["x", "y", "x", "z"],
+        }
+    )
+    assert plan.certify(typed_dataframe).tolist() == [True, False, True, False]
+
+
+def test_certify_numeric_columns():
+    plan = compile_columnar_plan(ScalarSchema)
+    dataframe = pd.DataFrame(
+        data={
+            "example_int": [1.0, 2.5, np.nan, 99.0],
+            "example_float": [1, 2, 3, 4],
+            "example_str": ["b", "b", "b", "b"],
+            "example_bool": [0, 1, 1, 2],
+            "example_literal": ["x", "x", "x", "x"],
+        }
+    )
+
+    assert plan.certify(dataframe).tolist() == [True, False, False, False]
+
+
+def test_validate_matches_row_wise(dataframe: pd.DataFrame):
+    validator = PandasValidator(schema=ScalarSchema)
+
+    result = validator.validate(dataframe, errors="skip")
+
+    assert result.equals(dataframe.loc[[10]])
+
+
+def test_validate_certified_and_fallback_rows():
+    validator = PandasValidator(schema=ScalarSchema)
+    dataframe = pd.DataFrame(
+        data={
+            "example_int": [1.0, 100.0, 2.0, 3.5],
+            "example_float": [1.0, 2.0, np.nan, 3.0],
+            "example_str": ["bar", "bar", "bar", "bar"],
+            "example_bool": [True, False, True, True],
+            "example_literal": ["x", "y", "x", "y"],
+        }
+    )
+
+    result = validator.validate(dataframe, errors="skip")
+
+    assert result.equals(dataframe.iloc[[0, 2]])
+
+
+def test_compile_pattern_rust_regex():
+    class Model(BaseModel):
+        a: str = Field(pattern=r"^\W+$")
+
+    dataframe = pd.DataFrame(data={"a": ["\u0301", "!"]})
+
+    # `re` and the rust regex engine of pydantic disagree on "\u0301" being a word character
+    assert compile_columnar_plan(Model) is None
+    assert PandasValidator(schema=Model).validate(dataframe, errors="skip").equals(dataframe[1:])
+
+
+def test_certify_pattern_python_re():
+    class Model(BaseModel):
+        model_config = ConfigDict(regex_engine="python-re")
+
+        a: str = Field(pattern=r"^[a-z]+$")
+
+    plan = compile_columnar_plan(Model)
+    dataframe = pd.DataFrame(data={"a": ["abc", "abc\n", "ABC"]})
+
+    assert plan is not None
+    # like pydantic's python engine, `re` matches `$` before a trailing newline
+    assert plan.certify(dataframe).tolist() == [True, True, False]
+    assert PandasValidator(schema=Model).validate(dataframe, errors="skip").equals(dataframe[:2])
+
+
+def test_certify_duplicated_columns():
+    plan = compile_columnar_plan(ScalarSchema)
+    dataframe = pd.DataFrame(
+        [[1, 1.0, "bar", True, "x", 2]],
+        columns=[*ScalarSchema.model_fields, "example_int"],
+    )
+
+    assert plan.certify(dataframe).tolist() == [False]